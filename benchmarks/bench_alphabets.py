@@ -0,0 +1,45 @@
+import random
+import sys
+import time
+
+from utils.alphabets import BASE32, BASE58, BECH32, CRYPT64, HEX
+
+
+def make_candidates(chars: str, length: int, count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [''.join(rng.choice(chars) for _ in range(length)) for _ in range(count)]
+
+
+def per_candidate(fn, candidates: list, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for candidate in candidates:
+            fn(candidate)
+        best = min(best, time.perf_counter() - start)
+    return best / len(candidates)
+
+
+def main(argv: list) -> None:
+    count = int(argv[1]) if len(argv) > 1 else 20000
+    cases = (
+        ('hex', HEX, 64),
+        ('base58', BASE58, 34),
+        ('bech32', BECH32, 59),
+        ('base32', BASE32, 55),
+        ('crypt64', CRYPT64, 53),
+    )
+    print(f"{count} candidates per alphabet, ns per candidate")
+    for name, alphabet, length in cases:
+        candidates = make_candidates(alphabet.chars, length, count)
+        chars = alphabet.chars
+        members = frozenset(chars)
+        generator = per_candidate(lambda s: all(c in chars for c in s), candidates)
+        superset = per_candidate(members.issuperset, candidates)
+        table = per_candidate(alphabet.matches, candidates)
+        print(f"  {name:8s} {length:3d} chars: all() {generator * 1e9:7.0f}   "
+              f"frozenset {superset * 1e9:6.0f}   translate {table * 1e9:6.0f}   "
+              f"speedup {generator / table:5.1f}x")
+
+if __name__ == '__main__':
+    main(sys.argv)
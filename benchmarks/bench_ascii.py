@@ -0,0 +1,38 @@
+import sys
+import time
+
+import r2n
+from benchmarks.bench_numeric import make_mixed_log
+from benchmarks.bench_prefilter import make_prose
+
+
+def best_of(fn, data, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list) -> None:
+    lines = int(argv[1]) if len(argv) > 1 else 20000
+    engine = r2n.get_engine()
+    text = make_mixed_log(lines) + '\n' + make_prose(lines // 20)
+    # One non-ASCII character sends the whole text down the Unicode path.
+    unicode_text = text + ' é'
+    data = text.encode()
+
+    unicode_run = best_of(engine.extract_all, unicode_text)
+    ascii_run = best_of(engine.extract_all, text)
+    decoded_run = best_of(lambda d: engine.extract_all(d.decode('utf-8')), data)
+    bytes_run = best_of(engine.extract_all, data)
+    print(f"log + prose: {len(text)} bytes")
+    print(f"  Unicode patterns:        {unicode_run * 1e3:8.1f} ms")
+    print(f"  ASCII patterns:          {ascii_run * 1e3:8.1f} ms")
+    print(f"  speedup:                 {unicode_run / ascii_run:8.2f}x")
+    print(f"  bytes, caller decodes:   {decoded_run * 1e3:8.1f} ms")
+    print(f"  bytes, passed directly:  {bytes_run * 1e3:8.1f} ms")
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,82 @@
+import random
+import re
+import sys
+import time
+
+import r2n
+from utils.alphabets import BECH32
+from utils.cryptos.encoding import BECH32_CONST, BECH32M_CONST, GENERATOR, Bech32AddressValidator, Bech32Validator
+
+CASES = (
+    ('bc', 'bc1', 39, True, r'\bbc1[a-z0-9]{20,40}\b'),
+    ('ltc', 'ltc1', 39, True, r'\bltc1[a-z0-9]{20,40}\b'),
+    ('addr', 'addr1', 98, False, r'\baddr1[a-z0-9]{98}\b'),
+)
+
+
+def bitwise_polymod(values) -> int:
+    # The reference loop from BIP 173, one generator test per bit.
+    state = 1
+    for value in values:
+        top = state >> 25
+        state = (state & 0x1ffffff) << 5 ^ value
+        for i in range(5):
+            state ^= GENERATOR[i] if (top >> i) & 1 else 0
+    return state
+
+
+def expand(hrp: str) -> list:
+    return [ord(c) >> 5 for c in hrp] + [0] + [ord(c) & 31 for c in hrp]
+
+
+def make_address(rng, hrp: str, length: int, segwit: bool) -> str:
+    data = [rng.randrange(32) for _ in range(length - 6)]
+    if segwit:
+        data[0] = rng.choice((0, 1))
+    constant = BECH32M_CONST if segwit and data[0] else BECH32_CONST
+    state = bitwise_polymod(expand(hrp) + data + [0] * 6) ^ constant
+    checksum = [(state >> 5 * (5 - i)) & 31 for i in range(6)]
+    return hrp + '1' + ''.join(BECH32.chars[v] for v in data + checksum)
+
+
+def per_address(fn, addresses: list, repeat: int = 5, cold: bool = False) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        if cold:
+            Bech32Validator.checksum_constant.cache_clear()
+        start = time.perf_counter()
+        for address in addresses:
+            fn(address)
+        best = min(best, time.perf_counter() - start)
+    return best / len(addresses)
+
+
+def per_match(fn, text: str, count: int, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best / count
+
+
+def main(argv: list) -> None:
+    count = int(argv[1]) if len(argv) > 1 else 20000
+    rng = random.Random(0)
+    dispatcher = r2n.Engine().crypto.dispatcher
+    print(f"{count} addresses per prefix, ns per address")
+    for hrp, prefix, length, segwit, pattern in CASES:
+        addresses = [make_address(rng, hrp, length, segwit) for _ in range(count)]
+        text = ' '.join(addresses)
+        regex = per_match(re.compile(pattern).findall, text, count)
+        extract = per_match(dispatcher.extract_addresses, text, count)
+        checksum = Bech32AddressValidator('checksum', hrp, segwit, max_data_length=98)
+        assert all(checksum.is_valid(a) for a in addresses)
+        bitwise = per_address(lambda a: bitwise_polymod(expand(hrp) + [BECH32.chars.find(c) for c in a[len(prefix):]]), addresses)
+        cold = per_address(checksum.is_valid, addresses, cold=True)
+        warm = per_address(checksum.is_valid, addresses)
+        print(f"  {prefix:6s} {length + len(prefix):3d} chars: regex {regex * 1e9:6.0f}   extract {extract * 1e9:6.0f}   "
+              f"checksum cold {cold * 1e9:6.0f}   warm {warm * 1e9:5.0f}   bitwise {bitwise * 1e9:6.0f}")
+
+if __name__ == '__main__':
+    main(sys.argv)
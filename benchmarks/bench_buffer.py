@@ -0,0 +1,46 @@
+import mmap
+import sys
+import tempfile
+import time
+
+import r2n
+from benchmarks.bench_hashes import make_feed
+from benchmarks.bench_numeric import make_mixed_log
+from benchmarks.bench_prefilter import make_prose
+
+
+def make_buffer(size: int) -> bytes:
+    # A few MB of logs, hash feed lines and prose, repeated up to size.
+    base = '\n'.join((make_mixed_log(20000), make_feed(2000), make_prose(200))).encode() + b'\n'
+    return (base * (size // len(base) + 1))[:size]
+
+
+def timed(fn, data):
+    start = time.perf_counter()
+    result = fn(data)
+    return time.perf_counter() - start, result
+
+
+def main(argv: list) -> None:
+    size = int(argv[1]) if len(argv) > 1 else 100
+    types = r2n.BUFFER_FAMILIES
+    engine = r2n.get_engine()
+    data = make_buffer(size << 20)
+
+    with tempfile.TemporaryFile() as f:
+        f.write(data)
+        f.flush()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            scan, records = timed(lambda b: engine.scan_buffer(b, types), buffer)
+        extract, _ = timed(lambda d: engine.extract(d, types), data)
+        everything, _ = timed(engine.extract_all, data)
+
+    print(f"buffer: {size} MB")
+    print(f"  extract_all, every family:       {everything:8.2f} s")
+    print(f"  extract, {', '.join(types)}: {extract:8.2f} s")
+    print(f"  scan_buffer on an mmap:          {scan:8.2f} s ({size / scan:6.1f} MB/s)")
+    print(f"  speedup over extract:            {extract / scan:8.2f}x")
+    print(f"  {len(records)} records")
+
+if __name__ == '__main__':
+    main(sys.argv)
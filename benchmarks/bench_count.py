@@ -0,0 +1,42 @@
+import gc
+import sys
+import time
+import tracemalloc
+
+import r2n
+from benchmarks.bench_numeric import make_mixed_log
+
+
+def measure(fn, repeat: int = 3) -> tuple:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def main(argv: list) -> None:
+    lines = int(argv[1]) if len(argv) > 1 else 20000
+    engine = r2n.get_engine()
+    log = make_mixed_log(lines)
+    log_lines = log.splitlines(keepends=True)
+    engine.extract_all(log)
+
+    print(f"mixed log: {lines} lines, {len(log)} bytes")
+    _, extract_run, extract_peak = measure(lambda: engine.extract_all(log))
+    counts, count_run, count_peak = measure(lambda: engine.count(log))
+    _, stream_run, stream_peak = measure(lambda: engine.count_stream(iter(log_lines), block_size=1 << 16))
+    print(f"  extract_all:           {extract_run * 1e3:8.1f} ms, peak {extract_peak / 1024:8.0f} KiB")
+    print(f"  count:                 {count_run * 1e3:8.1f} ms, peak {count_peak / 1024:8.0f} KiB")
+    print(f"  count_stream (64 KiB): {stream_run * 1e3:8.1f} ms, peak {stream_peak / 1024:8.0f} KiB")
+    for key, found in counts.items():
+        print(f"    {key}: {found['total']} ({found['distinct']} distinct)")
+
+if __name__ == '__main__':
+    main(sys.argv)
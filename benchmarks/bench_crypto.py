@@ -0,0 +1,50 @@
+import random
+import sys
+import time
+
+import r2n
+
+BASE58 = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+
+
+def make_text(tokens: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    words = []
+    for _ in range(tokens):
+        roll = rng.random()
+        if roll < 0.3:
+            words.append(rng.choice('13DLMNAS') + ''.join(rng.choice(BASE58) for _ in range(33)))
+        elif roll < 0.4:
+            words.append('0x' + ''.join(rng.choice('0123456789abcdef') for _ in range(40)))
+        else:
+            words.append(rng.choice(('transfer', 'from', 'to', 'wallet', 'amount', 'fee', 'block')))
+    return ' '.join(words)
+
+
+def best_of(fn, text: str, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list) -> None:
+    tokens = int(argv[1]) if len(argv) > 1 else 20000
+    text = make_text(tokens)
+    engine = r2n.get_engine().crypto
+
+    def per_coin(t):
+        return {coin: extractor.extract_addresses(t) for coin, extractor in engine.extractors.items()}
+
+    before = best_of(per_coin, text)
+    after = best_of(engine.dispatcher.extract_addresses, text)
+    print(f"text: {tokens} tokens, {len(text)} bytes, {len(engine.extractors)} coin extractors")
+    print(f"per-coin scans:       {before * 1e3:8.1f} ms")
+    print(f"candidate dispatcher: {after * 1e3:8.1f} ms")
+    print(f"speedup:              {before / after:8.2f}x")
+
+
+if __name__ == '__main__':
+    main(sys.argv)
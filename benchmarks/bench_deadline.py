@@ -0,0 +1,45 @@
+import sys
+import time
+
+import r2n
+from benchmarks.bench_numeric import make_mixed_log
+from benchmarks.bench_prefilter import make_prose
+
+
+def make_documents(count: int) -> list:
+    documents = [make_prose(3, seed) for seed in range(count)]
+    # A few heavy documents among the light ones, as in a real queue.
+    documents[count // 4] = ('+1 ' * 60 + '\n') * 2000
+    documents[count // 2] = ('a.' * 100 + '\n') * 500
+    documents[3 * count // 4] = make_mixed_log(20000)
+    return documents
+
+
+def latencies(engine, documents: list, budget: float = None) -> tuple:
+    times = []
+    truncated = 0
+    for document in documents:
+        start = time.monotonic()
+        result = engine.extract_all(document, deadline=start + budget if budget is not None else None)
+        times.append(time.monotonic() - start)
+        truncated += result.truncated
+    return sorted(times), truncated
+
+
+def main(argv: list) -> None:
+    count = int(argv[1]) if len(argv) > 1 else 200
+    budget_ms = float(argv[2]) if len(argv) > 2 else 50.0
+    engine = r2n.get_engine()
+    documents = make_documents(count)
+    engine.extract_all(documents[0])
+
+    print(f"{count} documents, {sum(map(len, documents))} bytes")
+    for label, budget in (("no deadline", None), (f"deadline {budget_ms:g} ms", budget_ms / 1000)):
+        times, truncated = latencies(engine, documents, budget)
+        p50 = times[len(times) // 2]
+        p99 = times[min(len(times) - 1, len(times) * 99 // 100)]
+        print(f"  {label:18s} p50 {p50 * 1e3:7.2f} ms  p99 {p99 * 1e3:8.1f} ms  "
+              f"max {times[-1] * 1e3:8.1f} ms  total {sum(times):6.2f} s  truncated {truncated}")
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,43 @@
+import sys
+import time
+
+import r2n
+from benchmarks.bench_numeric import make_mixed_log
+from benchmarks.bench_prefilter import make_prose
+
+GATE = ('ssn', 'card', 'phone')
+
+
+def best_of(fn, text: str, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list) -> None:
+    paragraphs = int(argv[1]) if len(argv) > 1 else 2000
+    engine = r2n.get_engine()
+    prose = make_prose(paragraphs)
+    log = make_mixed_log(paragraphs * 10)
+    documents = {
+        'clean message': make_prose(20),
+        'clean prose': prose,
+        'SSN in first line': 'ssn 123-45-6789\n' + log,
+        'SSN in last line': prose + '\nssn 123-45-6789',
+    }
+    engine.extract(prose, GATE)
+    print(f"types: {', '.join(GATE)}")
+    for name, text in documents.items():
+        extract_run = best_of(lambda t: engine.extract(t, GATE), text)
+        detect_run = best_of(lambda t: engine.detect(t, GATE), text)
+        first_run = best_of(lambda t: engine.detect_first(t, GATE), text)
+        print(f"{name} ({len(text)} bytes): {engine.detect(text, GATE)}")
+        print(f"  extract:      {extract_run * 1e3:8.3f} ms")
+        print(f"  detect:       {detect_run * 1e3:8.3f} ms")
+        print(f"  detect_first: {first_run * 1e3:8.3f} ms")
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,42 @@
+import random
+import string
+import sys
+import time
+
+import r2n
+
+
+def make_inputs(count: int, size: int = 100, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + '     .,:-@'
+    return [''.join(rng.choice(alphabet) for _ in range(size)) for _ in range(count)]
+
+
+def per_call_us(fn, inputs: list, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in inputs:
+            fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best / len(inputs) * 1e6
+
+
+def main(argv: list) -> None:
+    count = int(argv[1]) if len(argv) > 1 else 500
+    inputs = make_inputs(count)
+
+    engine = r2n.get_engine()
+    before = per_call_us(lambda text: r2n.Engine().extract_all(text), inputs)
+    after = per_call_us(engine.extract_all, inputs)
+    construct = per_call_us(lambda text: r2n.Engine(), inputs)
+
+    print(f"inputs: {count} x 100 bytes")
+    print(f"engine construction:         {construct:10.1f} us/call")
+    print(f"extract_all, engine per call: {before:10.1f} us/call")
+    print(f"extract_all, shared engine:   {after:10.1f} us/call")
+    print(f"speedup:                      {before / after:10.2f}x")
+
+
+if __name__ == '__main__':
+    main(sys.argv)
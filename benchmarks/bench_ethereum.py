@@ -0,0 +1,66 @@
+import random
+import sys
+import time
+
+from utils.cryptos import ethereum_ecosystem
+from utils.cryptos.ethereum_ecosystem import EthereumEcosystemExtractor, checksum_address
+
+
+def make_text(tokens: int, distinct: int = 500, seed: int = 0) -> str:
+    # A transfer log: a pool of addresses seen over and over, half of them
+    # written with their EIP-55 checksum.
+    rng = random.Random(seed)
+    pool = []
+    for i in range(distinct):
+        digits = ''.join(rng.choice('0123456789abcdef') for _ in range(40))
+        pool.append('0x' + (checksum_address.__wrapped__(digits) if i % 2 else digits))
+    words = []
+    for _ in range(tokens):
+        if rng.random() < 0.3:
+            words.append(rng.choice(pool))
+        else:
+            words.append(rng.choice(('transfer', 'from', 'to', 'value', 'gas', 'nonce', 'block')))
+    return ' '.join(words)
+
+
+def nine_passes(extractor, text: str) -> dict:
+    # The old layout: one scan per chain, hashing every mixed-case match.
+    results = {}
+    for chain, _ in extractor.chains:
+        found = []
+        for match in extractor.extractor.pattern.findall(text):
+            digits = match[2:]
+            if digits == digits.lower() or digits == digits.upper() \
+                    or checksum_address.__wrapped__(digits.lower()) == digits:
+                found.append(match)
+        if found:
+            results[chain] = found
+    return results
+
+
+def best_of(fn, text: str, repeat: int = 3, cold: bool = False) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        if cold:
+            checksum_address.cache_clear()
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list) -> None:
+    tokens = int(argv[1]) if len(argv) > 1 else 20000
+    extractor = EthereumEcosystemExtractor()
+    text = make_text(tokens)
+
+    before = best_of(lambda t: nine_passes(extractor, t), text)
+    cold = best_of(extractor.extract_all_addresses, text, cold=True)
+    warm = best_of(extractor.extract_all_addresses, text)
+    print(f"text: {tokens} tokens, {len(text)} bytes, {len(ethereum_ecosystem.EVM_CHAINS)} EVM chains")
+    print(f"  nine passes, no memo: {before * 1e3:8.1f} ms")
+    print(f"  one pass, cold memo:  {cold * 1e3:8.1f} ms ({before / cold:6.1f}x)")
+    print(f"  one pass, warm memo:  {warm * 1e3:8.1f} ms ({before / warm:6.1f}x)")
+
+if __name__ == '__main__':
+    main(sys.argv)
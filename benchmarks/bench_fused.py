@@ -0,0 +1,71 @@
+import random
+import sys
+import time
+
+import r2n
+
+WORDS = (
+    'the quick brown fox jumps over the lazy dog while the service logs request handled '
+    'in ms for user with status ok and retries none'
+).split()
+
+ENTITIES = [
+    'alice@example.com',
+    '1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa',
+    '0x52908400098527886E0F7030069857D2E4169EE7',
+    'd41d8cd98f00b204e9800998ecf8427e',
+    'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855',
+    '192.168.10.24',
+    '10.0.0.0/8',
+    '2001:db8::1',
+    'example.org',
+    '+1 415 555 0132',
+    '123-45-6789',
+    '00:1A:2B:3C:4D:5E',
+    '4012 8888 8888 1881',
+]
+
+
+def make_document(size: int, density: float = 0.02, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    parts = []
+    length = 0
+    while length < size:
+        word = rng.choice(ENTITIES) if rng.random() < density else rng.choice(WORDS)
+        parts.append(word)
+        length += len(word) + 1
+    return ' '.join(parts)[:size]
+
+
+def best_of(fn, text: str, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def normalize(results: dict) -> dict:
+    return {key: sorted(values) for key, values in results.items()}
+
+
+def main(argv: list) -> None:
+    max_size = int(argv[1]) if len(argv) > 1 else 1 << 20
+    engine = r2n.get_engine()
+
+    print(f"{'size':>10} {'multi-pass MB/s':>16} {'fused MB/s':>12} {'speedup':>8}")
+    size = 1 << 10
+    while size <= max_size:
+        text = make_document(size)
+        if normalize(engine.extract_all(text)) != normalize(engine.extract_all(text, fused=True)):
+            raise SystemExit(f"fused output differs from extract_all at size {size}")
+        repeat = 5 if size <= (1 << 16) else 2
+        multi = best_of(engine.extract_all, text, repeat)
+        fused = best_of(lambda t: engine.extract_all(t, fused=True), text, repeat)
+        print(f"{size:>10} {size / multi / 1e6:>16.2f} {size / fused / 1e6:>12.2f} {multi / fused:>7.2f}x")
+        size <<= 2
+
+
+if __name__ == '__main__':
+    main(sys.argv)
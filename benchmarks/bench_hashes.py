@@ -0,0 +1,57 @@
+import random
+import sys
+import time
+
+import r2n
+from utils.hashes import hex_runs
+
+
+def make_feed(lines: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    out = []
+    for _ in range(lines):
+        length = rng.choice((32, 40, 56, 64, 96, 128))
+        digest = ''.join(rng.choice('0123456789abcdef') for _ in range(length))
+        out.append(f"ioc type=hash value={digest} source=feed")
+    return '\n'.join(out)
+
+
+def best_of(fn, text: str, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list) -> None:
+    lines = int(argv[1]) if len(argv) > 1 else 20000
+    text = make_feed(lines)
+    engine = r2n.get_engine().hashes
+
+    def per_extractor(t):
+        return {name: extractor.extract_hashes(t) for name, extractor in engine.hex_extractors.items()}
+
+    before = best_of(per_extractor, text)
+    after = best_of(engine.hex_dispatcher.extract_hashes, text)
+    print(f"feed: {lines} lines, {len(text)} bytes")
+    print(f"per-extractor scans: {before * 1e3:8.1f} ms")
+    print(f"hex-run dispatcher:  {after * 1e3:8.1f} ms")
+    print(f"speedup:             {before / after:8.2f}x")
+
+    # Entropy of every distinct run, one batch per length; without NumPy both
+    # columns take the same Python path.
+    groups = {}
+    for value in dict.fromkeys(run.lower() for run in engine.hex_dispatcher.pattern.findall(text)):
+        groups.setdefault(len(value), []).append(value)
+    looped = best_of(lambda _: [[hex_runs.hex_entropy(value) for value in group] for group in groups.values()], text)
+    batched = best_of(lambda _: [hex_runs.hex_entropies(group) for group in groups.values()], text)
+    print(f"entropy, {'NumPy' if hex_runs.numpy is not None else 'no NumPy'}:")
+    print(f"  per candidate:     {looped * 1e3:8.1f} ms")
+    print(f"  batched:           {batched * 1e3:8.1f} ms")
+    print(f"  speedup:           {looped / batched:8.2f}x")
+
+
+if __name__ == '__main__':
+    main(sys.argv)
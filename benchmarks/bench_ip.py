@@ -0,0 +1,106 @@
+import ipaddress
+import random
+import re
+import sys
+import time
+
+import r2n
+
+# The per-form patterns the extractors used before the single scan, kept
+# here as the baseline being measured.
+OCTET = r'(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)'
+IPV4_PATTERN = re.compile(rf'\b{OCTET}\.{OCTET}\.{OCTET}\.{OCTET}\b')
+IPV4_CIDR_PATTERN = re.compile(rf'\b{OCTET}\.{OCTET}\.{OCTET}\.{OCTET}/(?:[1-9]|[1-2][0-9]|3[0-2])\b')
+IPV6_FORMS = (
+    r'(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}',
+    r'(?:[0-9a-fA-F]{1,4}:){1,7}:',
+    r'(?:[0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}',
+    r'::(?:[0-9a-fA-F]{1,4}:){0,6}[0-9a-fA-F]{1,4}',
+    r'[0-9a-fA-F]{1,4}::(?:[0-9a-fA-F]{1,4}:){0,5}[0-9a-fA-F]{1,4}',
+    r'[0-9a-fA-F]{1,4}:[0-9a-fA-F]{1,4}::(?:[0-9a-fA-F]{1,4}:){0,4}[0-9a-fA-F]{1,4}',
+    r'(?:[0-9a-fA-F]{1,4}:){0,2}[0-9a-fA-F]{1,4}::(?:[0-9a-fA-F]{1,4}:){0,3}[0-9a-fA-F]{1,4}',
+    r'(?:[0-9a-fA-F]{1,4}:){0,3}[0-9a-fA-F]{1,4}::(?:[0-9a-fA-F]{1,4}:){0,2}[0-9a-fA-F]{1,4}',
+    r'(?:[0-9a-fA-F]{1,4}:){0,4}[0-9a-fA-F]{1,4}::(?:[0-9a-fA-F]{1,4}:)?[0-9a-fA-F]{1,4}',
+    r'(?:[0-9a-fA-F]{1,4}:){0,5}[0-9a-fA-F]{1,4}::[0-9a-fA-F]{1,4}',
+    r'(?:[0-9a-fA-F]{1,4}:){0,6}[0-9a-fA-F]{1,4}::',
+)
+IPV6_PATTERN = re.compile('|'.join(rf'\b{form}\b' for form in IPV6_FORMS))
+IPV6_CIDR_PATTERN = re.compile(rf'\b(?:{"|".join(IPV6_FORMS)})/(?:[1-9]|[1-9][0-9]|1[0-1][0-9]|12[0-8])\b')
+
+# Texts whose extraction must not change with the scanner: an IPv4-mapped
+# IPv6 address is reported as its IPv4 part only, and a sentence-final
+# period does not stop an IPv6 address from being reported.
+CASES = (
+    ('addr ::ffff:192.168.1.1 end', {'ipv4': ['192.168.1.1'], 'ipv6': []}),
+    ('::ffff:10.0.0.1/104', {'ipv4': ['10.0.0.1'], 'ipv6': [], 'cidr6': []}),
+    ('gateway fe80::1.', {'ipv6': ['fe80::1']}),
+    ('route 2001:db8::/32 via 10.0.0.1', {'ipv4': ['10.0.0.1'], 'cidr6': ['2001:db8::/32']}),
+)
+
+
+def make_log(lines: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    out = []
+    for i in range(lines):
+        src = '.'.join(str(rng.randint(0, 255)) for _ in range(4))
+        dst = '.'.join(str(rng.randint(0, 255)) for _ in range(4))
+        v6 = ':'.join(format(rng.randint(0, 65535), 'x') for _ in range(rng.randint(2, 4)))
+        action = rng.choice(('ALLOW', 'DENY'))
+        out.append(
+            f"{i} {action} TCP {src}:{rng.randint(1, 65535)} -> {dst}:443 "
+            f"rule {src}/{rng.randint(8, 32)} v6 fe80::{v6}/64 bytes={rng.randint(40, 1500)}"
+        )
+    return '\n'.join(out)
+
+
+def valid(factory, candidate: str) -> bool:
+    try:
+        factory(candidate)
+        return True
+    except ValueError:
+        return False
+
+
+def check_cases() -> None:
+    for text, expected in CASES:
+        found = r2n.extract_all(text)
+        for key, values in expected.items():
+            assert found[key] == values, f"{text!r}: {key} is {found[key]}, expected {values}"
+
+
+def best_of(fn, text: str, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list) -> None:
+    check_cases()
+    lines = int(argv[1]) if len(argv) > 1 else 20000
+    text = make_log(lines)
+    extractor = r2n.get_engine().ip.extractor
+
+    def network(candidate):
+        return ipaddress.ip_network(candidate, strict=False)
+
+    def two_pass(t):
+        return (
+            [m for m in IPV4_PATTERN.findall(t) if valid(ipaddress.IPv4Address, m)],
+            [m for m in IPV4_CIDR_PATTERN.findall(t) if valid(network, m)],
+            [m for m in IPV6_PATTERN.findall(t) if valid(ipaddress.IPv6Address, m)],
+            [m for m in IPV6_CIDR_PATTERN.findall(t) if valid(network, m)],
+        )
+
+    before = best_of(two_pass, text)
+    after = best_of(extractor.scan, text)
+    print(f"log: {lines} lines, {len(text)} bytes")
+    print(f"two-pass patterns + ipaddress: {before * 1e3:8.1f} ms")
+    print(f"single scan + integer parse:   {after * 1e3:8.1f} ms")
+    print(f"speedup:                       {before / after:8.2f}x")
+
+
+if __name__ == '__main__':
+    main(sys.argv)
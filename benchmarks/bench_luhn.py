@@ -0,0 +1,42 @@
+import random
+import sys
+import time
+
+from utils import card
+from utils.card import CardExtractor, LuhnValidator
+
+
+def make_candidates(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    out = []
+    for _ in range(count):
+        digits = ''.join(rng.choice('0123456789') for _ in range(rng.choice((13, 15, 16, 16, 16, 19)) - 1))
+        # Half of the candidates get their Luhn check digit.
+        check = next(d for d in '0123456789' if LuhnValidator.is_valid_luhn(digits + d))
+        out.append(digits + (check if rng.random() < 0.5 else rng.choice('0123456789')))
+    return out
+
+
+def best_of(fn, data, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list) -> None:
+    count = int(argv[1]) if len(argv) > 1 else 200000
+    extractor = CardExtractor()
+    candidates = make_candidates(count)
+
+    looped = best_of(lambda cards: [extractor._validate_card(c) for c in cards], candidates)
+    batched = best_of(extractor.validate_cards, candidates)
+    print(f"{count} candidates, 13-19 digits, {'NumPy' if card.numpy is not None else 'no NumPy'}")
+    print(f"  per candidate:  {looped * 1e3:8.1f} ms ({count / looped / 1e6:6.2f} M candidates/s)")
+    print(f"  batched:        {batched * 1e3:8.1f} ms ({count / batched / 1e6:6.2f} M candidates/s)")
+    print(f"  speedup:        {looped / batched:8.2f}x")
+
+if __name__ == '__main__':
+    main(sys.argv)
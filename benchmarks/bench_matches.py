@@ -0,0 +1,59 @@
+import gc
+import sys
+import time
+import tracemalloc
+
+import r2n
+from benchmarks.bench_numeric import make_mixed_log
+from utils.email import EmailExtractor
+from utils.ip import IPv4Extractor
+from utils.ssn import SSNExtractor
+
+
+def allocated(fn, data) -> tuple:
+    tracemalloc.start()
+    result = fn(data)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def context_dicts(text: str) -> list:
+    results = []
+    for extractor, method in ((EmailExtractor(), 'extract_emails_with_context'),
+                              (IPv4Extractor(), 'extract_ips_with_context'),
+                              (SSNExtractor(), 'extract_ssns_with_context')):
+        results.extend(getattr(extractor, method)(text))
+    return results
+
+
+def main(argv: list) -> None:
+    lines = int(argv[1]) if len(argv) > 1 else 20000
+    engine = r2n.get_engine()
+    text = make_mixed_log(lines)
+    types = {'email', 'ip', 'ssn'}
+    engine.find(text, types)
+
+    dicts, dict_bytes = allocated(context_dicts, text)
+    records, record_bytes = allocated(lambda t: engine.find(t, types), text)
+    print(f"mixed log: {len(text)} bytes")
+    print(f"  with_context dicts: {len(dicts):7d} matches {dict_bytes / max(len(dicts), 1):7.0f} B/match")
+    print(f"  MatchRecords:       {len(records):7d} matches {record_bytes / max(len(records), 1):7.0f} B/match")
+
+    start = time.perf_counter()
+    engine.extract_all(text)
+    extract_run = time.perf_counter() - start
+    start = time.perf_counter()
+    records = engine.find(text)
+    find_run = time.perf_counter() - start
+    start = time.perf_counter()
+    for record in records:
+        record.context(30)
+    context_run = time.perf_counter() - start
+    print(f"  extract_all:        {extract_run * 1e3:8.1f} ms")
+    print(f"  find:               {find_run * 1e3:8.1f} ms ({len(records)} records)")
+    print(f"  context(30) on all: {context_run * 1e3:8.1f} ms")
+
+if __name__ == '__main__':
+    main(sys.argv)
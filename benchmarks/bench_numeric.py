@@ -0,0 +1,86 @@
+import random
+import re
+import sys
+import time
+
+import r2n
+from benchmarks.bench_ip import IPV4_CIDR_PATTERN, IPV4_PATTERN
+
+# The per-form card and SSN patterns the extractors used before the shared
+# digit chains, kept here as the baseline being measured.
+CARD_PATTERNS = (
+    re.compile(r'\b\d{13,19}\b'),
+    re.compile(r'\b\d{4}(?:-\d{4}){3}\b'),
+    re.compile(r'\b\d{4}(?: \d{4}){3}\b'),
+)
+SSN_PATTERN = re.compile(r'\b(\d{3})-(\d{2})-(\d{4})\b')
+
+
+def make_mixed_log(lines: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    out = []
+    for i in range(lines):
+        roll = rng.random()
+        if roll < 0.05:
+            out.append(f"txn {i} card {' '.join(str(rng.randint(1000, 9999)) for _ in range(4))} approved")
+        elif roll < 0.15:
+            out.append(f"GET /api/v1/orders/{rng.randint(1, 99999)} from {'.'.join(str(rng.randint(0, 255)) for _ in range(4))} status=200")
+        else:
+            out.append(f"user {rng.randint(1, 9999)} updated profile at 2024-05-{rng.randint(1, 28):02d} 12:{rng.randint(0, 59):02d} total {rng.randint(1, 999)}.{rng.randint(0, 99):02d}")
+    return '\n'.join(out)
+
+
+def make_dense_log(lines: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    out = []
+    for i in range(lines):
+        amount = f"{rng.randint(1, 99999)}.{rng.randint(0, 99):02d}"
+        ip = '.'.join(str(rng.randint(0, 255)) for _ in range(4))
+        card = ' '.join(str(rng.randint(1000, 9999)) for _ in range(4))
+        out.append(f"{i},2024-05-{rng.randint(1, 28):02d},{amount},{ip},{card},{rng.randint(100, 999)}-{rng.randint(10, 99)}-{rng.randint(1000, 9999)}")
+    return '\n'.join(out)
+
+
+def best_of(fn, text: str, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list) -> None:
+    lines = int(argv[1]) if len(argv) > 1 else 20000
+    engine = r2n.get_engine()
+    card = engine.card.extractor
+    ssn = engine.ssn.extractor
+    ipv4 = engine.ip.extractor.ipv4_extractor
+
+    def per_pattern(t):
+        cards = []
+        for pattern in CARD_PATTERNS:
+            for m in pattern.findall(t):
+                digits = re.sub(r'[^\d]', '', m)
+                if card._validate_card(digits):
+                    cards.append(digits)
+        ssns = [m for m in SSN_PATTERN.findall(t) if ssn._validate_ssn(*m)]
+        ips = [m for m in IPV4_PATTERN.findall(t) if ipv4._validate_ipv4(m)]
+        cidrs = [m for m in IPV4_CIDR_PATTERN.findall(t) if ipv4._validate_ipv4_cidr(m)]
+        return cards, ssns, ips, cidrs
+
+    def tokenized(t):
+        chains = engine.numeric.tokenize(t)
+        return card.extract_cards(t, chains), ssn.extract_ssns(t, chains), ipv4.extract_ips(t, chains), ipv4.extract_cidrs(t, chains)
+
+    for name, make in (('mixed', make_mixed_log), ('dense', make_dense_log)):
+        text = make(lines)
+        before = best_of(per_pattern, text)
+        after = best_of(tokenized, text)
+        print(f"{name} log: {lines} lines, {len(text)} bytes")
+        print(f"  card/SSN/IPv4 patterns: {before * 1e3:8.1f} ms")
+        print(f"  shared digit chains:    {after * 1e3:8.1f} ms")
+        print(f"  speedup:                {before / after:8.2f}x")
+
+if __name__ == '__main__':
+    main(sys.argv)
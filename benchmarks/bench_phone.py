@@ -0,0 +1,63 @@
+import re
+import sys
+import time
+
+import r2n
+
+# The pattern PhoneExtractor used before the linear scanner, kept here as
+# the baseline for the worst case below.
+LEGACY_PATTERN = re.compile(
+    r'\+\s*(\d{1,4})\s*[\(\)\-\.\s/]*'
+    r'(\d[\(\)\-\.\s/\d]*\d)'
+    r'(?:\s*[\(\)\-\.\s/]*\d[\(\)\-\.\s/\d]*)*'
+)
+
+
+def make_dump(padding: int) -> str:
+    # A table dump: a phone number followed by a long run of column padding.
+    return '+44 20 7946 0958' + ' ' * padding + '|'
+
+
+# Texts whose phone numbers must be reported the same way as by the legacy
+# pattern. Padding after a number, however long, is not part of it.
+CASES = (
+    ('call +1 555 123 4567' + ' ' * 60 + 'now', ['+15551234567']),
+    ('call +1 555 123 4567 now', ['+15551234567']),
+    (make_dump(500), ['+442079460958']),
+    ('+44 20 7946 0958 | +33 1 23 45 67 89', ['+33123456789', '+442079460958']),
+)
+
+
+def check_cases() -> None:
+    for text, expected in CASES:
+        found = sorted(r2n.extract_all(text)['phones'])
+        assert found == expected, f"{text[:40]!r}: phones are {found}, expected {expected}"
+
+
+def timed(fn, text: str) -> float:
+    start = time.perf_counter()
+    fn(text)
+    return time.perf_counter() - start
+
+
+def main(argv: list) -> None:
+    check_cases()
+    base = int(argv[1]) if len(argv) > 1 else 500
+    extractor = r2n.get_engine().phone.extractor
+
+    print(f"{'padding':>10} {'legacy ms':>12} {'scanner ms':>12}")
+    for step in range(5):
+        padding = base << step
+        text = make_dump(padding)
+        legacy = timed(LEGACY_PATTERN.findall, text)
+        scanner = timed(extractor.extract_phones, text)
+        print(f"{padding:>10} {legacy * 1e3:12.2f} {scanner * 1e3:12.3f}")
+
+    print(f"{'rows':>10} {'bytes':>12} {'scanner ms':>12}")
+    for step in range(5):
+        text = make_dump(base) * (1000 << step)
+        print(f"{1000 << step:>10} {len(text):>12} {timed(extractor.extract_phones, text) * 1e3:12.2f}")
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,65 @@
+import random
+import sys
+import time
+
+import r2n
+from utils.prefilter import TextProfile
+
+WORDS = ('the', 'quarterly', 'report', 'shows', 'revenue', 'growth', 'in', 'all', 'regions', 'and',
+         'customers', 'asked', 'about', 'delivery', 'times', 'for', 'orders', 'placed', 'last', 'week')
+
+
+def make_prose(paragraphs: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    out = []
+    for _ in range(paragraphs):
+        sentence = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(30, 60)))
+        out.append(sentence.capitalize() + f", page {rng.randint(1, 400)}.")
+    return '\n\n'.join(out)
+
+
+def best_of(fn, text: str, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list) -> None:
+    paragraphs = int(argv[1]) if len(argv) > 1 else 5000
+    text = make_prose(paragraphs)
+    engine = r2n.get_engine()
+    # Compare against the same (ASCII or Unicode) patterns extract_all picks.
+    flags = TextProfile(text).pattern_flags
+    numeric = engine.ascii_numeric if flags else engine.numeric
+
+    def family(name):
+        return engine.family(name, flags)
+
+    def unguarded(t):
+        chains = numeric.tokenize(t)
+        family('email').extractor.extract_emails(t)
+        family('crypto').dispatcher.extract_addresses(t)
+        family('hashes').hex_dispatcher.extract_hashes(t)
+        family('hashes').mcf_dispatcher.extract_hashes(t)
+        family('ip').extractor.extract_ips(t, chains)
+        family('domain').extractor.extract_domains(t)
+        family('phone').extractor.extract_phones(t)
+        family('ssn').extractor.extract_ssns(t, chains)
+        family('mac').extractor.extract_macs(t)
+        family('card').extractor.extract_cards(t, chains)
+
+    before = best_of(unguarded, text)
+    after = best_of(engine.extract_all, text)
+    print(f"prose: {paragraphs} paragraphs, {len(text)} bytes")
+    print(f"every extractor: {before * 1e3:8.1f} ms")
+    print(f"with prefilters: {after * 1e3:8.1f} ms")
+    print(f"speedup:         {before / after:8.2f}x")
+    skipped = {name: count for name, count in engine.skip_counts().items() if count}
+    print(f"skipped: {skipped}")
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,124 @@
+import argparse
+import json
+import math
+import sys
+import time
+
+import r2n
+
+KB = 1024
+SIZES = [KB << (2 * step) for step in range(8)]  # 1 KB to 16 MB
+
+# Adversarial inputs, one or more per extractor family: long runs of the
+# characters a pattern can consume, with the character it needs to complete
+# a match missing or placed at the very end.
+CASES = {
+    'email/labels': ('email', lambda size: 'a.' * (size // 2) + '@'),
+    'email/ats': ('email', lambda size: 'a@' * (size // 2)),
+    'email/local': ('email', lambda size: 'a' * size + '@b'),
+    'domain/labels': ('domain', lambda size: 'a.' * (size // 2)),
+    'domain/hyphens': ('domain', lambda size: ('a' + '-' * 60 + 'a.') * (size // 63)),
+    'domain/lines': ('domain', lambda size: ('a.' * 100 + '\n') * (size // 201)),
+    'phone/pluses': ('phone', lambda size: '+1 ' * (size // 3)),
+    'phone/digits': ('phone', lambda size: '+' + '1' * (size - 1)),
+    'ip/ipv6-colons': ('ip', lambda size: '1:' * (size // 2)),
+    'ip/ipv6-compressed': ('ip', lambda size: 'a::' * (size // 3)),
+    'ip/ipv4-dots': ('ip', lambda size: '1.' * (size // 2)),
+    'ssn/dashes': ('ssn', lambda size: '123-45-6789-' * (size // 12)),
+    'card/spaces': ('card', lambda size: '4111 ' * (size // 5)),
+    'card/digits': ('card', lambda size: '4' * size),
+    'mac/colons': ('mac', lambda size: '0a:' * (size // 3)),
+    'hashes/hex': ('hashes', lambda size: 'a' * size),
+    'hashes/hex-words': ('hashes', lambda size: ('a' * 127 + ' ') * (size // 128)),
+    'hashes/argon2': ('hashes', lambda size: '$argon2id$' * (size // 10)),
+    'hashes/argon2-params': ('hashes', lambda size: '$argon2id$v=19$m=1,t=1,p=1$' * (size // 27)),
+    'hashes/bcrypt': ('hashes', lambda size: '$2a$10$' * (size // 7)),
+    'crypto/word': ('crypto', lambda size: 'a' * size),
+    'crypto/tokens': ('crypto', lambda size: ('1' + 'a' * 33 + ' ') * (size // 35)),
+    'crypto/schemes': ('crypto', lambda size: 'bitcoincash:' * (size // 12)),
+}
+
+
+def time_case(engine, family: str, text: str) -> float:
+    # Small inputs are repeated to get above the timer's resolution.
+    best = float('inf')
+    for _ in range(3 if len(text) < 1 << 20 else 1):
+        start = time.perf_counter()
+        engine.extract(text, types={family})
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def fit_exponent(points: list, floor: float) -> float:
+    # Slope of log(time) over log(size), from the points above the noise
+    # floor: about 1 for linear scans, 2 for quadratic ones.
+    points = [(size, seconds) for size, seconds in points if seconds >= floor]
+    if len(points) < 2:
+        return None
+    xs = [math.log(size) for size, _ in points]
+    ys = [math.log(seconds) for _, seconds in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    return (sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+            / sum((x - mean_x) ** 2 for x in xs))
+
+
+def main(argv: list) -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.bench_redos')
+    parser.add_argument('--max-size', type=int, default=SIZES[-1], help="largest input in bytes (default: 16 MB)")
+    parser.add_argument('--time-limit', type=float, default=2.0, help="stop growing a case after a run this long, in seconds")
+    parser.add_argument('--max-exponent', type=float, default=1.3, help="fail when time grows faster than size**EXPONENT")
+    parser.add_argument('--floor', type=float, default=0.002, help="ignore runs shorter than this when fitting, in seconds")
+    parser.add_argument('--cases', help="comma-separated case names or family prefixes (default: all)")
+    parser.add_argument('--json', help="write the results to this file")
+    args = parser.parse_args(argv[1:])
+
+    cases = CASES
+    if args.cases:
+        wanted = [name.strip() for name in args.cases.split(',')]
+        cases = {name: case for name, case in CASES.items() if any(name == w or name.startswith(w + '/') for w in wanted)}
+
+    engine = r2n.get_engine()
+    results = []
+    failed = []
+    for name, (family, generate) in cases.items():
+        engine.extract('', types={family})
+        points = []
+        for size in SIZES:
+            if size > args.max_size:
+                break
+            seconds = time_case(engine, family, generate(size))
+            points.append((size, seconds))
+            if seconds >= args.time_limit:
+                break
+        exponent = fit_exponent(points, args.floor)
+        ok = exponent is None or exponent <= args.max_exponent
+        if not ok:
+            failed.append(name)
+        largest, seconds = points[-1]
+        print(f"{name:22s} {'ok  ' if ok else 'FAIL'} exponent {exponent if exponent is not None else float('nan'):5.2f}"
+              f"  {largest // KB:6d} KB in {seconds * 1e3:9.1f} ms  ({largest / seconds / 2**20:7.2f} MB/s)")
+        results.append({
+            'case': name,
+            'family': family,
+            'exponent': exponent,
+            'ok': ok,
+            'points': [{'size': size, 'seconds': seconds} for size, seconds in points],
+        })
+
+    if args.json:
+        with open(args.json, 'w') as out:
+            json.dump({
+                'python': sys.version.split()[0],
+                'max_exponent': args.max_exponent,
+                'floor': args.floor,
+                'time_limit': args.time_limit,
+                'failed': failed,
+                'cases': results,
+            }, out, indent=2)
+    if failed:
+        print(f"super-linear: {', '.join(failed)}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main(sys.argv)
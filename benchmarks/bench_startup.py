@@ -0,0 +1,50 @@
+import subprocess
+import sys
+
+import r2n
+
+PROBE = """
+import time
+start = time.perf_counter()
+import r2n
+r2n.extract('probe 10.0.0.1 a@b.co', types={types!r})
+print(time.perf_counter() - start)
+"""
+
+
+def run_probe(types):
+    out = subprocess.run([sys.executable, '-X', 'importtime', '-c', PROBE.format(types=types)],
+                         capture_output=True, text=True, check=True)
+    # "import time: self [us] | cumulative | name", nested imports indented
+    # by two spaces per level under the module that triggered them. Only
+    # r2n and the extractors it loads on first use are counted, not the
+    # interpreter's own startup imports.
+    imported, modules = 0, []
+    for line in out.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        name = name[1:]
+        if name == 'r2n' or name.startswith('utils.'):
+            imported += int(cumulative)
+        if name.strip().startswith('utils.'):
+            modules.append(name.strip())
+    return float(out.stdout) * 1e6, imported, modules
+
+
+def cold_start(types, repeat: int = 5):
+    runs = [run_probe(types) for _ in range(repeat)]
+    total, imported, modules = min(runs)
+    return total, min(run[1] for run in runs), modules
+
+
+def main(argv: list) -> None:
+    repeat = int(argv[1]) if len(argv) > 1 else 5
+    print(f"{'types':10s} {'import+first call':>18s} {'imports':>10s}  utils modules")
+    for types in [[], None] + [[name] for name in r2n.FAMILIES]:
+        label = ','.join(types) if types else ('none' if types == [] else 'all')
+        total, imported, modules = cold_start(types, repeat)
+        print(f"{label:10s} {total / 1e3:15.1f} ms {imported / 1e3:7.1f} ms  {len(modules)}")
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+import time
+
+import r2n
+
+TEXT = ("GET /status from 10.20.30.40 via edge-7.example.net, contact ops@example.com "
+        "or +1 415 555 0100; card 4111 1111 1111 1111, ssn 123-45-6789, mac 00:1A:2B:3C:4D:5E")
+
+COLD_START = """
+import time
+start = time.perf_counter()
+import r2n
+r2n.extract({text!r}, types={types!r})
+print(time.perf_counter() - start)
+"""
+
+
+def cold_start(types, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', COLD_START.format(text=TEXT, types=types)],
+                             capture_output=True, text=True, check=True)
+        best = min(best, float(out.stdout))
+    return best
+
+
+def per_call(types, calls: int) -> float:
+    engine = r2n.get_engine()
+    engine.extract(TEXT, types=types)
+    start = time.perf_counter()
+    for _ in range(calls):
+        engine.extract(TEXT, types=types)
+    return (time.perf_counter() - start) / calls
+
+
+def main(argv: list) -> None:
+    calls = int(argv[1]) if len(argv) > 1 else 2000
+    print(f"text: {len(TEXT)} bytes, {calls} calls")
+    for types in (None, ['ip', 'domain'], ['email']):
+        label = ','.join(types) if types else 'all'
+        print(f"  {label:10s} cold start {cold_start(types) * 1e3:7.1f} ms   per call {per_call(types, calls) * 1e6:8.1f} us")
+
+if __name__ == '__main__':
+    main(sys.argv)
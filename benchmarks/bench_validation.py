@@ -0,0 +1,76 @@
+import hashlib
+import random
+import sys
+import time
+
+import r2n
+from utils.alphabets import BASE58
+from utils.cryptos import encoding
+
+# Version bytes of a few coins whose addresses are 34 characters long.
+VERSIONS = (0, 5, 48, 30, 76, 71)
+
+
+def base58check(payload: bytes) -> str:
+    raw = payload + hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4]
+    n = int.from_bytes(raw, 'big')
+    out = ''
+    while n:
+        n, digit = divmod(n, 58)
+        out = BASE58.chars[digit] + out
+    return BASE58.chars[0] * (len(raw) - len(raw.lstrip(b'\0'))) + out
+
+
+def make_text(tokens: int, distinct: int = 2000, seed: int = 0) -> str:
+    # A feed in which a pool of addresses recurs. Half of the pool are real
+    # addresses; the other half have one character changed, so they keep
+    # the alphabet and length but fail the checksum.
+    rng = random.Random(seed)
+    pool = []
+    for i in range(distinct):
+        payload = bytes((rng.choice(VERSIONS),)) + bytes(rng.randrange(256) for _ in range(20))
+        address = base58check(payload)
+        if i % 2:
+            position = rng.randrange(1, len(address))
+            address = address[:position] + rng.choice(BASE58.chars.replace(address[position], '')) + address[position + 1:]
+        pool.append(address)
+    words = []
+    for _ in range(tokens):
+        if rng.random() < 0.3:
+            words.append(rng.choice(pool))
+        else:
+            words.append(rng.choice(('transfer', 'from', 'to', 'wallet', 'amount', 'fee', 'block')))
+    return ' '.join(words)
+
+
+def clear_caches() -> None:
+    for codec in (encoding.BASE58_CHECK, encoding.RIPPLE_CHECK, encoding.MONERO_BASE58, encoding.STELLAR_STRKEY):
+        codec.decode.cache_clear()
+
+
+def best_of(fn, text: str, repeat: int = 3, cold: bool = False) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        if cold:
+            clear_caches()
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list) -> None:
+    tokens = int(argv[1]) if len(argv) > 1 else 20000
+    text = make_text(tokens)
+    print(f"text: {tokens} tokens, {len(text)} bytes, half of the addresses fail their checksum")
+    for level in r2n.VALIDATION_LEVELS:
+        engine = r2n.Engine(level)
+        extract = engine.crypto.dispatcher.extract_addresses
+        found = extract(text)
+        cold = best_of(extract, text, cold=True)
+        warm = best_of(extract, text)
+        print(f"  {level:8s}: cold {cold * 1e3:7.1f} ms   warm {warm * 1e3:7.1f} ms   "
+              f"{len(set().union(*found.values()))} distinct addresses reported")
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -1,135 +1,174 @@
+import codecs
 import logging
-from typing import List, Dict
-from utils.email import EmailExtractor
-from utils.cryptos.bitcoin_forks import BitcoinExtractor, BitcoinCashExtractor, BitcoinSVExtractor, BitcoinGoldExtractor, NamecoinExtractor
-from utils.cryptos.ethereum_ecosystem import EthereumEcosystemExtractor
-from utils.cryptos.privacy_coins import MoneroExtractor, ZcashExtractor, DashExtractor, VergeExtractor
-from utils.cryptos.litecoin_derivatives import LitecoinExtractor, DogecoinExtractor, DigiByteExtractor, FeathercoinExtractor
-from utils.cryptos.ripple_stellar import RippleExtractor, StellarExtractor
-from utils.cryptos.cardano_tezos import CardanoExtractor, TezosExtractor
-from utils.cryptos.other_cryptos import MonacoinExtractor, VertcoinExtractor, SyscoinExtractor, PeercoinExtractor, PrimecoinExtractor, NexusExtractor
-from utils.hashes.md5 import MD5Extractor
-from utils.hashes.sha1 import SHA1Extractor
-from utils.hashes.sha224 import SHA224Extractor
-from utils.hashes.sha256 import SHA256Extractor
-from utils.hashes.sha384 import SHA384Extractor
-from utils.hashes.sha512 import SHA512Extractor
-from utils.hashes.blake2b import BLAKE2bExtractor
-from utils.hashes.blake2s import BLAKE2sExtractor
-from utils.hashes.blake3 import BLAKE3Extractor
-from utils.passwords.bcrypt import BcryptExtractor
-from utils.passwords.argon2 import Argon2Extractor
-from utils.ip import IPExtractor
-from utils.domain import DomainExtractor
-from utils.phone import PhoneExtractor
-from utils.ssn import SSNExtractor
-from utils.mac import MACExtractor
-from utils.card import CardExtractor
-
-
-logging.basicConfig(level=logging.ERROR, format='%(asctime)s - %(levelname)s - %(message)s')
+import re
+import os
+import threading
+import time
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple, Union
+from utils.scanner import FusedScanner
+from utils.numeric import DigitChain, LazyChains, NumericTokenizer
+from utils.counting import CallCounts, MatchCounter
+from utils.matches import ExtractionResult, MatchRecord
+from utils.prefilter import TextProfile
+from utils.registry import CRYPTO_TYPES, HEX_HASH_TYPES, PASSWORD_HASH_TYPES, registry
+from utils.validation import CHARSET, VALIDATION_LEVELS, check_validation_level
+
 logger = logging.getLogger(__name__)
 
+Text = Union[str, bytes, bytearray, memoryview]
+
+def as_text(data: Text) -> str:
+    
+    if isinstance(data, str):
+        return data
+    # The UTF-8 decoder copies pure-ASCII input without per-character work.
+    return str(data, 'utf-8', 'replace')
+
+BLOCK_SIZE = 1 << 18
+
+def block_bounds(text: str, size: int = BLOCK_SIZE) -> List[Tuple[int, int]]:
+    
+    # Blocks end at line breaks, which no pattern matches across except a
+    # phone number's run of digits and spaces. A line longer than size is
+    # kept whole.
+    bounds = []
+    start = 0
+    while len(text) - start > size:
+        end = text.rfind('\n', start, start + size) + 1
+        if end <= start:
+            end = text.find('\n', start + size) + 1 or len(text)
+        bounds.append((start, end))
+        start = end
+    if start < len(text) or not bounds:
+        bounds.append((start, len(text)))
+    return bounds
+
 class EmailExtractionEngine:
     
 
-    def __init__(self):
-        self.extractor = EmailExtractor()
-        self.extraction_count = 0
+    def __init__(self, flags: int = 0):
+        self.extractor = registry.create('Email', flags)
+        self.counts = CallCounts(('Email',))
 
-    def process_text(self, text: str) -> List[str]:
+    def process_text(self, text: str, matches: Optional[List[re.Match]] = None, profile: Optional[TextProfile] = None) -> List[str]:
         
         logger.info(f"Starting email extraction on text of length {len(text)}")
-        self.extraction_count += 1
+        self.counts.call()
+
+        if not self.extractor.prefilter.admits(profile or TextProfile(text)):
+            self.counts.skip('Email')
+            return []
 
         try:
-            emails = self.extractor.extract_emails(text)
+            emails = self.extractor.extract_emails(text, matches)
             logger.info(f"Extracted {len(emails)} unique emails")
             return emails
         except Exception as e:
             logger.error(f"Error during email extraction: {e}")
             raise
 
+    def iter_spans(self, text: str, matches: Optional[List[re.Match]] = None, profile: Optional[TextProfile] = None) -> Iterator[Tuple[str, int, int, str]]:
+        
+        self.counts.call()
+        if not self.extractor.prefilter.admits(profile or TextProfile(text)):
+            self.counts.skip('Email')
+            return
+        for start, end, value in self.extractor.iter_spans(text, matches):
+            yield 'emails', start, end, value
+
+    def detect(self, text: str, profile: Optional[TextProfile] = None) -> Optional[MatchRecord]:
+        
+        self.counts.call()
+        if not self.extractor.prefilter.admits(profile or TextProfile(text)):
+            self.counts.skip('Email')
+            return None
+        for match in self.extractor.iter_matches(text):
+            return MatchRecord('emails', match.start(), match.end(), match.group(), text)
+        return None
+
 class CryptoExtractionEngine:
     
 
-    def __init__(self):
-        self.extractors = {
-            'Bitcoin': BitcoinExtractor(),
-            'BitcoinCash': BitcoinCashExtractor(),
-            'BitcoinSV': BitcoinSVExtractor(),
-            'BitcoinGold': BitcoinGoldExtractor(),
-            'Namecoin': NamecoinExtractor(),
-            'EthereumEcosystem': EthereumEcosystemExtractor(),
-            'Monero': MoneroExtractor(),
-            'Zcash': ZcashExtractor(),
-            'Dash': DashExtractor(),
-            'Verge': VergeExtractor(),
-            'Litecoin': LitecoinExtractor(),
-            'Dogecoin': DogecoinExtractor(),
-            'DigiByte': DigiByteExtractor(),
-            'Feathercoin': FeathercoinExtractor(),
-            'Ripple': RippleExtractor(),
-            'Stellar': StellarExtractor(),
-            'Cardano': CardanoExtractor(),
-            'Tezos': TezosExtractor(),
-            'Monacoin': MonacoinExtractor(),
-            'Vertcoin': VertcoinExtractor(),
-            'Syscoin': SyscoinExtractor(),
-            'Peercoin': PeercoinExtractor(),
-            'Primecoin': PrimecoinExtractor(),
-            'Nexus': NexusExtractor(),
-        }
-        self.extraction_count = 0
-
-    def process_text(self, text: str) -> Dict[str, List[str]]:
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        from utils.cryptos.dispatch import CryptoCandidateDispatcher
+        self.extractors = {coin: registry.create(coin, flags, validation_level=validation_level) for coin in CRYPTO_TYPES}
+        self.dispatcher = CryptoCandidateDispatcher(self.extractors, flags)
+        self.counts = CallCounts(self.extractors)
+
+    def process_text(self, text: str, profile: Optional[TextProfile] = None) -> Dict[str, List[str]]:
         
         logger.info(f"Starting crypto address extraction on text of length {len(text)}")
-        self.extraction_count += 1
+        self.counts.call()
+
+        if not self._admit(profile or TextProfile(text)):
+            return {}
 
         try:
-            results = {}
-            total_addresses = 0
-            for crypto, extractor in self.extractors.items():
-                addresses = extractor.extract_addresses(text)
-                if addresses:
-                    results[crypto] = addresses
-                    total_addresses += len(addresses)
+            results = self.dispatcher.extract_addresses(text)
+            total_addresses = sum(len(addresses) for addresses in results.values())
             logger.info(f"Extracted {total_addresses} crypto addresses across {len(results)} types")
             return results
         except Exception as e:
             logger.error(f"Error during crypto extraction: {e}")
             raise
 
+    def iter_spans(self, text: str, profile: Optional[TextProfile] = None) -> Iterator[Tuple[str, int, int, str]]:
+        
+        self.counts.call()
+        if not self._admit(profile or TextProfile(text)):
+            return
+        for start, end, coin, address in self.dispatcher.iter_spans(text):
+            yield coin, start, end, address
+
+    def detect(self, text: str, profile: Optional[TextProfile] = None) -> Optional[MatchRecord]:
+        
+        self.counts.call()
+        if not self._admit(profile or TextProfile(text)):
+            return None
+        for start, end, coin, address in self.dispatcher.iter_spans(text):
+            return MatchRecord(coin, start, end, address, text)
+        return None
+
+    def _admit(self, profile: TextProfile) -> int:
+
+        admitted = 0
+        for coin, prefilter in self.dispatcher.prefilters.items():
+            if prefilter.admits(profile):
+                admitted += 1
+            else:
+                self.counts.skip(coin)
+        return admitted
+
 class HashExtractionEngine:
     
 
-    def __init__(self):
-        self.extractors = {
-            'MD5': MD5Extractor(),
-            'SHA1': SHA1Extractor(),
-            'SHA224': SHA224Extractor(),
-            'SHA256': SHA256Extractor(),
-            'SHA384': SHA384Extractor(),
-            'SHA512': SHA512Extractor(),
-            'BLAKE2b': BLAKE2bExtractor(),
-            'BLAKE2s': BLAKE2sExtractor(),
-            'BLAKE3': BLAKE3Extractor(),
-            'Bcrypt': BcryptExtractor(),
-            'Argon2': Argon2Extractor(),
-        }
-        self.extraction_count = 0
-
-    def process_text(self, text: str) -> Dict[str, List[str]]:
+    def __init__(self, flags: int = 0):
+        from utils.hashes.hex_runs import HexRunDispatcher
+        from utils.passwords.mcf import MCFDispatcher
+        self.hex_extractors = {hash_type: registry.create(hash_type, flags) for hash_type in HEX_HASH_TYPES}
+        self.password_extractors = {hash_type: registry.create(hash_type, flags) for hash_type in PASSWORD_HASH_TYPES}
+        self.extractors = {**self.hex_extractors, **self.password_extractors}
+        self.hex_dispatcher = HexRunDispatcher(self.hex_extractors, flags)
+        self.mcf_dispatcher = MCFDispatcher(self.password_extractors, flags)
+        self.counts = CallCounts(self.extractors)
+
+    def process_text(self, text: str, profile: Optional[TextProfile] = None) -> Dict[str, List[str]]:
         
         logger.info(f"Starting hash extraction on text of length {len(text)}")
-        self.extraction_count += 1
+        self.counts.call()
+
+        admitted = self._admit(profile or TextProfile(text))
 
         try:
             results = {}
             total_hashes = 0
-            for hash_type, extractor in self.extractors.items():
-                hashes = extractor.extract_hashes(text)
+            hex_results = self.hex_dispatcher.extract_hashes(text) if not admitted.isdisjoint(self.hex_extractors) else {}
+            password_results = self.mcf_dispatcher.extract_hashes(text) if not admitted.isdisjoint(self.password_extractors) else {}
+            for hash_type in self.extractors:
+                if hash_type not in admitted:
+                    continue
+                hashes = hex_results.get(hash_type) or password_results.get(hash_type)
                 if hashes:
                     results[hash_type] = hashes
                     total_hashes += len(hashes)
@@ -139,20 +178,62 @@ class HashExtractionEngine:
             logger.error(f"Error during hash extraction: {e}")
             raise
 
+    def iter_spans(self, text: str, profile: Optional[TextProfile] = None) -> Iterator[Tuple[str, int, int, str]]:
+        
+        self.counts.call()
+        admitted = self._admit(profile or TextProfile(text))
+
+        if not admitted.isdisjoint(self.hex_extractors):
+            for start, end, value, candidates in self.hex_dispatcher.iter_spans(text):
+                for hash_type in candidates:
+                    if hash_type in admitted:
+                        yield hash_type, start, end, value
+        if not admitted.isdisjoint(self.password_extractors):
+            for start, end, value, hash_type in self.mcf_dispatcher.iter_spans(text):
+                if hash_type in admitted:
+                    yield hash_type, start, end, value
+
+    def detect(self, text: str, profile: Optional[TextProfile] = None) -> Optional[MatchRecord]:
+        
+        self.counts.call()
+        admitted = self._admit(profile or TextProfile(text))
+        if not admitted.isdisjoint(self.hex_extractors):
+            for start, end, value, candidates in self.hex_dispatcher.iter_spans(text):
+                for hash_type in candidates:
+                    if hash_type in admitted:
+                        return MatchRecord(hash_type, start, end, value, text)
+        if not admitted.isdisjoint(self.password_extractors):
+            for start, end, value, hash_type in self.mcf_dispatcher.iter_spans(text):
+                if hash_type in admitted:
+                    return MatchRecord(hash_type, start, end, value, text)
+        return None
+
+    def _admit(self, profile: TextProfile) -> set:
+
+        admitted = set()
+        for hash_type, extractor in self.extractors.items():
+            if extractor.prefilter.admits(profile):
+                admitted.add(hash_type)
+            else:
+                self.counts.skip(hash_type)
+        return admitted
+
 class IPExtractionEngine:
     
 
-    def __init__(self):
-        self.extractor = IPExtractor()
-        self.extraction_count = 0
+    def __init__(self, flags: int = 0):
+        self.extractor = registry.create('IP', flags)
+        self.counts = CallCounts(('IPv4', 'IPv6'))
 
-    def process_text(self, text: str) -> Dict[str, List[str]]:
+    def process_text(self, text: str, chains: Optional[List[DigitChain]] = None, profile: Optional[TextProfile] = None) -> Dict[str, List[str]]:
         
         logger.info(f"Starting IP extraction on text of length {len(text)}")
-        self.extraction_count += 1
+        self.counts.call()
+
+        ipv4, ipv6 = self._admit(profile or TextProfile(text))
 
         try:
-            ips = self.extractor.extract_ips(text)
+            ips = self.extractor.extract_ips(text, chains, ipv4, ipv6)
             total_items = sum(len(v) for v in ips.values())
             logger.info(f"Extracted {total_items} IP addresses and CIDRs")
             return ips
@@ -160,37 +241,94 @@ class IPExtractionEngine:
             logger.error(f"Error during IP extraction: {e}")
             raise
 
+    def iter_spans(self, text: str, chains: Optional[List[DigitChain]] = None, profile: Optional[TextProfile] = None) -> Iterator[Tuple[str, int, int, str]]:
+        
+        self.counts.call()
+        ipv4, ipv6 = self._admit(profile or TextProfile(text))
+
+        for key, found in self.extractor.scan(text, chains, ipv4, ipv6).items():
+            field = 'cidr' if key.startswith('cidr') else 'ip'
+            for record in found:
+                yield key, record['start'], record['end'], record[field]
+
+    def detect(self, text: str, chains: Optional[Iterable[DigitChain]] = None, profile: Optional[TextProfile] = None) -> Optional[MatchRecord]:
+        
+        self.counts.call()
+        ipv4, ipv6 = self._admit(profile or TextProfile(text))
+        for key, record in self.extractor.iter_scan(text, chains, ipv4, ipv6):
+            field = 'cidr' if key.startswith('cidr') else 'ip'
+            return MatchRecord(key, record['start'], record['end'], record[field], text)
+        return None
+
+    def _admit(self, profile: TextProfile) -> Tuple[bool, bool]:
+
+        ipv4 = self.extractor.ipv4_extractor.prefilter.admits(profile)
+        ipv6 = self.extractor.ipv6_extractor.prefilter.admits(profile)
+        if not ipv4:
+            self.counts.skip('IPv4')
+        if not ipv6:
+            self.counts.skip('IPv6')
+        return ipv4, ipv6
+
 class DomainExtractionEngine:
     
 
-    def __init__(self):
-        self.extractor = DomainExtractor()
-        self.extraction_count = 0
+    def __init__(self, flags: int = 0):
+        self.extractor = registry.create('Domain', flags)
+        self.counts = CallCounts(('Domain',))
 
-    def process_text(self, text: str) -> List[str]:
+    def process_text(self, text: str, emails: Optional[List[re.Match]] = None, profile: Optional[TextProfile] = None) -> List[str]:
         
         logger.info(f"Starting domain extraction on text of length {len(text)}")
-        self.extraction_count += 1
+        self.counts.call()
+
+        if not self.extractor.prefilter.admits(profile or TextProfile(text)):
+            self.counts.skip('Domain')
+            return []
 
         try:
-            domains = self.extractor.extract_domains(text)
+            domains = self.extractor.extract_domains(text, emails)
             logger.info(f"Extracted {len(domains)} domains")
             return domains
         except Exception as e:
             logger.error(f"Error during domain extraction: {e}")
             raise
 
+    def iter_spans(self, text: str, emails: Optional[List[re.Match]] = None, profile: Optional[TextProfile] = None) -> Iterator[Tuple[str, int, int, str]]:
+        
+        self.counts.call()
+        if not self.extractor.prefilter.admits(profile or TextProfile(text)):
+            self.counts.skip('Domain')
+            return
+        for start, end, value in self.extractor.iter_spans(text, emails):
+            yield 'domains', start, end, value
+
+    def detect(self, text: str, profile: Optional[TextProfile] = None) -> Optional[MatchRecord]:
+        
+        self.counts.call()
+        if not self.extractor.prefilter.admits(profile or TextProfile(text)):
+            self.counts.skip('Domain')
+            return None
+        emails = self.extractor.email_extractor.iter_matches(text)
+        for start, end, value in self.extractor.iter_spans(text, emails):
+            return MatchRecord('domains', start, end, value, text)
+        return None
+
 class PhoneExtractionEngine:
     
 
-    def __init__(self):
-        self.extractor = PhoneExtractor()
-        self.extraction_count = 0
+    def __init__(self, flags: int = 0):
+        self.extractor = registry.create('Phone', flags)
+        self.counts = CallCounts(('Phone',))
 
-    def process_text(self, text: str) -> List[str]:
+    def process_text(self, text: str, profile: Optional[TextProfile] = None) -> List[str]:
         
         logger.info(f"Starting phone extraction on text of length {len(text)}")
-        self.extraction_count += 1
+        self.counts.call()
+
+        if not self.extractor.prefilter.admits(profile or TextProfile(text)):
+            self.counts.skip('Phone')
+            return []
 
         try:
             phones = self.extractor.extract_phones(text)
@@ -200,37 +338,85 @@ class PhoneExtractionEngine:
             logger.error(f"Error during phone extraction: {e}")
             raise
 
+    def iter_spans(self, text: str, profile: Optional[TextProfile] = None) -> Iterator[Tuple[str, int, int, str]]:
+        
+        self.counts.call()
+        if not self.extractor.prefilter.admits(profile or TextProfile(text)):
+            self.counts.skip('Phone')
+            return
+        for start, end, value in self.extractor.iter_phones(text):
+            yield 'phones', start, end, value
+
+    def detect(self, text: str, profile: Optional[TextProfile] = None) -> Optional[MatchRecord]:
+        
+        self.counts.call()
+        if not self.extractor.prefilter.admits(profile or TextProfile(text)):
+            self.counts.skip('Phone')
+            return None
+        for start, end, value in self.extractor.iter_phones(text):
+            return MatchRecord('phones', start, end, value, text)
+        return None
+
 class SSNExtractionEngine:
     
 
-    def __init__(self):
-        self.extractor = SSNExtractor()
-        self.extraction_count = 0
+    def __init__(self, flags: int = 0):
+        self.extractor = registry.create('SSN', flags)
+        self.counts = CallCounts(('SSN',))
 
-    def process_text(self, text: str) -> List[str]:
+    def process_text(self, text: str, chains: Optional[List[DigitChain]] = None, profile: Optional[TextProfile] = None) -> List[str]:
         
         logger.info(f"Starting SSN extraction on text of length {len(text)}")
-        self.extraction_count += 1
+        self.counts.call()
+
+        if not self.extractor.prefilter.admits(profile or TextProfile(text)):
+            self.counts.skip('SSN')
+            return []
 
         try:
-            ssns = self.extractor.extract_ssns(text)
+            ssns = self.extractor.extract_ssns(text, chains)
             logger.info(f"Extracted {len(ssns)} SSNs")
             return ssns
         except Exception as e:
             logger.error(f"Error during SSN extraction: {e}")
             raise
 
+    def iter_spans(self, text: str, chains: Optional[List[DigitChain]] = None, profile: Optional[TextProfile] = None) -> Iterator[Tuple[str, int, int, str]]:
+        
+        self.counts.call()
+        if not self.extractor.prefilter.admits(profile or TextProfile(text)):
+            self.counts.skip('SSN')
+            return
+        for start, end, value in self.extractor.iter_spans(text, chains):
+            yield 'ssns', start, end, value
+
+    def detect(self, text: str, chains: Optional[Iterable[DigitChain]] = None, profile: Optional[TextProfile] = None) -> Optional[MatchRecord]:
+        
+        self.counts.call()
+        if not self.extractor.prefilter.admits(profile or TextProfile(text)):
+            self.counts.skip('SSN')
+            return None
+        if chains is None:
+            chains = self.extractor.tokenizer.iter_chains(text)
+        for start, end, value in self.extractor.iter_spans(text, chains):
+            return MatchRecord('ssns', start, end, value, text)
+        return None
+
 class MACExtractionEngine:
     
 
-    def __init__(self):
-        self.extractor = MACExtractor()
-        self.extraction_count = 0
+    def __init__(self, flags: int = 0):
+        self.extractor = registry.create('MAC', flags)
+        self.counts = CallCounts(('MAC',))
 
-    def process_text(self, text: str) -> List[str]:
+    def process_text(self, text: str, profile: Optional[TextProfile] = None) -> List[str]:
         
         logger.info(f"Starting MAC extraction on text of length {len(text)}")
-        self.extraction_count += 1
+        self.counts.call()
+
+        if not self.extractor.prefilter.admits(profile or TextProfile(text)):
+            self.counts.skip('MAC')
+            return []
 
         try:
             macs = self.extractor.extract_macs(text)
@@ -240,116 +426,757 @@ class MACExtractionEngine:
             logger.error(f"Error during MAC extraction: {e}")
             raise
 
+    def iter_spans(self, text: str, profile: Optional[TextProfile] = None) -> Iterator[Tuple[str, int, int, str]]:
+        
+        self.counts.call()
+        if not self.extractor.prefilter.admits(profile or TextProfile(text)):
+            self.counts.skip('MAC')
+            return
+        for start, end, value in self.extractor.iter_spans(text):
+            yield 'macs', start, end, value
+
+    def detect(self, text: str, profile: Optional[TextProfile] = None) -> Optional[MatchRecord]:
+        
+        self.counts.call()
+        if not self.extractor.prefilter.admits(profile or TextProfile(text)):
+            self.counts.skip('MAC')
+            return None
+        for start, end, value in self.extractor.iter_spans(text):
+            return MatchRecord('macs', start, end, value, text)
+        return None
+
 class CardExtractionEngine:
     
 
-    def __init__(self):
-        self.extractor = CardExtractor()
-        self.extraction_count = 0
+    def __init__(self, flags: int = 0):
+        self.extractor = registry.create('Card', flags)
+        self.counts = CallCounts(('Card',))
 
-    def process_text(self, text: str) -> List[str]:
+    def process_text(self, text: str, chains: Optional[List[DigitChain]] = None, profile: Optional[TextProfile] = None) -> List[str]:
         
         logger.info(f"Starting card extraction on text of length {len(text)}")
-        self.extraction_count += 1
+        self.counts.call()
+
+        if not self.extractor.prefilter.admits(profile or TextProfile(text)):
+            self.counts.skip('Card')
+            return []
 
         try:
-            cards = self.extractor.extract_cards(text)
+            cards = self.extractor.extract_cards(text, chains)
             logger.info(f"Extracted {len(cards)} card numbers")
             return cards
         except Exception as e:
             logger.error(f"Error during card extraction: {e}")
             raise
 
-def extract_emails(text: str) -> List[str]:
+    def iter_spans(self, text: str, chains: Optional[List[DigitChain]] = None, profile: Optional[TextProfile] = None) -> Iterator[Tuple[str, int, int, str]]:
+        
+        self.counts.call()
+        if not self.extractor.prefilter.admits(profile or TextProfile(text)):
+            self.counts.skip('Card')
+            return
+        for start, end, value in self.extractor.iter_spans(text, chains):
+            yield 'cards', start, end, value
+
+    def detect(self, text: str, chains: Optional[Iterable[DigitChain]] = None, profile: Optional[TextProfile] = None) -> Optional[MatchRecord]:
+        
+        self.counts.call()
+        if not self.extractor.prefilter.admits(profile or TextProfile(text)):
+            self.counts.skip('Card')
+            return None
+        if chains is None:
+            chains = self.extractor.tokenizer.iter_chains(text)
+        # Chain by chain: iter_spans makes one pass over the chains per card shape.
+        for chain in chains:
+            for start, end, value in self.extractor.iter_spans(text, (chain,)):
+                return MatchRecord('cards', start, end, value, text)
+        return None
+
+FAMILIES = {
+    'email': EmailExtractionEngine,
+    'crypto': CryptoExtractionEngine,
+    'hashes': HashExtractionEngine,
+    'ip': IPExtractionEngine,
+    'domain': DomainExtractionEngine,
+    'phone': PhoneExtractionEngine,
+    'ssn': SSNExtractionEngine,
+    'mac': MACExtractionEngine,
+    'card': CardExtractionEngine,
+}
+
+NUMERIC_FAMILIES = frozenset(('ip', 'ssn', 'card'))
+# Families whose extractors take a validation level (see utils.validation).
+VALIDATED_FAMILIES = frozenset(('crypto',))
+# Families whose matches are runs of a few byte classes, which scan_buffer
+# can find without decoding the whole buffer.
+BUFFER_FAMILIES = ('crypto', 'hashes', 'card')
+
+def select_types(types: Optional[Iterable[str]] = None) -> frozenset:
     
-    engine = EmailExtractionEngine()
-    return engine.process_text(text)
+    if types is None:
+        return frozenset(FAMILIES)
+    if isinstance(types, str):
+        types = types.split(',')
+    selected = frozenset(name.strip() for name in types if name.strip())
+    unknown = sorted(selected - FAMILIES.keys())
+    if unknown:
+        raise ValueError(f"Unknown extraction types: {', '.join(unknown)} (expected any of {', '.join(FAMILIES)})")
+    return selected
 
-def extract_crypto_addresses(text: str) -> Dict[str, List[str]]:
+class _Family:
+    
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, engine, owner=None):
+        if engine is None:
+            return self
+        return engine.family(self.name)
+
+# Shared scanners: name -> (class, pattern flags).
+TOOLS = {
+    'scanner': (FusedScanner, 0),
+    'numeric': (NumericTokenizer, 0),
+    'ascii_scanner': (FusedScanner, re.ASCII),
+    'ascii_numeric': (NumericTokenizer, re.ASCII),
+}
+
+class _Tool:
+    
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, engine, owner=None):
+        if engine is None:
+            return self
+        return engine.tool(self.name)
+
+class Engine:
+    
+
+    __slots__ = ('_families', '_tools', '_lock', 'validation_level')
+
+    email = _Family('email')
+    crypto = _Family('crypto')
+    hashes = _Family('hashes')
+    ip = _Family('ip')
+    domain = _Family('domain')
+    phone = _Family('phone')
+    ssn = _Family('ssn')
+    mac = _Family('mac')
+    card = _Family('card')
+
+    scanner = _Tool('scanner')
+    numeric = _Tool('numeric')
+    ascii_scanner = _Tool('ascii_scanner')
+    ascii_numeric = _Tool('ascii_numeric')
+
+    def __init__(self, validation_level: str = CHARSET):
+        object.__setattr__(self, '_families', {})
+        object.__setattr__(self, '_tools', {})
+        object.__setattr__(self, '_lock', threading.Lock())
+        object.__setattr__(self, 'validation_level', check_validation_level(validation_level))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def family(self, name: str, flags: int = 0):
+        
+        # Families are built on first use, so a caller that only asks for a
+        # few types never imports or compiles the extractors of the others.
+        # Pure-ASCII text is served by a second copy compiled with re.ASCII.
+        key = (name, flags)
+        family = self._families.get(key)
+        if family is None:
+            with self._lock:
+                family = self._families.get(key)
+                if family is None:
+                    if name in VALIDATED_FAMILIES:
+                        family = FAMILIES[name](flags, validation_level=self.validation_level)
+                    else:
+                        family = FAMILIES[name](flags)
+                    self._families[key] = family
+        return family
+
+    def tool(self, name: str):
+        
+        # Like the families, the fused scanner and the numeric tokenizer are
+        # compiled on first use, so an engine that only sees Unicode text
+        # never builds the re.ASCII copies, and one that only runs a few
+        # families never builds the fused scanner.
+        tool = self._tools.get(name)
+        if tool is None:
+            with self._lock:
+                tool = self._tools.get(name)
+                if tool is None:
+                    cls, flags = TOOLS[name]
+                    tool = cls(flags)
+                    self._tools[name] = tool
+        return tool
+
+    def _reinit_lock(self) -> None:
+        object.__setattr__(self, '_lock', threading.Lock())
+        for family in self._families.values():
+            family.counts.reinit_lock()
+
+    def extract_emails(self, text: str, matches: Optional[List[re.Match]] = None, profile: Optional[TextProfile] = None) -> List[str]:
+        profile = profile or TextProfile(text)
+        return self.family('email', profile.pattern_flags).process_text(text, matches, profile)
+
+    def extract_crypto_addresses(self, text: str, profile: Optional[TextProfile] = None) -> Dict[str, List[str]]:
+        profile = profile or TextProfile(text)
+        return self.family('crypto', profile.pattern_flags).process_text(text, profile)
+
+    def extract_hashes(self, text: str, profile: Optional[TextProfile] = None) -> Dict[str, List[str]]:
+        profile = profile or TextProfile(text)
+        return self.family('hashes', profile.pattern_flags).process_text(text, profile)
+
+    def extract_ips(self, text: str, chains: Optional[List[DigitChain]] = None, profile: Optional[TextProfile] = None) -> Dict[str, List[str]]:
+        profile = profile or TextProfile(text)
+        return self.family('ip', profile.pattern_flags).process_text(text, chains, profile)
+
+    def scan_ips(self, text: str) -> Dict[str, List[dict]]:
+        return self.family('ip', TextProfile(text).pattern_flags).extractor.scan(text)
+
+    def extract_domains(self, text: str, emails: Optional[List[re.Match]] = None, profile: Optional[TextProfile] = None) -> List[str]:
+        profile = profile or TextProfile(text)
+        return self.family('domain', profile.pattern_flags).process_text(text, emails, profile)
+
+    def extract_phones(self, text: str, profile: Optional[TextProfile] = None) -> List[str]:
+        profile = profile or TextProfile(text)
+        return self.family('phone', profile.pattern_flags).process_text(text, profile)
+
+    def extract_ssns(self, text: str, chains: Optional[List[DigitChain]] = None, profile: Optional[TextProfile] = None) -> List[str]:
+        profile = profile or TextProfile(text)
+        return self.family('ssn', profile.pattern_flags).process_text(text, chains, profile)
+
+    def extract_macs(self, text: str, profile: Optional[TextProfile] = None) -> List[str]:
+        profile = profile or TextProfile(text)
+        return self.family('mac', profile.pattern_flags).process_text(text, profile)
+
+    def extract_cards(self, text: str, chains: Optional[List[DigitChain]] = None, profile: Optional[TextProfile] = None) -> List[str]:
+        profile = profile or TextProfile(text)
+        return self.family('card', profile.pattern_flags).process_text(text, chains, profile)
+
+    def skip_counts(self) -> Dict[str, int]:
+        counts = {}
+        for name in FAMILIES:
+            for flags in (0, re.ASCII):
+                family = self._families.get((name, flags))
+                if family is not None:
+                    for key, count in family.counts.skip_counts().items():
+                        counts[key] = counts.get(key, 0) + count
+        return counts
+
+    def extract_all(self, text: Text, fused: bool = False, deadline: Optional[float] = None) -> ExtractionResult:
+        
+        return self.extract(text, fused=fused, deadline=deadline)
+
+    def extract(self, text: Text, types: Optional[Iterable[str]] = None, fused: bool = False, deadline: Optional[float] = None) -> ExtractionResult:
+        
+        selected = select_types(types)
+        text = as_text(text)
+        if deadline is not None:
+            if fused:
+                raise ValueError("fused extraction does not support a deadline")
+            return self._extract_until(text, selected, deadline)
+        if fused:
+            return self._extract_fused(text, selected)
+        inputs = self._prepare(text, selected)
+        found = {name: self._extract_family(name, text, *inputs) for name in FAMILIES if name in selected}
+        return self._merge_results(found)
+
+    def _extract_until(self, text: str, selected: frozenset, deadline: float, block_size: int = BLOCK_SIZE) -> ExtractionResult:
+        
+        # Each family scans the text block by block and the clock is read
+        # before every block, so the deadline is overrun by at most one block
+        # of one family. The family running at the deadline and the families
+        # after it are reported as skipped.
+        bounds = block_bounds(text, block_size)
+        blocks: List[Optional[tuple]] = [None] * len(bounds)
+        found = {}
+        skipped = []
+        for name in FAMILIES:
+            if name not in selected:
+                continue
+            parts = []
+            for i, (start, end) in enumerate(bounds):
+                if time.monotonic() >= deadline:
+                    skipped.append(name)
+                    break
+                if blocks[i] is None:
+                    block = text[start:end]
+                    blocks[i] = (block,) + self._prepare(block, selected)
+                parts.append(self._extract_family(name, *blocks[i]))
+            if parts:
+                found[name] = self._concat(parts)
+        results = self._merge_results(found)
+        results.truncated = bool(skipped)
+        results.skipped = skipped
+        return results
+
+    def _prepare(self, text: str, selected: frozenset) -> Tuple[TextProfile, List[DigitChain], Optional[List[re.Match]]]:
+        
+        profile = TextProfile(text)
+        chains = self._tokenize(text, profile) if selected & NUMERIC_FAMILIES else []
+        emails = self._find_emails(text, profile) if 'email' in selected else None
+        return profile, chains, emails
+
+    def _extract_family(self, name: str, text: str, profile: TextProfile, chains: List[DigitChain], emails: Optional[List[re.Match]]):
+        
+        if name == 'email':
+            return self.extract_emails(text, emails, profile)
+        if name == 'crypto':
+            return self.extract_crypto_addresses(text, profile)
+        if name == 'hashes':
+            return self.extract_hashes(text, profile)
+        if name == 'ip':
+            return self.extract_ips(text, chains, profile)
+        if name == 'domain':
+            return self.extract_domains(text, emails, profile)
+        if name == 'phone':
+            return self.extract_phones(text, profile)
+        if name == 'ssn':
+            return self.extract_ssns(text, chains, profile)
+        if name == 'mac':
+            return self.extract_macs(text, profile)
+        return self.extract_cards(text, chains, profile)
+
+    @staticmethod
+    def _concat(parts: List[object]) -> object:
+        
+        if isinstance(parts[0], dict):
+            merged: Dict[str, List[str]] = {}
+            for part in parts:
+                for key, values in part.items():
+                    merged.setdefault(key, []).extend(values)
+            return merged
+        return [item for part in parts for item in part]
+
+    def find(self, text: Text, types: Optional[Iterable[str]] = None) -> List[MatchRecord]:
+        
+        text = as_text(text)
+        records = [MatchRecord(key, start, end, value, text) for key, start, end, value in self._iter_spans(text, select_types(types))]
+        records.sort(key=lambda record: (record.start, record.end))
+        return records
+
+    def count(self, text: Text, types: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, int]]:
+        
+        # One text is held in memory anyway, so its distinct values are
+        # counted exactly, as extract_all would list them.
+        counter = MatchCounter(None)
+        counter.update(self._iter_spans(as_text(text), select_types(types)))
+        return counter.counts()
+
+    def count_stream(self, chunks: Iterable[Text], types: Optional[Iterable[str]] = None, block_size: int = BLOCK_SIZE, distinct_limit: int = 1 << 14) -> Dict[str, Dict[str, int]]:
+        
+        # Chunks (lines of a log, say) are joined into blocks of about
+        # block_size characters, so memory is bounded by one block plus the
+        # distinct counters. Bytes are decoded incrementally, so a UTF-8
+        # sequence split between chunks still decodes.
+        selected = select_types(types)
+        counter = MatchCounter(distinct_limit)
+        decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        block: List[str] = []
+        size = 0
+        for chunk in chunks:
+            chunk = chunk if isinstance(chunk, str) else decoder.decode(chunk)
+            block.append(chunk)
+            size += len(chunk)
+            if size >= block_size:
+                counter.update(self._iter_spans(''.join(block), selected))
+                block = []
+                size = 0
+        tail = decoder.decode(b'', True)
+        if tail:
+            block.append(tail)
+        if block:
+            counter.update(self._iter_spans(''.join(block), selected))
+        return counter.counts()
+
+    def scan_buffer(self, data: Text, types: Optional[Iterable[str]] = None) -> List[MatchRecord]:
+        
+        # A run finder marks each byte class with one translate per chunk and
+        # jumps between runs of plausible length, so only those runs are
+        # decoded and handed to the family's validators. Offsets are byte
+        # offsets into data, which may be an mmap, and records slice their
+        # text and context from it.
+        selected = select_types(BUFFER_FAMILIES if types is None else types)
+        unsupported = sorted(selected.difference(BUFFER_FAMILIES))
+        if unsupported:
+            raise ValueError(f"Buffer scans do not support: {', '.join(unsupported)} (expected any of {', '.join(BUFFER_FAMILIES)})")
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+
+        spans = set()
+        for name in BUFFER_FAMILIES:
+            if name not in selected:
+                continue
+            finder, lead = self._run_finder(name)
+            # Each run is widened to the characters its patterns look at, and
+            # the windows are joined by line breaks, which no run pattern
+            # crosses, so the family scans them all in one call.
+            windows: List[Tuple[int, int, int, int]] = []
+            parts: List[str] = []
+            position = 0
+            for start, end in finder.find(data):
+                left = max(0, start - lead)
+                while left > 0 and 0x80 <= data[left] < 0xC0:
+                    left -= 1
+                right = min(len(data), end + 1)
+                while right < len(data) and 0x80 <= data[right] < 0xC0:
+                    right += 1
+                head = str(data[left:start], 'utf-8', 'replace')
+                text = head + str(data[start:right], 'utf-8', 'replace')
+                windows.append((position, len(head), start, end))
+                parts.append(text)
+                position += len(text) + 1
+            if not windows:
+                continue
+
+            text = '\n'.join(parts)
+            positions = [window[0] for window in windows]
+            for key, span_start, span_end, value in self._buffer_spans(name, text):
+                position, head, start, end = windows[bisect_right(positions, span_start) - 1]
+                span_start -= position
+                span_end -= position
+                # Runs are ASCII, so only a match reaching back into the
+                # head needs its offset re-encoded.
+                if span_start < head:
+                    byte_start = start - len(text[position + span_start:position + head].encode('utf-8'))
+                else:
+                    byte_start = start + span_start - head
+                byte_end = start + span_end - head
+                if byte_end > start and byte_start < end:
+                    spans.add((key, byte_start, byte_end, value))
+
+        records = [MatchRecord(key, start, end, value, data) for key, start, end, value in spans]
+        records.sort(key=lambda record: (record.start, record.end, record.type))
+        return records
+
+    def _run_finder(self, name: str) -> Tuple[object, int]:
+
+        # The finder for a family, and how many bytes before a run its
+        # patterns may look.
+        from utils.runs import DIGITS, HEX_DIGITS, SEPARATORS, WORD, RunFinder
+        from utils.cryptos.dispatch import SCHEME_REACH
+        if name == 'hashes':
+            lengths = self.family('hashes', re.ASCII).hex_dispatcher.by_length
+            return RunFinder(HEX_DIGITS, min(lengths), max(lengths)), 1
+        if name == 'crypto':
+            low, high = self.family('crypto', re.ASCII).dispatcher.token_lengths
+            return RunFinder(WORD, low, high), SCHEME_REACH + 1
+        # Card runs are ASCII digits only. extract() matches \d, which with
+        # Unicode text also takes other decimal digits such as fullwidth
+        # ones, but those are multi-byte sequences that no byte class here
+        # describes, so scan_buffer does not report them.
+        digits = self.family('card', re.ASCII).extractor.prefilter.min_digits
+        return RunFinder(DIGITS + SEPARATORS, digits, counted=DIGITS, min_counted=digits), 1
+
+    def _buffer_spans(self, name: str, text: str) -> Iterator[Tuple[str, int, int, str]]:
+
+        flags = TextProfile(text).pattern_flags
+        if name == 'hashes':
+            for start, end, value, candidates in self.family('hashes', flags).hex_dispatcher.iter_spans(text):
+                for hash_type in candidates:
+                    yield hash_type, start, end, value
+        elif name == 'crypto':
+            for start, end, coin, address in self.family('crypto', flags).dispatcher.iter_token_spans(text):
+                yield coin, start, end, address
+        else:
+            for start, end, value in self.family('card', flags).extractor.iter_spans(text):
+                yield 'cards', start, end, value
+
+    def _iter_spans(self, text: str, selected: frozenset) -> Iterator[Tuple[str, int, int, str]]:
+        
+        profile = TextProfile(text)
+        flags = profile.pattern_flags
+        chains = self._tokenize(text, profile) if selected & NUMERIC_FAMILIES else []
+        emails = self._find_emails(text, profile) if 'email' in selected else None
+
+        if 'email' in selected:
+            yield from self.family('email', flags).iter_spans(text, emails, profile)
+        if 'crypto' in selected:
+            yield from self.family('crypto', flags).iter_spans(text, profile)
+        if 'hashes' in selected:
+            yield from self.family('hashes', flags).iter_spans(text, profile)
+        if 'ip' in selected:
+            yield from self.family('ip', flags).iter_spans(text, chains, profile)
+        if 'domain' in selected:
+            yield from self.family('domain', flags).iter_spans(text, emails, profile)
+        if 'phone' in selected:
+            yield from self.family('phone', flags).iter_spans(text, profile)
+        if 'ssn' in selected:
+            yield from self.family('ssn', flags).iter_spans(text, chains, profile)
+        if 'mac' in selected:
+            yield from self.family('mac', flags).iter_spans(text, profile)
+        if 'card' in selected:
+            yield from self.family('card', flags).iter_spans(text, chains, profile)
+
+    def detect(self, text: Text, types: Optional[Iterable[str]] = None) -> Dict[str, bool]:
+        
+        return {name: record is not None for name, record in self._iter_detections(text, select_types(types))}
+
+    def detect_first(self, text: Text, types: Optional[Iterable[str]] = None) -> Optional[MatchRecord]:
+        
+        for _, record in self._iter_detections(text, select_types(types)):
+            if record is not None:
+                return record
+        return None
+
+    def _iter_detections(self, text: Text, selected: frozenset) -> Iterator[Tuple[str, Optional[MatchRecord]]]:
+        
+        # Each family stops at its first validated match and reads the text
+        # lazily, so a hit near the start costs no more than the text up to it.
+        # The numeric families share one lazy tokenization.
+        text = as_text(text)
+        profile = TextProfile(text)
+        flags = profile.pattern_flags
+        numeric = self.ascii_numeric if flags else self.numeric
+        chains = LazyChains(numeric.iter_chains(text) if numeric.prefilter.admits(profile) else iter(()))
+        for name in FAMILIES:
+            if name not in selected:
+                continue
+            if name in NUMERIC_FAMILIES:
+                yield name, self.family(name, flags).detect(text, chains, profile)
+            else:
+                yield name, self.family(name, flags).detect(text, profile)
+
+    def _tokenize(self, text: str, profile: TextProfile) -> List[DigitChain]:
+        numeric = self.ascii_numeric if profile.pattern_flags else self.numeric
+        return numeric.tokenize(text) if numeric.prefilter.admits(profile) else []
+
+    def _find_emails(self, text: str, profile: TextProfile) -> List[re.Match]:
+        extractor = self.family('email', profile.pattern_flags).extractor
+        return extractor.find_emails(text) if extractor.prefilter.admits(profile) else []
+
+    def _extract_fused(self, text: str, selected: frozenset) -> ExtractionResult:
+        
+        profile = TextProfile(text)
+        scanner = self.ascii_scanner if profile.pattern_flags else self.scanner
+        routed = {family: scanner.join(tokens) for family, tokens in scanner.route(text).items()}
+        chains = self._tokenize(text, profile) if selected & NUMERIC_FAMILIES else []
+        emails = self._find_emails(routed['email'], profile) if 'email' in selected else None
+
+        found = {}
+        if 'email' in selected:
+            found['email'] = self.extract_emails(routed['email'], emails, profile)
+        if 'crypto' in selected:
+            found['crypto'] = self.extract_crypto_addresses(routed['crypto'], profile)
+        if 'hashes' in selected:
+            # Modular crypt strings can hold '=' and ',', which split tokens,
+            # so the password hashes come from one scan of the whole text.
+            hashes = self.family('hashes', profile.pattern_flags)
+            hash_results = self.extract_hashes(routed['hashes'], profile)
+            for hash_type in PASSWORD_HASH_TYPES:
+                hash_results.pop(hash_type, None)
+            if any(hashes.password_extractors[hash_type].prefilter.admits(profile) for hash_type in PASSWORD_HASH_TYPES):
+                password_results = hashes.mcf_dispatcher.extract_hashes(text)
+                hash_results.update((hash_type, password_results[hash_type]) for hash_type in PASSWORD_HASH_TYPES if hash_type in password_results)
+            found['hashes'] = hash_results
+        if 'ip' in selected:
+            found['ip'] = self.extract_ips(routed['ip'], chains, profile)
+        if 'domain' in selected:
+            found['domain'] = self.extract_domains(routed['email'], emails, profile) + self.extract_domains(routed['domain'], [], profile)
+        if 'phone' in selected:
+            found['phone'] = self.extract_phones(text, profile)
+        if 'ssn' in selected:
+            found['ssn'] = self.extract_ssns(text, chains, profile)
+        if 'mac' in selected:
+            found['mac'] = self.extract_macs(routed['mac'], profile)
+        if 'card' in selected:
+            found['card'] = self.extract_cards(text, chains, profile)
+        return self._merge_results(found)
+
+    @staticmethod
+    def _merge_results(found: Dict[str, object]) -> ExtractionResult:
+        
+        results = ExtractionResult()
+        if 'email' in found:
+            results['emails'] = list(set(found['email']))
+        for family in ('crypto', 'hashes'):
+            for k, v in found.get(family, {}).items():
+                results[k] = list(set(v))
+        if 'ip' in found:
+            for key in ('ipv4', 'cidr4', 'ipv6', 'cidr6'):
+                results[key] = list(set(found['ip'].get(key, [])))
+        for family, key in (('domain', 'domains'), ('phone', 'phones'), ('ssn', 'ssns'), ('mac', 'macs'), ('card', 'cards')):
+            if family in found:
+                results[key] = list(set(found[family]))
+        return results
+
+_engine = None
+_engine_lock = threading.Lock()
+
+def get_engine() -> Engine:
+    
+    global _engine
+    engine = _engine
+    if engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = Engine()
+            engine = _engine
+    return engine
+
+def configure(validation_level: str = CHARSET) -> Engine:
+    
+    # Replaces the shared engine, so that every module-level function of a
+    # deployment checks crypto addresses to the same level.
+    global _engine
+    engine = Engine(validation_level)
+    with _engine_lock:
+        _engine = engine
+    return engine
+
+def _reinit_engine_lock() -> None:
     
-    engine = CryptoExtractionEngine()
-    return engine.process_text(text)
+    global _engine_lock
+    _engine_lock = threading.Lock()
+    registry.reinit_lock()
+    if _engine is not None:
+        _engine._reinit_lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reinit_engine_lock)
+
+def extract_emails(text: str) -> List[str]:
+    
+    return get_engine().extract_emails(text)
 
 def extract_crypto_addresses(text: str) -> Dict[str, List[str]]:
     
-    engine = CryptoExtractionEngine()
-    return engine.process_text(text)
+    return get_engine().extract_crypto_addresses(text)
 
 def extract_hashes(text: str) -> Dict[str, List[str]]:
     
-    engine = HashExtractionEngine()
-    return engine.process_text(text)
+    return get_engine().extract_hashes(text)
 
 def extract_ips(text: str) -> Dict[str, List[str]]:
     
-    engine = IPExtractionEngine()
-    return engine.process_text(text)
+    return get_engine().extract_ips(text)
+
+def scan_ips(text: str) -> Dict[str, List[dict]]:
+    
+    return get_engine().scan_ips(text)
 
 def extract_domains(text: str) -> List[str]:
     
-    engine = DomainExtractionEngine()
-    return engine.process_text(text)
+    return get_engine().extract_domains(text)
 
 def extract_phones(text: str) -> List[str]:
     
-    engine = PhoneExtractionEngine()
-    return engine.process_text(text)
+    return get_engine().extract_phones(text)
 
 def extract_ssns(text: str) -> List[str]:
     
-    engine = SSNExtractionEngine()
-    return engine.process_text(text)
+    return get_engine().extract_ssns(text)
 
 def extract_macs(text: str) -> List[str]:
     
-    engine = MACExtractionEngine()
-    return engine.process_text(text)
+    return get_engine().extract_macs(text)
 
 def extract_cards(text: str) -> List[str]:
     
-    engine = CardExtractionEngine()
-    return engine.process_text(text)
-
-def extract_all(text: str) -> Dict[str, List[str]]:
-    
-    results = {}
-    results['emails'] = list(set(extract_emails(text)))
-    crypto_results = extract_crypto_addresses(text)
-    for k, v in crypto_results.items():
-        results[k] = list(set(v))
-    hash_results = extract_hashes(text)
-    for k, v in hash_results.items():
-        results[k] = list(set(v))
-    ip_results = extract_ips(text)
-    results['ipv4'] = list(set(ip_results.get('ipv4', [])))
-    results['cidr4'] = list(set(ip_results.get('cidr4', [])))
-    results['ipv6'] = list(set(ip_results.get('ipv6', [])))
-    results['cidr6'] = list(set(ip_results.get('cidr6', [])))
-    results['domains'] = list(set(extract_domains(text)))
-    results['phones'] = list(set(extract_phones(text)))
-    results['ssns'] = list(set(extract_ssns(text)))
-    results['macs'] = list(set(extract_macs(text)))
-    results['cards'] = list(set(extract_cards(text)))
-    return results
+    return get_engine().extract_cards(text)
+
+def skip_counts() -> Dict[str, int]:
+    
+    return get_engine().skip_counts()
+
+def extract(text: Text, types: Optional[Iterable[str]] = None, fused: bool = False, deadline: Optional[float] = None) -> ExtractionResult:
+    
+    return get_engine().extract(text, types=types, fused=fused, deadline=deadline)
+
+def find(text: Text, types: Optional[Iterable[str]] = None) -> List[MatchRecord]:
+    
+    return get_engine().find(text, types=types)
+
+def count(text: Text, types: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, int]]:
+    
+    return get_engine().count(text, types=types)
+
+def count_stream(chunks: Iterable[Text], types: Optional[Iterable[str]] = None, block_size: int = BLOCK_SIZE, distinct_limit: int = 1 << 14) -> Dict[str, Dict[str, int]]:
+    
+    return get_engine().count_stream(chunks, types=types, block_size=block_size, distinct_limit=distinct_limit)
+
+def scan_buffer(data: Text, types: Optional[Iterable[str]] = None) -> List[MatchRecord]:
+    
+    return get_engine().scan_buffer(data, types=types)
+
+def detect(text: Text, types: Optional[Iterable[str]] = None) -> Dict[str, bool]:
+    
+    return get_engine().detect(text, types=types)
+
+def detect_first(text: Text, types: Optional[Iterable[str]] = None) -> Optional[MatchRecord]:
+    
+    return get_engine().detect_first(text, types=types)
+
+def extract_all(text: Text, fused: bool = False, deadline: Optional[float] = None) -> ExtractionResult:
+    
+    return get_engine().extract_all(text, fused=fused, deadline=deadline)
 
 if __name__ == "__main__":
 
+    import argparse
     import sys
-    import time
 
-    if len(sys.argv) < 2:
-        print("Usage: python main.py 'text with emails, crypto addresses, hashes, IPs, domains, phones, SSNs, MACs, cards, and more'")
+    logging.basicConfig(level=logging.ERROR, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(
+        usage="python main.py [--types ip,domain] [--detect | --count | --timeout-ms MS] [--validation-level LEVEL] 'text with emails, crypto addresses, hashes, IPs, domains, phones, SSNs, MACs, cards, and more'",
+    )
+    parser.add_argument('--types', help=f"comma-separated types to extract: {', '.join(FAMILIES)} (default: all)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--detect', action='store_true', help="only report which types occur, stopping at the first match of each")
+    mode.add_argument('--count', action='store_true', help="only report the total and distinct number of matches of each type")
+    parser.add_argument('--timeout-ms', type=float, help="stop extracting after this many milliseconds and report the types left unscanned")
+    parser.add_argument('--validation-level', choices=VALIDATION_LEVELS, default=CHARSET,
+                        help="how far crypto addresses are checked: pattern only, alphabet, or checksum and version (default: charset)")
+    parser.add_argument('text', nargs='*')
+    args = parser.parse_args()
+
+    if not args.text:
+        parser.print_usage()
         sys.exit(1)
+    try:
+        types = select_types(args.types) if args.types else None
+    except ValueError as e:
+        parser.error(str(e))
+    if args.timeout_ms is not None and (args.detect or args.count):
+        parser.error("--timeout-ms only applies to extraction")
 
-    text = ' '.join(sys.argv[1:])
+    text = ' '.join(args.text)
+    configure(args.validation_level)
     start_time = time.perf_counter_ns()
-    all_extracted = extract_all(text)
-    end_time = time.perf_counter_ns()
+    if args.detect:
+        detected = detect(text, types)
+        end_time = time.perf_counter_ns()
+        print("Detected types:")
+        for name, found in detected.items():
+            print(f"  {name}: {'yes' if found else 'no'}")
+    elif args.count:
+        counts = count(text, types)
+        end_time = time.perf_counter_ns()
+        print("Match counts:")
+        for key, found in counts.items():
+            print(f"  {key}: {found['total']} ({found['distinct']} distinct)")
+    else:
+        deadline = time.monotonic() + args.timeout_ms / 1000 if args.timeout_ms is not None else None
+        all_extracted = extract(text, types, deadline=deadline)
+        end_time = time.perf_counter_ns()
+        print("Extracted items:")
+        for category, items in all_extracted.items():
+            if items:
+                print(f"{category}:")
+                for item in items:
+                    print(f"  - {item}")
+        if all_extracted.truncated:
+            print(f"TRUNCATED: skipped {', '.join(all_extracted.skipped)}")
     exec_time_microseconds = int((end_time - start_time) / 1000)
-    print("Extracted items:")
-    for category, items in all_extracted.items():
-        if items:
-            print(f"{category}:")
-            for item in items:
-                print(f"  - {item}")
     print(f"EXEC_TIME: {exec_time_microseconds}MiS")
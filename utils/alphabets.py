@@ -0,0 +1,38 @@
+class Alphabet:
+
+
+    def __init__(self, chars: str):
+
+        self.chars = chars
+        # bytes.translate deletes every member in one C pass; a string is
+        # valid when nothing is left over.
+        self.members = chars.encode('ascii')
+
+    def matches(self, s: str) -> bool:
+
+        return s.isascii() and not s.encode('ascii').translate(None, self.members)
+
+HEX = Alphabet('0123456789abcdefABCDEF')
+DIGITS = Alphabet('0123456789')
+BASE32 = Alphabet('ABCDEFGHIJKLMNOPQRSTUVWXYZ234567')
+BASE58 = Alphabet('123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz')
+# The same characters as BASE58 in the order Ripple encodes them.
+RIPPLE58 = Alphabet('rpshnaf39wBUDNEGHJKLM4PQRST7VWXYZ2bcdeCg65jkm8oFqi1tuvAxyz')
+BECH32 = Alphabet('qpzry9x8gf2tvdw0s3jn54khce6mua7l')
+# bcrypt, SHA-crypt and passlib's adapted base64 share this alphabet; Argon2
+# and scrypt use standard base64 without padding.
+CRYPT64 = Alphabet('./0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz')
+BASE64 = Alphabet('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/')
+
+class HexValidator:
+
+
+    @staticmethod
+    def is_valid_hex(s: str) -> bool:
+
+        return HEX.matches(s)
+
+    @staticmethod
+    def is_potential_hash(s: str, expected_length: int) -> bool:
+
+        return len(s) == expected_length and HEX.matches(s)
@@ -1,5 +1,20 @@
-import re
-from typing import List
+from typing import Dict, Iterator, List, Optional, Tuple
+from utils.matches import with_context
+from utils.numeric import DigitChain, NumericShape, NumericTokenizer
+from utils.prefilter import Prefilter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Every second digit from the right is doubled, less 9 when above 9.
+DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+SEQUENTIAL = '0123456789' * 2
+TEST_CARDS = frozenset(('4111111111111111', '5555555555554444', '378282246310005'))
+# Below this many same-length candidates the NumPy setup costs more than the
+# Python checks it replaces.
+BATCH_MIN = 8
 
 class LuhnValidator:
     
@@ -10,48 +25,76 @@ class LuhnValidator:
         if not card_num.isdigit():
             return False
 
-        digits = [int(d) for d in card_num[::-1]]  
+        total = sum(map(int, card_num[-1::-2])) + sum(DOUBLED[int(d)] for d in card_num[-2::-2])
+        return total % 10 == 0
 
-        for i in range(1, len(digits), 2):
-            digits[i] *= 2
-            if digits[i] > 9:
-                digits[i] -= 9
-
-        return sum(digits) % 10 == 0
+    @staticmethod
+    def card_mask(cards: List[str]) -> List[bool]:
+
+        # Luhn, all-same-digit and sequential checks for ASCII digit strings
+        # of one length, one row of a digit matrix per card.
+        length = len(cards[0])
+        digits = (numpy.frombuffer(''.join(cards).encode('ascii'), dtype=numpy.uint8) - 48).reshape(len(cards), length)
+        kept = digits[:, length - 1::-2].sum(axis=1)
+        doubled = numpy.array(DOUBLED, dtype=numpy.uint8)[digits[:, length - 2::-2]].sum(axis=1)
+        valid = (kept + doubled) % 10 == 0
+        valid &= ~(digits == digits[:, :1]).all(axis=1)
+        sequential = numpy.frombuffer(SEQUENTIAL[:length].encode('ascii'), dtype=numpy.uint8) - 48
+        valid &= ~(digits == sequential).all(axis=1)
+        return valid.tolist()
 
 class CardExtractor:
     
 
-    def __init__(self):
-        
-        self.single_word_pattern = re.compile(r'\b\d{13,19}\b')  
-        self.dash_pattern = re.compile(r'\b\d{4}(?:-\d{4}){3}\b')  
-        self.space_pattern = re.compile(r'\b\d{4}(?: \d{4}){3}\b')  
-
-    def extract_cards(self, text: str) -> List[str]:
-        
-        cards = set()
-
-        
-        cards.update(self._extract_from_pattern(text, self.single_word_pattern))
-        cards.update(self._extract_from_pattern(text, self.dash_pattern))
-        cards.update(self._extract_from_pattern(text, self.space_pattern))
-
-        return list(cards)
-
-    def _extract_from_pattern(self, text: str, pattern: re.Pattern) -> List[str]:
-        
-        matches = pattern.findall(text)
-        validated = []
-        for match in matches:
-            clean_card = self._clean_card_number(match)
-            if self._validate_card(clean_card):
-                validated.append(clean_card)
-        return validated
-
-    def _clean_card_number(self, card: str) -> str:
-        
-        return re.sub(r'[^\d]', '', card)
+    def __init__(self, flags: int = 0):
+        
+        self.tokenizer = NumericTokenizer(flags)
+        self.single_shape = NumericShape(((13, 19),), '')
+        self.dash_shape = NumericShape(((4, 4),) * 4, '---')
+        self.space_shape = NumericShape(((4, 4),) * 4, '   ')
+        self.prefilter = Prefilter(min_digits=13)
+
+    def extract_cards(self, text: str, chains: Optional[List[DigitChain]] = None) -> List[str]:
+        
+        return list({card for _, _, card in self.iter_spans(text, chains)})
+
+    def iter_spans(self, text: str, chains: Optional[List[DigitChain]] = None) -> Iterator[Tuple[int, int, str]]:
+
+        if chains is None:
+            chains = self.tokenizer.tokenize(text)
+        spans = [
+            (start, end, ''.join(groups))
+            for shape in (self.single_shape, self.dash_shape, self.space_shape)
+            for start, end, groups in self.tokenizer.iter_sequences(chains, shape)
+        ]
+        for (start, end, card), valid in zip(spans, self.validate_cards([card for _, _, card in spans])):
+            if valid:
+                yield start, end, card
+
+    def validate_cards(self, cards: List[str]) -> List[bool]:
+
+        # Same verdicts as _validate_card; with NumPy, candidates of one
+        # length are checked together.
+        if numpy is None or len(cards) < BATCH_MIN:
+            return [self._validate_card(card) for card in cards]
+
+        groups: Dict[int, List[int]] = {}
+        mask = [False] * len(cards)
+        for i, card in enumerate(cards):
+            if 13 <= len(card) <= 19 and card.isascii() and card.isdigit():
+                groups.setdefault(len(card), []).append(i)
+            else:
+                mask[i] = self._validate_card(card)
+        for indices in groups.values():
+            group = [cards[i] for i in indices]
+            if len(group) < BATCH_MIN:
+                mask_group = [self._validate_card(card) for card in group]
+            else:
+                mask_group = LuhnValidator.card_mask(group)
+            for i, card, valid in zip(indices, group, mask_group):
+                if valid:
+                    mask[i] = card not in TEST_CARDS and self._is_valid_bin(card[:6])
+        return mask
 
     def _validate_card(self, card: str) -> bool:
         
@@ -68,15 +111,15 @@ class CardExtractor:
 
         
         
-        if card in ['4111111111111111', '5555555555554444', '378282246310005']:
+        if card in TEST_CARDS:
             return False  
 
         
-        if card == ''.join(str(i % 10) for i in range(length)):
+        if card == SEQUENTIAL[:length]:
             return False
 
         
-        if len(set(card)) == 1:
+        if card.count(card[0]) == length:
             return False
 
         
@@ -115,28 +158,4 @@ class CardExtractor:
 
     def extract_cards_with_context(self, text: str) -> List[dict]:
         
-        results = []
-        all_patterns = [self.single_word_pattern, self.dash_pattern, self.space_pattern]
-
-        for pattern in all_patterns:
-            for match in pattern.finditer(text):
-                card = match.group()
-                clean_card = self._clean_card_number(card)
-                if self._validate_card(clean_card):
-                    start = max(0, match.start() - 50)
-                    end = min(len(text), match.end() + 50)
-                    context = text[start:end]
-                    results.append({
-                        'card': clean_card,
-                        'context': context
-                    })
-
-        
-        seen = set()
-        unique_results = []
-        for result in unique_results:
-            if result['card'] not in seen:
-                seen.add(result['card'])
-                unique_results.append(result)
-
-        return unique_results
\ No newline at end of file
+        return with_context(text, self.iter_spans(text), 'card', 50, unique=True)
@@ -0,0 +1,120 @@
+import math
+import threading
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+SKETCH_BITS = 14
+SKETCH_SIZE = 1 << SKETCH_BITS
+HASH_MASK = (1 << 64) - 1
+
+class DistinctCounter:
+
+
+    __slots__ = ('limit', '_values', '_registers')
+
+    def __init__(self, limit: Optional[int] = 1 << 14):
+        # With no limit the values are always kept exactly.
+        self.limit = limit
+        self._values: Optional[Set[str]] = set()
+        self._registers: Optional[bytearray] = None
+
+    @property
+    def exact(self) -> bool:
+        return self._values is not None
+
+    def add(self, value: str) -> None:
+
+        values = self._values
+        if values is not None:
+            values.add(value)
+            if self.limit is not None and len(values) > self.limit:
+                self._to_sketch()
+        else:
+            self._add_hash(hash(value))
+
+    def _to_sketch(self) -> None:
+
+        # Past the limit the values are replaced by a HyperLogLog sketch of
+        # 2**14 one-byte registers (about 0.8% standard error), so memory
+        # stays bounded however many distinct values a stream holds.
+        self._registers = bytearray(SKETCH_SIZE)
+        values, self._values = self._values, None
+        for value in values:
+            self._add_hash(hash(value))
+
+    def _add_hash(self, value_hash: int) -> None:
+
+        value_hash &= HASH_MASK
+        index = value_hash >> (64 - SKETCH_BITS)
+        rank = 65 - SKETCH_BITS - (value_hash & ((1 << (64 - SKETCH_BITS)) - 1)).bit_length()
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def __len__(self) -> int:
+
+        if self._values is not None:
+            return len(self._values)
+        registers = self._registers
+        alpha = 0.7213 / (1 + 1.079 / SKETCH_SIZE)
+        estimate = alpha * SKETCH_SIZE * SKETCH_SIZE / sum(2.0 ** -rank for rank in registers)
+        zeros = registers.count(0)
+        if estimate <= 2.5 * SKETCH_SIZE and zeros:
+            estimate = SKETCH_SIZE * math.log(SKETCH_SIZE / zeros)
+        return round(estimate)
+
+class MatchCounter:
+
+
+    __slots__ = ('limit', 'totals', 'distinct')
+
+    def __init__(self, limit: Optional[int] = 1 << 14):
+        self.limit = limit
+        self.totals: Dict[str, int] = {}
+        self.distinct: Dict[str, DistinctCounter] = {}
+
+    def update(self, spans: Iterable[Tuple[str, int, int, str]]) -> None:
+
+        totals = self.totals
+        distinct = self.distinct
+        for key, _, _, value in spans:
+            counter = distinct.get(key)
+            if counter is None:
+                counter = distinct[key] = DistinctCounter(self.limit)
+                totals[key] = 0
+            totals[key] += 1
+            counter.add(value)
+
+    def counts(self) -> Dict[str, Dict[str, int]]:
+
+        return {key: {'total': total, 'distinct': len(self.distinct[key])} for key, total in self.totals.items()}
+
+class CallCounts:
+
+
+    __slots__ = ('calls', 'skips', '_lock')
+
+    def __init__(self, names: Iterable[str]):
+        # An extraction family is shared by every thread using its engine,
+        # and += on a shared int or dict entry can lose updates, so every
+        # update holds the lock.
+        self.calls = 0
+        self.skips: Dict[str, int] = dict.fromkeys(names, 0)
+        self._lock = threading.Lock()
+
+    def call(self) -> None:
+
+        with self._lock:
+            self.calls += 1
+
+    def skip(self, name: str) -> None:
+
+        with self._lock:
+            self.skips[name] += 1
+
+    def skip_counts(self) -> Dict[str, int]:
+
+        with self._lock:
+            return dict(self.skips)
+
+    def reinit_lock(self) -> None:
+
+        self._lock = threading.Lock()
@@ -1,38 +1,26 @@
 import re
-from typing import List, Set
-
-class Base58Validator:
-    
-    ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-
-    @staticmethod
-    def is_valid_base58(s: str) -> bool:
-        if not s or s[0] in '0OIl':
-            return False
-        return all(c in Base58Validator.ALPHABET for c in s)
-
-class Bech32Validator:
-    
-    CHARSET = 'qpzry9x8gf2tvdw0s3jn54khce6mua7l'
-
-    @staticmethod
-    def is_valid_bech32(s: str, hrp: str) -> bool:
-        if not s.startswith(hrp + '1'):
-            return False
-        data = s[len(hrp) + 1:]
-        if len(data) < 6 or not all(c in Bech32Validator.CHARSET for c in data):
-            return False
-        
-        return len(data) <= 90
+from typing import Iterator, List, Set, Tuple
+from utils.prefilter import Prefilter
+from utils.cryptos.encoding import AddressValidator, Bech32AddressValidator
+from utils.validation import CHARSET
 
 class BitcoinExtractor:
     
 
-    def __init__(self):
-        self.p2pkh_pattern = re.compile(r'\b1[1-9A-HJ-NP-Za-km-z]{25,34}\b')
-        self.p2sh_pattern = re.compile(r'\b3[1-9A-HJ-NP-Za-km-z]{25,34}\b')
-        self.bech32_pattern = re.compile(r'\bbc1[a-z0-9]{20,40}\b')
-        self.taproot_pattern = re.compile(r'\bbc1p[a-z0-9]{58}\b')
+    candidate_rules = (
+        ('1', 26, 35, 'extract_p2pkh'),
+        ('3', 26, 35, 'extract_p2sh'),
+        ('bc1', 23, 43, 'extract_bech32'),
+        ('bc1p', 62, 62, 'extract_taproot'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.p2pkh_pattern = re.compile(r'\b1[1-9A-HJ-NP-Za-km-z]{25,34}\b', flags)
+        self.p2sh_pattern = re.compile(r'\b3[1-9A-HJ-NP-Za-km-z]{25,34}\b', flags)
+        self.bech32_pattern = re.compile(r'\bbc1[a-z0-9]{20,40}\b', flags)
+        self.taproot_pattern = re.compile(r'\bbc1p[a-z0-9]{58}\b', flags)
+        self.base58 = AddressValidator(validation_level, versions=(0, 5))
+        self.bech32 = Bech32AddressValidator(validation_level, 'bc')
 
     def extract_addresses(self, text: str) -> List[str]:
         addresses = set()
@@ -52,25 +40,36 @@ class BitcoinExtractor:
 
     def extract_bech32(self, text: str) -> List[str]:
         matches = self.bech32_pattern.findall(text)
-        return [m for m in matches if Bech32Validator.is_valid_bech32(m, 'bc')]
+        return [m for m in matches if self.bech32.is_valid(m)]
 
     def extract_taproot(self, text: str) -> List[str]:
         matches = self.taproot_pattern.findall(text)
-        return [m for m in matches if Bech32Validator.is_valid_bech32(m, 'bc') and m.startswith('bc1p')]
+        return [m for m in matches if self.bech32.is_valid(m) and m.startswith('bc1p')]
 
     def _validate_p2pkh(self, addr: str) -> bool:
-        return len(addr) >= 26 and len(addr) <= 35 and Base58Validator.is_valid_base58(addr)
+        return len(addr) >= 26 and len(addr) <= 35 and self.base58.is_valid(addr)
 
     def _validate_p2sh(self, addr: str) -> bool:
-        return len(addr) >= 26 and len(addr) <= 35 and Base58Validator.is_valid_base58(addr)
+        return len(addr) >= 26 and len(addr) <= 35 and self.base58.is_valid(addr)
 
 class BitcoinCashExtractor:
     
 
-    def __init__(self):
+    candidate_rules = (
+        ('q', 42, 42, 'extract_cashaddr'),
+        ('p', 42, 42, 'extract_cashaddr'),
+        ('Q', 42, 42, 'extract_cashaddr'),
+        ('P', 42, 42, 'extract_cashaddr'),
+        ('1', 26, 35, 'extract_legacy'),
+        ('3', 26, 35, 'extract_legacy'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
         
-        self.cashaddr_pattern = re.compile(r'\b(bitcoincash:)?[qp][a-z0-9]{41}\b', re.IGNORECASE)
-        self.legacy_pattern = re.compile(r'\b[13][a-km-zA-HJ-NP-Z1-9]{25,34}\b')
+        self.cashaddr_pattern = re.compile(r'\b(bitcoincash:)?[qp][a-z0-9]{41}\b', re.IGNORECASE | flags)
+        self.scheme_pattern = re.compile(r'\bbitcoincash:\Z', re.IGNORECASE | flags)
+        self.legacy_pattern = re.compile(r'\b[13][a-km-zA-HJ-NP-Z1-9]{25,34}\b', flags)
+        self.base58 = AddressValidator(validation_level, versions=(0, 5))
 
     def extract_addresses(self, text: str) -> List[str]:
         addresses = set()
@@ -79,7 +78,7 @@ class BitcoinCashExtractor:
         return list(addresses)
 
     def extract_cashaddr(self, text: str) -> List[str]:
-        matches = self.cashaddr_pattern.findall(text)
+        matches = [m.group() for m in self.cashaddr_pattern.finditer(text)]
         return [m for m in matches if self._validate_cashaddr(m)]
 
     def extract_legacy(self, text: str) -> List[str]:
@@ -91,15 +90,23 @@ class BitcoinCashExtractor:
         return len(addr) > 10 and ':' in addr or addr.startswith(('q', 'p'))
 
     def _validate_legacy(self, addr: str) -> bool:
-        return len(addr) >= 26 and len(addr) <= 35 and Base58Validator.is_valid_base58(addr)
+        return len(addr) >= 26 and len(addr) <= 35 and self.base58.is_valid(addr)
 
 class BitcoinSVExtractor:
     
 
-    def __init__(self):
-        self.p2pkh_pattern = re.compile(r'\b1[1-9A-HJ-NP-Za-km-z]{25,34}\b')
-        self.p2sh_pattern = re.compile(r'\b3[1-9A-HJ-NP-Za-km-z]{25,34}\b')
-        self.bech32_pattern = re.compile(r'\bbc1[a-z0-9]{20,40}\b')
+    candidate_rules = (
+        ('1', 26, 35, 'extract_p2pkh'),
+        ('3', 26, 35, 'extract_p2sh'),
+        ('bc1', 23, 43, 'extract_bech32'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.p2pkh_pattern = re.compile(r'\b1[1-9A-HJ-NP-Za-km-z]{25,34}\b', flags)
+        self.p2sh_pattern = re.compile(r'\b3[1-9A-HJ-NP-Za-km-z]{25,34}\b', flags)
+        self.bech32_pattern = re.compile(r'\bbc1[a-z0-9]{20,40}\b', flags)
+        self.base58 = AddressValidator(validation_level, versions=(0, 5))
+        self.bech32 = Bech32AddressValidator(validation_level, 'bc')
 
     def extract_addresses(self, text: str) -> List[str]:
         addresses = set()
@@ -110,22 +117,29 @@ class BitcoinSVExtractor:
 
     def extract_p2pkh(self, text: str) -> List[str]:
         matches = self.p2pkh_pattern.findall(text)
-        return [m for m in matches if len(m) >= 26 and len(m) <= 35 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) >= 26 and len(m) <= 35 and self.base58.is_valid(m)]
 
     def extract_p2sh(self, text: str) -> List[str]:
         matches = self.p2sh_pattern.findall(text)
-        return [m for m in matches if len(m) >= 26 and len(m) <= 35 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) >= 26 and len(m) <= 35 and self.base58.is_valid(m)]
 
     def extract_bech32(self, text: str) -> List[str]:
         matches = self.bech32_pattern.findall(text)
-        return [m for m in matches if Bech32Validator.is_valid_bech32(m, 'bc')]
+        return [m for m in matches if self.bech32.is_valid(m)]
 
 class BitcoinGoldExtractor:
     
 
-    def __init__(self):
-        self.p2pkh_pattern = re.compile(r'\b[AG][1-9A-HJ-NP-Za-km-z]{25,34}\b')  
-        self.p2sh_pattern = re.compile(r'\b[8][1-9A-HJ-NP-Za-km-z]{25,34}\b')
+    candidate_rules = (
+        ('A', 26, 35, 'extract_p2pkh'),
+        ('G', 26, 35, 'extract_p2pkh'),
+        ('8', 26, 35, 'extract_p2sh'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.p2pkh_pattern = re.compile(r'\b[AG][1-9A-HJ-NP-Za-km-z]{25,34}\b', flags)  
+        self.p2sh_pattern = re.compile(r'\b[8][1-9A-HJ-NP-Za-km-z]{25,34}\b', flags)
+        self.base58 = AddressValidator(validation_level, versions=(38, 23))
 
     def extract_addresses(self, text: str) -> List[str]:
         addresses = set()
@@ -135,18 +149,26 @@ class BitcoinGoldExtractor:
 
     def extract_p2pkh(self, text: str) -> List[str]:
         matches = self.p2pkh_pattern.findall(text)
-        return [m for m in matches if len(m) >= 26 and len(m) <= 35 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) >= 26 and len(m) <= 35 and self.base58.is_valid(m)]
 
     def extract_p2sh(self, text: str) -> List[str]:
         matches = self.p2sh_pattern.findall(text)
-        return [m for m in matches if len(m) >= 26 and len(m) <= 35 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) >= 26 and len(m) <= 35 and self.base58.is_valid(m)]
 
 class NamecoinExtractor:
     
 
-    def __init__(self):
-        self.p2pkh_pattern = re.compile(r'\b[NM][1-9A-HJ-NP-Za-km-z]{25,34}\b')  
-        self.namecoin_specific_pattern = re.compile(r'\bid-[a-z0-9]+\b', re.IGNORECASE)  
+    candidate_rules = (
+        ('N', 26, 35, 'extract_p2pkh'),
+        ('M', 26, 35, 'extract_p2pkh'),
+    )
+    candidate_text_scans = ('iter_namecoin_id_spans',)
+    text_scan_prefilter = Prefilter(literals=('-',))
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.p2pkh_pattern = re.compile(r'\b[NM][1-9A-HJ-NP-Za-km-z]{25,34}\b', flags)  
+        self.namecoin_specific_pattern = re.compile(r'\bid-[a-z0-9]+\b', re.IGNORECASE | flags)  
+        self.base58 = AddressValidator(validation_level, versions=(52, 13))
 
     def extract_addresses(self, text: str) -> List[str]:
         addresses = set()
@@ -156,11 +178,15 @@ class NamecoinExtractor:
 
     def extract_p2pkh(self, text: str) -> List[str]:
         matches = self.p2pkh_pattern.findall(text)
-        return [m for m in matches if len(m) >= 26 and len(m) <= 35 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) >= 26 and len(m) <= 35 and self.base58.is_valid(m)]
 
     def extract_namecoin_ids(self, text: str) -> List[str]:
-        matches = self.namecoin_specific_pattern.findall(text)
-        return [m for m in matches if self._validate_namecoin_id(m)]
+        return [m for _, _, m in self.iter_namecoin_id_spans(text)]
+
+    def iter_namecoin_id_spans(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        for match in self.namecoin_specific_pattern.finditer(text):
+            if self._validate_namecoin_id(match.group()):
+                yield match.start(), match.end(), match.group()
 
     def _validate_namecoin_id(self, addr: str) -> bool:
         return addr.startswith('id-') and len(addr) > 3
\ No newline at end of file
@@ -1,22 +1,22 @@
 import re
 from typing import List
-
-class Base58Validator:
-    
-    ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-
-    @staticmethod
-    def is_valid_base58(s: str) -> bool:
-        if not s or s[0] in '0OIl':
-            return False
-        return all(c in Base58Validator.ALPHABET for c in s)
+from utils.cryptos.encoding import AddressValidator, Bech32AddressValidator
+from utils.validation import CHARSET
 
 class CardanoExtractor:
     
 
-    def __init__(self):
-        self.mainnet_pattern = re.compile(r'\baddr1[a-z0-9]{98}\b')
-        self.testnet_pattern = re.compile(r'\baddr_test1[a-z0-9]{98}\b')
+    candidate_rules = (
+        ('addr1', 103, 103, 'extract_mainnet'),
+        ('addr_test1', 108, 108, 'extract_testnet'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.mainnet_pattern = re.compile(r'\baddr1[a-z0-9]{98}\b', flags)
+        self.testnet_pattern = re.compile(r'\baddr_test1[a-z0-9]{98}\b', flags)
+        # Shelley addresses are Bech32 without the 90-character limit.
+        self.mainnet_bech32 = Bech32AddressValidator(validation_level, 'addr', segwit=False, max_data_length=98)
+        self.testnet_bech32 = Bech32AddressValidator(validation_level, 'addr_test', segwit=False, max_data_length=98)
 
     def extract_addresses(self, text: str) -> List[str]:
         addresses = set()
@@ -26,19 +26,28 @@ class CardanoExtractor:
 
     def extract_mainnet(self, text: str) -> List[str]:
         matches = self.mainnet_pattern.findall(text)
-        return [m for m in matches if len(m) == 103]  
+        return [m for m in matches if len(m) == 103 and self.mainnet_bech32.is_valid(m)]
 
     def extract_testnet(self, text: str) -> List[str]:
         matches = self.testnet_pattern.findall(text)
-        return [m for m in matches if len(m) == 109]  
+        return [m for m in matches if len(m) == 108 and self.testnet_bech32.is_valid(m)]
 
 class TezosExtractor:
     
 
-    def __init__(self):
-        self.tz1_pattern = re.compile(r'\btz1[1-9A-HJ-NP-Za-km-z]{33}\b')
-        self.tz2_pattern = re.compile(r'\btz2[1-9A-HJ-NP-Za-km-z]{33}\b')
-        self.tz3_pattern = re.compile(r'\btz3[1-9A-HJ-NP-Za-km-z]{33}\b')
+    candidate_rules = (
+        ('tz1', 36, 36, 'extract_tz1'),
+        ('tz2', 36, 36, 'extract_tz2'),
+        ('tz3', 36, 36, 'extract_tz3'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.tz1_pattern = re.compile(r'\btz1[1-9A-HJ-NP-Za-km-z]{33}\b', flags)
+        self.tz2_pattern = re.compile(r'\btz2[1-9A-HJ-NP-Za-km-z]{33}\b', flags)
+        self.tz3_pattern = re.compile(r'\btz3[1-9A-HJ-NP-Za-km-z]{33}\b', flags)
+        self.tz1_base58 = AddressValidator(validation_level, versions=(b'\x06\xa1\x9f',), payload_length=23)
+        self.tz2_base58 = AddressValidator(validation_level, versions=(b'\x06\xa1\xa1',), payload_length=23)
+        self.tz3_base58 = AddressValidator(validation_level, versions=(b'\x06\xa1\xa4',), payload_length=23)
 
     def extract_addresses(self, text: str) -> List[str]:
         addresses = set()
@@ -49,12 +58,12 @@ class TezosExtractor:
 
     def extract_tz1(self, text: str) -> List[str]:
         matches = self.tz1_pattern.findall(text)
-        return [m for m in matches if len(m) == 36 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) == 36 and self.tz1_base58.is_valid(m)]
 
     def extract_tz2(self, text: str) -> List[str]:
         matches = self.tz2_pattern.findall(text)
-        return [m for m in matches if len(m) == 36 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) == 36 and self.tz2_base58.is_valid(m)]
 
     def extract_tz3(self, text: str) -> List[str]:
         matches = self.tz3_pattern.findall(text)
-        return [m for m in matches if len(m) == 36 and Base58Validator.is_valid_base58(m)]
\ No newline at end of file
+        return [m for m in matches if len(m) == 36 and self.tz3_base58.is_valid(m)]
\ No newline at end of file
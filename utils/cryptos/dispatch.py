@@ -0,0 +1,109 @@
+import re
+from typing import Dict, Iterator, List, Tuple
+from utils.prefilter import AnyPrefilter, Prefilter
+
+# How far before a token a scheme prefix such as 'bitcoincash:' may start.
+SCHEME_REACH = 32
+
+class CryptoCandidateDispatcher:
+
+
+    def __init__(self, extractors: Dict[str, object], flags: int = 0):
+        self.coin_names = list(extractors)
+        self.rules: Dict[str, List[tuple]] = {}
+        self.text_scans: List[tuple] = []
+        self.scheme_leads = set()
+        self.prefilters: Dict[str, object] = {}
+
+        lengths = []
+        for coin, extractor in extractors.items():
+            scheme = getattr(extractor, 'scheme_pattern', None)
+            runs = []
+            for prefix, min_length, max_length, method in extractor.candidate_rules:
+                self.rules.setdefault(prefix[0], []).append(
+                    (prefix, min_length, max_length, coin, getattr(extractor, method), scheme)
+                )
+                lengths += [min_length, max_length]
+                # Any '_' in the prefix ends the alphanumeric run early.
+                runs.append(min_length - prefix.rfind('_') - 1)
+                if scheme is not None:
+                    self.scheme_leads.add(prefix[0])
+            self.prefilters[coin] = Prefilter(min_alnum_run=min(runs))
+            for method in getattr(extractor, 'candidate_text_scans', ()):
+                self.text_scans.append((coin, getattr(extractor, method)))
+            if hasattr(extractor, 'text_scan_prefilter'):
+                self.prefilters[coin] = AnyPrefilter(self.prefilters[coin], extractor.text_scan_prefilter)
+
+        # Every address pattern is a run of word characters between \b
+        # anchors, so a candidate is always one whole word of plausible length.
+        self.token_lengths = (min(lengths), max(lengths))
+        self.token_pattern = re.compile(rf'(?<!\w)\w{{{min(lengths)},{max(lengths)}}}(?!\w)', flags)
+
+    def classify(self, text: str, match: re.Match) -> List[Tuple[int, str, str]]:
+
+        token = match.group()
+        rules = self.rules.get(token[0])
+        if not rules:
+            return []
+
+        length = len(token)
+        found = []
+        for prefix, min_length, max_length, coin, method, scheme in rules:
+            if length < min_length or length > max_length or not token.startswith(prefix):
+                continue
+            candidate = token
+            if scheme is not None:
+                start = match.start()
+                head = scheme.search(text, max(0, start - SCHEME_REACH), start)
+                if head:
+                    candidate = text[head.start():match.end()]
+            for address in method(candidate):
+                # Offsets are kept relative to the token, so cached results
+                # fit every occurrence of it.
+                offset = candidate.find(address)
+                found.append((offset - len(candidate) + length if offset >= 0 else 0, coin, address))
+        return found
+
+    def iter_spans(self, text: str) -> Iterator[Tuple[int, int, str, str]]:
+
+        yield from self.iter_token_spans(text)
+        for coin, method in self.text_scans:
+            for start, end, address in method(text):
+                yield start, end, coin, address
+
+    def iter_token_spans(self, text: str) -> Iterator[Tuple[int, int, str, str]]:
+
+        cache: Dict[str, List[Tuple[int, str, str]]] = {}
+        for match in self.token_pattern.finditer(text):
+            token = match.group()
+            # Scheme-prefixed forms depend on the surrounding text.
+            if token[0] in self.scheme_leads:
+                found = self.classify(text, match)
+            else:
+                found = cache.get(token)
+                if found is None:
+                    found = cache[token] = self.classify(text, match)
+            for offset, coin, address in found:
+                start = match.start() + offset
+                yield start, start + len(address), coin, address
+
+    def iter_candidates(self, text: str) -> Iterator[Tuple[str, str]]:
+
+        for _, _, coin, address in self.iter_spans(text):
+            yield coin, address
+
+    def extract_candidates(self, text: str) -> List[dict]:
+
+        coins_by_address: Dict[str, List[str]] = {}
+        for coin, address in self.iter_candidates(text):
+            coins = coins_by_address.setdefault(address, [])
+            if coin not in coins:
+                coins.append(coin)
+        return [{'address': address, 'coins': coins} for address, coins in coins_by_address.items()]
+
+    def extract_addresses(self, text: str) -> Dict[str, List[str]]:
+
+        by_coin: Dict[str, set] = {coin: set() for coin in self.coin_names}
+        for coin, address in self.iter_candidates(text):
+            by_coin[coin].add(address)
+        return {coin: list(addresses) for coin, addresses in by_coin.items() if addresses}
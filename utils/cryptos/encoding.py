@@ -0,0 +1,255 @@
+import base64
+import binascii
+import hashlib
+from functools import lru_cache
+from typing import Optional, Tuple
+from utils.alphabets import BASE32, BASE58, BECH32, RIPPLE58
+from utils.cryptos.keccak import keccak_256
+from utils.validation import CHARSET, CHECKSUM, SHAPE, check_validation_level
+
+# Decoded tokens kept per codec. Addresses recur across a feed, and a token
+# that failed its checksum once is rejected again without decoding.
+DECODE_CACHE_SIZE = 1 << 16
+
+# Bech32 checks a BCH code over 5-bit values. POLYMOD_TABLE[top] is the
+# generator XOR for the five bits shifted out of the checksum state by one
+# value, PAIR_TABLE the same for the ten bits shifted out by two values, and
+# BECH32_VALUES maps each byte to its 5-bit value (0xFF outside the charset).
+BECH32_CONST = 1
+BECH32M_CONST = 0x2bc830a3
+GENERATOR = (0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3)
+
+def _polymod_table(steps: int) -> tuple:
+
+    table = []
+    for top in range(1 << (5 * steps)):
+        state = top << (30 - 5 * steps)
+        for _ in range(steps):
+            shifted = state >> 25
+            state = (state & 0x1ffffff) << 5
+            for bit, generator in enumerate(GENERATOR):
+                if shifted >> bit & 1:
+                    state ^= generator
+        table.append(state)
+    return tuple(table)
+
+POLYMOD_TABLE = _polymod_table(1)
+PAIR_TABLE = _polymod_table(2)
+BECH32_VALUES = bytes(BECH32.chars.find(chr(byte)) & 0xFF for byte in range(256))
+
+class Base58Validator:
+    
+    ALPHABET = BASE58.chars
+
+    @staticmethod
+    def is_valid_base58(s: str) -> bool:
+        if not s or s[0] in '0OIl':
+            return False
+        return BASE58.matches(s)
+
+class Bech32Validator:
+    
+    CHARSET = BECH32.chars
+
+    @staticmethod
+    def is_valid_bech32(s: str, hrp: str) -> bool:
+        if not s.startswith(hrp + '1'):
+            return False
+        data = s[len(hrp) + 1:]
+        if len(data) < 6 or not BECH32.matches(data):
+            return False
+        return len(data) <= 90
+
+    @staticmethod
+    def polymod(state: int, values: bytes) -> int:
+        if len(values) & 1:
+            state = ((state & 0x1ffffff) << 5) ^ values[0] ^ POLYMOD_TABLE[state >> 25]
+            values = values[1:]
+        table = PAIR_TABLE
+        pairs = iter(values)
+        for high, low in zip(pairs, pairs):
+            state = ((state & 0xfffff) << 10) ^ (high << 5 | low) ^ table[state >> 20]
+        return state
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def hrp_state(hrp: str) -> int:
+        # The checksum state after the expanded human-readable part, which
+        # every address with that prefix shares.
+        expanded = bytes([ord(c) >> 5 for c in hrp] + [0] + [ord(c) & 31 for c in hrp])
+        return Bech32Validator.polymod(1, expanded)
+
+    @staticmethod
+    @lru_cache(maxsize=DECODE_CACHE_SIZE)
+    def checksum_constant(s: str, hrp: str) -> int:
+        # BECH32_CONST or BECH32M_CONST for a valid checksum; any other value
+        # (0 for a character outside the charset) otherwise.
+        values = s[len(hrp) + 1:].encode('ascii', 'replace').translate(BECH32_VALUES)
+        if 0xFF in values:
+            return 0
+        return Bech32Validator.polymod(Bech32Validator.hrp_state(hrp), values)
+
+class Base32Validator:
+    
+    ALPHABET = BASE32.chars
+
+    @staticmethod
+    def is_valid_base32(s: str) -> bool:
+        return BASE32.matches(s)
+
+class Base58Check:
+
+
+    def __init__(self, alphabet: str):
+
+        self.alphabet = alphabet
+        self.digits = {c: i for i, c in enumerate(alphabet)}
+        self.decode = lru_cache(maxsize=DECODE_CACHE_SIZE)(self._decode)
+
+    def _decode(self, s: str) -> Optional[bytes]:
+
+        # The payload with its version bytes, or None when the last four
+        # bytes are not the start of its double SHA-256.
+        digits = self.digits
+        n = 0
+        for c in s:
+            digit = digits.get(c)
+            if digit is None:
+                return None
+            n = n * 58 + digit
+        zeros = len(s) - len(s.lstrip(self.alphabet[0]))
+        raw = bytes(zeros) + n.to_bytes((n.bit_length() + 7) // 8, 'big')
+        payload, check = raw[:-4], raw[-4:]
+        if not payload or hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4] != check:
+            return None
+        return payload
+
+class MoneroBase58:
+
+
+    # Monero encodes every 8 bytes as 11 characters; a shorter last block
+    # takes the number of characters listed here for its size in bytes.
+    BLOCK_SIZES = {0: 0, 2: 1, 3: 2, 5: 3, 6: 4, 7: 5, 9: 6, 10: 7, 11: 8}
+
+    def __init__(self):
+
+        self.digits = {c: i for i, c in enumerate(BASE58.chars)}
+        self.decode = lru_cache(maxsize=DECODE_CACHE_SIZE)(self._decode)
+
+    def _decode(self, s: str) -> Optional[bytes]:
+
+        # The payload, or None when the last four bytes are not the start of
+        # its Keccak-256.
+        digits = self.digits
+        raw = bytearray()
+        for start in range(0, len(s), 11):
+            block = s[start:start + 11]
+            size = self.BLOCK_SIZES.get(len(block))
+            n = 0
+            for c in block:
+                digit = digits.get(c)
+                if digit is None:
+                    return None
+                n = n * 58 + digit
+            if size is None or n >> (8 * size):
+                return None
+            raw += n.to_bytes(size, 'big')
+        payload, check = bytes(raw[:-4]), bytes(raw[-4:])
+        if not payload or keccak_256(payload)[:4] != check:
+            return None
+        return payload
+
+class StrKey:
+
+
+    def __init__(self):
+
+        self.decode = lru_cache(maxsize=DECODE_CACHE_SIZE)(self._decode)
+
+    def _decode(self, s: str) -> Optional[bytes]:
+
+        # Stellar's base32 keys end in the CRC16-XModem of the version byte
+        # and key, little-endian.
+        try:
+            raw = base64.b32decode(s)
+        except (binascii.Error, ValueError):
+            return None
+        payload, check = raw[:-2], raw[-2:]
+        if not payload or binascii.crc_hqx(payload, 0) != int.from_bytes(check, 'little'):
+            return None
+        return payload
+
+BASE58_CHECK = Base58Check(BASE58.chars)
+RIPPLE_CHECK = Base58Check(RIPPLE58.chars)
+MONERO_BASE58 = MoneroBase58()
+STELLAR_STRKEY = StrKey()
+
+class AddressValidator:
+
+
+    def __init__(self, level: str, versions: Tuple = (), payload_length: int = 21,
+                 codec=BASE58_CHECK, charset=Base58Validator.is_valid_base58, claimed_by: Tuple = (),
+                 checksum_only: bool = False):
+
+        # versions are the allowed leading payload bytes, as ints for one
+        # byte or bytes for longer prefixes. With none, the address has no
+        # checksum this module knows, and the checksum level stops at the
+        # charset check, except that an address one of the claimed_by
+        # validators (other coins of the same shape) verifies is rejected.
+        # A checksum_only address is reported only once its checksum and
+        # version bytes are verified, so never below the checksum level.
+        self.level = check_validation_level(level)
+        self.versions = tuple(bytes((v,)) if isinstance(v, int) else v for v in versions)
+        self.payload_length = payload_length
+        self.codec = codec
+        self.charset = charset
+        self.claimed_by = claimed_by
+        self.checksum_only = checksum_only
+
+    def is_valid(self, s: str) -> bool:
+
+        if self.checksum_only:
+            return self.level == CHECKSUM and bool(self.versions) and self.charset(s) and self._verify(s)
+        if self.level == SHAPE:
+            return True
+        if not self.charset(s):
+            return False
+        if self.level == CHARSET:
+            return True
+        if not self.versions:
+            return not any(other.is_valid(s) for other in self.claimed_by)
+        return self._verify(s)
+
+    def _verify(self, s: str) -> bool:
+
+        payload = self.codec.decode(s)
+        return payload is not None and len(payload) == self.payload_length and payload.startswith(self.versions)
+
+class Bech32AddressValidator:
+
+
+    def __init__(self, level: str, hrp: str, segwit: bool = True, max_data_length: int = 90):
+
+        # SegWit addresses use Bech32 for witness version 0 ('q') and
+        # Bech32m for later versions; other addresses use Bech32 only.
+        self.level = check_validation_level(level)
+        self.hrp = hrp
+        self.prefix = hrp + '1'
+        self.segwit = segwit
+        self.max_data_length = max_data_length
+
+    def is_valid(self, s: str) -> bool:
+
+        if not s.startswith(self.prefix):
+            return False
+        if self.level == SHAPE:
+            return True
+        data = s[len(self.prefix):]
+        if len(data) < 6 or len(data) > self.max_data_length or not BECH32.matches(data):
+            return False
+        if self.level == CHARSET:
+            return True
+        constant = Bech32Validator.checksum_constant(s, self.hrp)
+        if self.segwit and data[0] != 'q':
+            return constant == BECH32M_CONST
+        return constant == BECH32_CONST
@@ -1,37 +1,62 @@
 import re
-import hashlib
-from typing import List
+from functools import lru_cache
+from typing import Dict, List
+from utils.cryptos.keccak import keccak_256
+from utils.validation import CHARSET, SHAPE, check_validation_level
+
+# Chains that share Ethereum's address format. An address is valid on every
+# one of them, so they are attributed from this table after a single scan.
+EVM_CHAINS = (
+    ('ETH', 'Ethereum'),
+    ('ETC', 'Ethereum Classic'),
+    ('ARB', 'Arbitrum'),
+    ('AVAX', 'Avalanche C-Chain'),
+    ('MATIC', 'Polygon'),
+    ('OP', 'Optimism'),
+    ('BSC', 'BNB Smart Chain'),
+    ('FTM', 'Fantom'),
+    ('GNO', 'Gnosis'),
+)
+
+@lru_cache(maxsize=4096)
+def checksum_address(digits: str) -> str:
+
+    # EIP-55: a letter is upper case when the matching nibble of the
+    # Keccak-256 of the lower-case hex digits is 8 or more.
+    digest = keccak_256(digits.encode('ascii')).hex()
+    return ''.join(c.upper() if n in '89abcdef' else c for c, n in zip(digits, digest))
 
 class EthereumBaseExtractor:
-    
 
-    def __init__(self):
-        self.pattern = re.compile(r'\b0x[a-fA-F0-9]{40}\b')
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.pattern = re.compile(r'\b0x[a-fA-F0-9]{40}\b', flags)
+        self.validation_level = check_validation_level(validation_level)
 
     def extract_addresses(self, text: str) -> List[str]:
         matches = self.pattern.findall(text)
         return [m for m in matches if self._validate_address(m)]
 
     def _validate_address(self, addr: str) -> bool:
-        
+
         if not addr.startswith('0x') or len(addr) != 42:
             return False
-        addr_lower = addr.lower()
-        addr_hash = hashlib.sha3_256(addr_lower[2:].encode()).hexdigest()
-        for i in range(40):
-            expected_case = addr_hash[i] in '89abcdef'
-            actual_upper = addr[i+2].isupper()
-            if expected_case != actual_upper:
-                return False
-        return True
-
+        digits = addr[2:]
+        lower = digits.lower()
+        # All lower or all upper case carries no checksum.
+        if self.validation_level == SHAPE or digits == lower or digits == digits.upper():
+            return True
+        return checksum_address(lower) == digits
+
+# Per-chain extractors, kept for callers that use one chain directly. They
+# all match the same addresses as EthereumBaseExtractor.
 class EthereumExtractor(EthereumBaseExtractor):
     
-    pass  
+    pass
 
 class EthereumClassicExtractor(EthereumBaseExtractor):
     
-    pass  
+    pass
 
 class ArbitrumExtractor(EthereumBaseExtractor):
     
@@ -63,33 +88,23 @@ class XDaiExtractor(EthereumBaseExtractor):
 
 
 class EthereumEcosystemExtractor:
-    
 
-    def __init__(self):
-        self.extractors = {
-            'ETH': EthereumExtractor(),
-            'ETC': EthereumClassicExtractor(),
-            'ARB': ArbitrumExtractor(),
-            'AVAX': AvalancheExtractor(),
-            'MATIC': PolygonExtractor(),
-            'OP': OptimismExtractor(),
-            'BSC': BinanceSmartChainExtractor(),
-            'FTM': FantomExtractor(),
-            'GNO': XDaiExtractor(),
-        }
-
-    def extract_all_addresses(self, text: str) -> dict:
-        
-        results = {}
-        for chain, extractor in self.extractors.items():
-            addresses = extractor.extract_addresses(text)
-            if addresses:
-                results[chain] = addresses
-        return results
+
+    candidate_rules = (
+        ('0x', 42, 42, 'extract_addresses'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.extractor = EthereumBaseExtractor(flags, validation_level)
+        self.chains = EVM_CHAINS
+
+    def extract_all_addresses(self, text: str) -> Dict[str, List[str]]:
+
+        addresses = self.extract_addresses(text)
+        if not addresses:
+            return {}
+        return {chain: list(addresses) for chain, _ in self.chains}
 
     def extract_addresses(self, text: str) -> List[str]:
-        
-        all_addresses = set()
-        for extractor in self.extractors.values():
-            all_addresses.update(extractor.extract_addresses(text))
-        return list(all_addresses)
\ No newline at end of file
+
+        return list(dict.fromkeys(self.extractor.extract_addresses(text)))
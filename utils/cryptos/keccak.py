@@ -0,0 +1,71 @@
+from typing import List
+
+# Keccak-256 as Ethereum uses it: the original Keccak padding (0x01), which
+# differs from the FIPS 202 SHA3-256 in hashlib (0x06).
+RATE = 136
+MASK = (1 << 64) - 1
+
+ROUND_CONSTANTS = (
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+    0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+    0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+    0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+    0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+)
+
+def _rho_pi() -> tuple:
+
+    # (source lane, its column, destination lane, rotation) for the combined
+    # theta, rho and pi steps, walking the lanes from (1, 0) as the
+    # specification does.
+    steps = [(0, 0, 0, 0)]
+    x, y = 1, 0
+    for t in range(24):
+        steps.append((x + 5 * y, x, y + 5 * ((2 * x + 3 * y) % 5), ((t + 1) * (t + 2) // 2) % 64))
+        x, y = y, (2 * x + 3 * y) % 5
+    return tuple(steps)
+
+RHO_PI = _rho_pi()
+
+def keccak_f(lanes: List[int]) -> None:
+
+    moved = [0] * 25
+    for constant in ROUND_CONSTANTS:
+        c0 = lanes[0] ^ lanes[5] ^ lanes[10] ^ lanes[15] ^ lanes[20]
+        c1 = lanes[1] ^ lanes[6] ^ lanes[11] ^ lanes[16] ^ lanes[21]
+        c2 = lanes[2] ^ lanes[7] ^ lanes[12] ^ lanes[17] ^ lanes[22]
+        c3 = lanes[3] ^ lanes[8] ^ lanes[13] ^ lanes[18] ^ lanes[23]
+        c4 = lanes[4] ^ lanes[9] ^ lanes[14] ^ lanes[19] ^ lanes[24]
+        d = (
+            c4 ^ (((c1 << 1) | (c1 >> 63)) & MASK),
+            c0 ^ (((c2 << 1) | (c2 >> 63)) & MASK),
+            c1 ^ (((c3 << 1) | (c3 >> 63)) & MASK),
+            c2 ^ (((c4 << 1) | (c4 >> 63)) & MASK),
+            c3 ^ (((c0 << 1) | (c0 >> 63)) & MASK),
+        )
+        for source, column, target, shift in RHO_PI:
+            lane = lanes[source] ^ d[column]
+            moved[target] = ((lane << shift) | (lane >> (64 - shift))) & MASK
+        for row in range(0, 25, 5):
+            b0, b1, b2, b3, b4 = moved[row:row + 5]
+            lanes[row] = b0 ^ (~b1 & b2)
+            lanes[row + 1] = b1 ^ (~b2 & b3)
+            lanes[row + 2] = b2 ^ (~b3 & b4)
+            lanes[row + 3] = b3 ^ (~b4 & b0)
+            lanes[row + 4] = b4 ^ (~b0 & b1)
+        lanes[0] ^= constant
+
+def keccak_256(data: bytes) -> bytes:
+
+    padded = bytearray(data)
+    padded.append(0x01)
+    padded.extend(bytes(-len(padded) % RATE))
+    padded[-1] |= 0x80
+
+    lanes = [0] * 25
+    for block in range(0, len(padded), RATE):
+        for i in range(RATE // 8):
+            lanes[i] ^= int.from_bytes(padded[block + 8 * i:block + 8 * i + 8], 'little')
+        keccak_f(lanes)
+    return b''.join(lane.to_bytes(8, 'little') for lane in lanes[:4])
@@ -1,36 +1,23 @@
 import re
 from typing import List
-
-class Base58Validator:
-    
-    ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-
-    @staticmethod
-    def is_valid_base58(s: str) -> bool:
-        if not s or s[0] in '0OIl':
-            return False
-        return all(c in Base58Validator.ALPHABET for c in s)
-
-class Bech32Validator:
-    
-    CHARSET = 'qpzry9x8gf2tvdw0s3jn54khce6mua7l'
-
-    @staticmethod
-    def is_valid_bech32(s: str, hrp: str) -> bool:
-        if not s.startswith(hrp + '1'):
-            return False
-        data = s[len(hrp) + 1:]
-        if len(data) < 6 or not all(c in Bech32Validator.CHARSET for c in data):
-            return False
-        return len(data) <= 90
+from utils.cryptos.encoding import AddressValidator, Bech32AddressValidator
+from utils.validation import CHARSET
 
 class LitecoinExtractor:
     
 
-    def __init__(self):
-        self.legacy_pattern = re.compile(r'\bL[1-9A-HJ-NP-Za-km-z]{33}\b')  
-        self.segwit_pattern = re.compile(r'\bM[1-9A-HJ-NP-Za-km-z]{33}\b')  
-        self.bech32_pattern = re.compile(r'\bltc1[a-z0-9]{20,40}\b')
+    candidate_rules = (
+        ('L', 34, 34, 'extract_legacy'),
+        ('M', 34, 34, 'extract_segwit'),
+        ('ltc1', 24, 44, 'extract_bech32'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.legacy_pattern = re.compile(r'\bL[1-9A-HJ-NP-Za-km-z]{33}\b', flags)  
+        self.segwit_pattern = re.compile(r'\bM[1-9A-HJ-NP-Za-km-z]{33}\b', flags)  
+        self.bech32_pattern = re.compile(r'\bltc1[a-z0-9]{20,40}\b', flags)
+        self.base58 = AddressValidator(validation_level, versions=(48, 50), checksum_only=True)
+        self.bech32 = Bech32AddressValidator(validation_level, 'ltc')
 
     def extract_addresses(self, text: str) -> List[str]:
         addresses = set()
@@ -41,23 +28,31 @@ class LitecoinExtractor:
 
     def extract_legacy(self, text: str) -> List[str]:
         matches = self.legacy_pattern.findall(text)
-        return [m for m in matches if len(m) == 35 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) == 34 and self.base58.is_valid(m)]
 
     def extract_segwit(self, text: str) -> List[str]:
         matches = self.segwit_pattern.findall(text)
-        return [m for m in matches if len(m) == 35 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) == 34 and self.base58.is_valid(m)]
 
     def extract_bech32(self, text: str) -> List[str]:
         matches = self.bech32_pattern.findall(text)
-        return [m for m in matches if Bech32Validator.is_valid_bech32(m, 'ltc')]
+        return [m for m in matches if self.bech32.is_valid(m)]
 
 class DogecoinExtractor:
     
 
-    def __init__(self):
-        self.legacy_pattern = re.compile(r'\bD[1-9A-HJ-NP-Za-km-z]{33}\b')  
-        self.segwit_pattern = re.compile(r'\bA[1-9A-HJ-NP-Za-km-z]{33}\b')  
-        self.bech32_pattern = re.compile(r'\bdoge1[a-z0-9]{20,40}\b')
+    candidate_rules = (
+        ('D', 34, 34, 'extract_legacy'),
+        ('A', 34, 34, 'extract_segwit'),
+        ('doge1', 25, 45, 'extract_bech32'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.legacy_pattern = re.compile(r'\bD[1-9A-HJ-NP-Za-km-z]{33}\b', flags)  
+        self.segwit_pattern = re.compile(r'\bA[1-9A-HJ-NP-Za-km-z]{33}\b', flags)  
+        self.bech32_pattern = re.compile(r'\bdoge1[a-z0-9]{20,40}\b', flags)
+        self.base58 = AddressValidator(validation_level, versions=(30, 22), checksum_only=True)
+        self.bech32 = Bech32AddressValidator(validation_level, 'doge')
 
     def extract_addresses(self, text: str) -> List[str]:
         addresses = set()
@@ -68,22 +63,28 @@ class DogecoinExtractor:
 
     def extract_legacy(self, text: str) -> List[str]:
         matches = self.legacy_pattern.findall(text)
-        return [m for m in matches if len(m) == 35 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) == 34 and self.base58.is_valid(m)]
 
     def extract_segwit(self, text: str) -> List[str]:
         matches = self.segwit_pattern.findall(text)
-        return [m for m in matches if len(m) == 35 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) == 34 and self.base58.is_valid(m)]
 
     def extract_bech32(self, text: str) -> List[str]:
         matches = self.bech32_pattern.findall(text)
-        return [m for m in matches if Bech32Validator.is_valid_bech32(m, 'doge')]
+        return [m for m in matches if self.bech32.is_valid(m)]
 
 class DigiByteExtractor:
     
 
-    def __init__(self):
-        self.legacy_pattern = re.compile(r'\bD[1-9A-HJ-NP-Za-km-z]{33}\b')  
-        self.segwit_pattern = re.compile(r'\bS[1-9A-HJ-NP-Za-km-z]{33}\b')  
+    candidate_rules = (
+        ('D', 34, 34, 'extract_legacy'),
+        ('S', 34, 34, 'extract_segwit'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.legacy_pattern = re.compile(r'\bD[1-9A-HJ-NP-Za-km-z]{33}\b', flags)  
+        self.segwit_pattern = re.compile(r'\bS[1-9A-HJ-NP-Za-km-z]{33}\b', flags)  
+        self.base58 = AddressValidator(validation_level, versions=(30, 63), checksum_only=True)
 
     def extract_addresses(self, text: str) -> List[str]:
         addresses = set()
@@ -93,18 +94,24 @@ class DigiByteExtractor:
 
     def extract_legacy(self, text: str) -> List[str]:
         matches = self.legacy_pattern.findall(text)
-        return [m for m in matches if len(m) == 35 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) == 34 and self.base58.is_valid(m)]
 
     def extract_segwit(self, text: str) -> List[str]:
         matches = self.segwit_pattern.findall(text)
-        return [m for m in matches if len(m) == 35 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) == 34 and self.base58.is_valid(m)]
 
 class FeathercoinExtractor:
     
 
-    def __init__(self):
-        self.legacy_pattern = re.compile(r'\b[67][1-9A-HJ-NP-Za-km-z]{33}\b')  
+    candidate_rules = (
+        ('6', 34, 34, 'extract_addresses'),
+        ('7', 34, 34, 'extract_addresses'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.legacy_pattern = re.compile(r'\b[67][1-9A-HJ-NP-Za-km-z]{33}\b', flags)  
+        self.base58 = AddressValidator(validation_level, versions=(14, 5), checksum_only=True)
 
     def extract_addresses(self, text: str) -> List[str]:
         matches = self.legacy_pattern.findall(text)
-        return [m for m in matches if len(m) == 35 and Base58Validator.is_valid_base58(m)]
\ No newline at end of file
+        return [m for m in matches if len(m) == 34 and self.base58.is_valid(m)]
\ No newline at end of file
@@ -1,72 +1,96 @@
 import re
 from typing import List
-
-class Base58Validator:
-    
-    ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-
-    @staticmethod
-    def is_valid_base58(s: str) -> bool:
-        if not s or s[0] in '0OIl':
-            return False
-        return all(c in Base58Validator.ALPHABET for c in s)
+from utils.cryptos.encoding import AddressValidator
+from utils.validation import CHARSET
 
 class MonacoinExtractor:
     
 
-    def __init__(self):
-        self.pattern = re.compile(r'\bM[1-9A-HJ-NP-Za-km-z]{33}\b')  
+    candidate_rules = (
+        ('M', 34, 34, 'extract_addresses'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.pattern = re.compile(r'\bM[1-9A-HJ-NP-Za-km-z]{33}\b', flags)  
+        self.base58 = AddressValidator(validation_level, versions=(50, 55), checksum_only=True)
 
     def extract_addresses(self, text: str) -> List[str]:
         matches = self.pattern.findall(text)
-        return [m for m in matches if len(m) == 35 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) == 34 and self.base58.is_valid(m)]
 
 class VertcoinExtractor:
     
 
-    def __init__(self):
-        self.pattern = re.compile(r'\bV[1-9A-HJ-NP-Za-km-z]{33}\b')  
+    candidate_rules = (
+        ('V', 34, 34, 'extract_addresses'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.pattern = re.compile(r'\bV[1-9A-HJ-NP-Za-km-z]{33}\b', flags)  
+        self.base58 = AddressValidator(validation_level, versions=(71, 5), checksum_only=True)
 
     def extract_addresses(self, text: str) -> List[str]:
         matches = self.pattern.findall(text)
-        return [m for m in matches if len(m) == 35 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) == 34 and self.base58.is_valid(m)]
 
 class SyscoinExtractor:
     
 
-    def __init__(self):
-        self.pattern = re.compile(r'\bS[1-9A-HJ-NP-Za-km-z]{33}\b')  
+    candidate_rules = (
+        ('S', 34, 34, 'extract_addresses'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.pattern = re.compile(r'\bS[1-9A-HJ-NP-Za-km-z]{33}\b', flags)  
+        self.base58 = AddressValidator(validation_level, versions=(63, 5), checksum_only=True)
 
     def extract_addresses(self, text: str) -> List[str]:
         matches = self.pattern.findall(text)
-        return [m for m in matches if len(m) == 35 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) == 34 and self.base58.is_valid(m)]
 
 class PeercoinExtractor:
     
 
-    def __init__(self):
-        self.pattern = re.compile(r'\bP[1-9A-HJ-NP-Za-km-z]{33}\b')  
+    candidate_rules = (
+        ('P', 34, 34, 'extract_addresses'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.pattern = re.compile(r'\bP[1-9A-HJ-NP-Za-km-z]{33}\b', flags)  
+        self.base58 = AddressValidator(validation_level, versions=(55, 117), checksum_only=True)
 
     def extract_addresses(self, text: str) -> List[str]:
         matches = self.pattern.findall(text)
-        return [m for m in matches if len(m) == 35 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) == 34 and self.base58.is_valid(m)]
 
 class PrimecoinExtractor:
     
 
-    def __init__(self):
-        self.pattern = re.compile(r'\bA[1-9A-HJ-NP-Za-km-z]{33}\b')  
+    candidate_rules = (
+        ('A', 34, 34, 'extract_addresses'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.pattern = re.compile(r'\bA[1-9A-HJ-NP-Za-km-z]{33}\b', flags)  
+        self.base58 = AddressValidator(validation_level, versions=(23, 83), checksum_only=True)
 
     def extract_addresses(self, text: str) -> List[str]:
         matches = self.pattern.findall(text)
-        return [m for m in matches if len(m) == 35 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) == 34 and self.base58.is_valid(m)]
 
 class NexusExtractor:
     
 
-    def __init__(self):
-        self.pattern = re.compile(r'\bN[1-9A-HJ-NP-Za-km-z]{33}\b')  
+    candidate_rules = (
+        ('N', 34, 34, 'extract_addresses'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.pattern = re.compile(r'\bN[1-9A-HJ-NP-Za-km-z]{33}\b', flags)  
+        # Nexus has no checksum this module can verify, so it is never
+        # reported; Namecoin shares the shape.
+        self.base58 = AddressValidator(validation_level, checksum_only=True)
 
     def extract_addresses(self, text: str) -> List[str]:
         matches = self.pattern.findall(text)
-        return [m for m in matches if len(m) == 35 and Base58Validator.is_valid_base58(m)]
\ No newline at end of file
+        return [m for m in matches if len(m) == 34 and self.base58.is_valid(m)]
\ No newline at end of file
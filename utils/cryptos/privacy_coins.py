@@ -1,35 +1,41 @@
 import re
 from typing import List
-
-class Base58Validator:
-    
-    ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-
-    @staticmethod
-    def is_valid_base58(s: str) -> bool:
-        if not s or s[0] in '0OIl':
-            return False
-        return all(c in Base58Validator.ALPHABET for c in s)
+from utils.cryptos.encoding import MONERO_BASE58, AddressValidator
+from utils.validation import CHARSET
 
 class MoneroExtractor:
     
 
-    def __init__(self):
-        self.stealth_pattern = re.compile(r'\b[48][0-9A-Za-z]{94}\b')
+    candidate_rules = (
+        ('4', 95, 95, 'extract_addresses'),
+        ('8', 95, 95, 'extract_addresses'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.stealth_pattern = re.compile(r'\b[48][0-9A-Za-z]{94}\b', flags)
+        self.base58 = AddressValidator(validation_level, versions=(18, 42), payload_length=65, codec=MONERO_BASE58)
 
     def extract_addresses(self, text: str) -> List[str]:
         matches = self.stealth_pattern.findall(text)
         return [m for m in matches if self._validate_stealth(m)]
 
     def _validate_stealth(self, addr: str) -> bool:
-        return len(addr) == 95 and Base58Validator.is_valid_base58(addr)
+        return len(addr) == 95 and self.base58.is_valid(addr)
 
 class ZcashExtractor:
     
 
-    def __init__(self):
-        self.shielded_pattern = re.compile(r'\bz[ct][0-9A-Za-z]{93}\b')  
-        self.transparent_pattern = re.compile(r'\bt1[0-9A-Za-z]{33}\b')
+    candidate_rules = (
+        ('zc', 95, 95, 'extract_shielded'),
+        ('zt', 95, 95, 'extract_shielded'),
+        ('t1', 35, 35, 'extract_transparent'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.shielded_pattern = re.compile(r'\bz[ct][0-9A-Za-z]{93}\b', flags)  
+        self.transparent_pattern = re.compile(r'\bt1[0-9A-Za-z]{33}\b', flags)
+        self.shielded_base58 = AddressValidator(validation_level, versions=(b'\x16\x9a', b'\x16\xb6'), payload_length=66)
+        self.transparent_base58 = AddressValidator(validation_level, versions=(b'\x1c\xb8',), payload_length=22)
 
     def extract_addresses(self, text: str) -> List[str]:
         addresses = set()
@@ -46,17 +52,22 @@ class ZcashExtractor:
         return [m for m in matches if self._validate_transparent(m)]
 
     def _validate_shielded(self, addr: str) -> bool:
-        return len(addr) == 95 and addr.startswith(('zc', 'zt')) and Base58Validator.is_valid_base58(addr)
+        return len(addr) == 95 and addr.startswith(('zc', 'zt')) and self.shielded_base58.is_valid(addr)
 
     def _validate_transparent(self, addr: str) -> bool:
-        return len(addr) == 35 and addr.startswith('t1') and Base58Validator.is_valid_base58(addr)
+        return len(addr) == 35 and addr.startswith('t1') and self.transparent_base58.is_valid(addr)
 
 class DashExtractor:
     
 
-    def __init__(self):
-        self.legacy_pattern = re.compile(r'\bX[1-9A-HJ-NP-Za-km-z]{33}\b')  
-        self.privatesend_pattern = re.compile(r'\bX[1-9A-HJ-NP-Za-km-z]{33}\b')  
+    candidate_rules = (
+        ('X', 34, 34, 'extract_addresses'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.legacy_pattern = re.compile(r'\bX[1-9A-HJ-NP-Za-km-z]{33}\b', flags)  
+        self.privatesend_pattern = re.compile(r'\bX[1-9A-HJ-NP-Za-km-z]{33}\b', flags)  
+        self.base58 = AddressValidator(validation_level, versions=(76, 16), checksum_only=True)
 
     def extract_addresses(self, text: str) -> List[str]:
         addresses = set()
@@ -66,12 +77,12 @@ class DashExtractor:
 
     def extract_legacy(self, text: str) -> List[str]:
         matches = self.legacy_pattern.findall(text)
-        return [m for m in matches if len(m) == 35 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) == 34 and self.base58.is_valid(m)]
 
     def extract_privatesend(self, text: str) -> List[str]:
         
         matches = self.privatesend_pattern.findall(text)
-        return [m for m in matches if len(m) == 35 and Base58Validator.is_valid_base58(m) and self._is_privatesend(m)]
+        return [m for m in matches if len(m) == 34 and self.base58.is_valid(m) and self._is_privatesend(m)]
 
     def _is_privatesend(self, addr: str) -> bool:
         
@@ -80,9 +91,20 @@ class DashExtractor:
 class VergeExtractor:
     
 
-    def __init__(self):
-        self.legacy_pattern = re.compile(r'\bD[1-9A-HJ-NP-Za-km-z]{33}\b')  
-        self.wraith_pattern = re.compile(r'\b[48][0-9A-Za-z]{94}\b')  
+    candidate_rules = (
+        ('D', 34, 34, 'extract_legacy'),
+        ('4', 95, 95, 'extract_wraith'),
+        ('8', 95, 95, 'extract_wraith'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.legacy_pattern = re.compile(r'\bD[1-9A-HJ-NP-Za-km-z]{33}\b', flags)  
+        self.wraith_pattern = re.compile(r'\b[48][0-9A-Za-z]{94}\b', flags)  
+        self.base58 = AddressValidator(validation_level, versions=(30, 33), checksum_only=True)
+        # Wraith addresses have the shape of Monero's and no checksum this
+        # module can verify, so a valid Monero address is not one of them.
+        monero = AddressValidator(validation_level, versions=(18, 42), payload_length=65, codec=MONERO_BASE58)
+        self.wraith_base58 = AddressValidator(validation_level, claimed_by=(monero,))
 
     def extract_addresses(self, text: str) -> List[str]:
         addresses = set()
@@ -92,8 +114,8 @@ class VergeExtractor:
 
     def extract_legacy(self, text: str) -> List[str]:
         matches = self.legacy_pattern.findall(text)
-        return [m for m in matches if len(m) == 35 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) == 34 and self.base58.is_valid(m)]
 
     def extract_wraith(self, text: str) -> List[str]:
         matches = self.wraith_pattern.findall(text)
-        return [m for m in matches if len(m) == 95 and Base58Validator.is_valid_base58(m)]
\ No newline at end of file
+        return [m for m in matches if len(m) == 95 and self.wraith_base58.is_valid(m)]
\ No newline at end of file
@@ -1,40 +1,35 @@
 import re
 from typing import List
-
-class Base58Validator:
-    
-    ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-
-    @staticmethod
-    def is_valid_base58(s: str) -> bool:
-        if not s or s[0] in '0OIl':
-            return False
-        return all(c in Base58Validator.ALPHABET for c in s)
-
-class Base32Validator:
-    
-    ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ234567'
-
-    @staticmethod
-    def is_valid_base32(s: str) -> bool:
-        return all(c in Base32Validator.ALPHABET for c in s)
+from utils.cryptos.encoding import RIPPLE_CHECK, STELLAR_STRKEY, AddressValidator, Base32Validator
+from utils.validation import CHARSET
 
 class RippleExtractor:
     
 
-    def __init__(self):
-        self.pattern = re.compile(r'\br[1-9A-HJ-NP-Za-km-z]{33}\b')  
+    candidate_rules = (
+        ('r', 34, 34, 'extract_addresses'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.pattern = re.compile(r'\br[1-9A-HJ-NP-Za-km-z]{33}\b', flags)  
+        self.base58 = AddressValidator(validation_level, versions=(0,), codec=RIPPLE_CHECK)
 
     def extract_addresses(self, text: str) -> List[str]:
         matches = self.pattern.findall(text)
-        return [m for m in matches if len(m) == 34 and Base58Validator.is_valid_base58(m)]
+        return [m for m in matches if len(m) == 34 and self.base58.is_valid(m)]
 
 class StellarExtractor:
     
 
-    def __init__(self):
-        self.pattern = re.compile(r'\bG[A-Z2-7]{55}\b')  
+    candidate_rules = (
+        ('G', 56, 56, 'extract_addresses'),
+    )
+
+    def __init__(self, flags: int = 0, validation_level: str = CHARSET):
+        self.pattern = re.compile(r'\bG[A-Z2-7]{55}\b', flags)  
+        self.base32 = AddressValidator(validation_level, versions=(48,), payload_length=33, codec=STELLAR_STRKEY,
+                                     charset=Base32Validator.is_valid_base32)
 
     def extract_addresses(self, text: str) -> List[str]:
         matches = self.pattern.findall(text)
-        return [m for m in matches if len(m) == 56 and Base32Validator.is_valid_base32(m[1:])]
\ No newline at end of file
+        return [m for m in matches if len(m) == 56 and self.base32.is_valid(m)]
\ No newline at end of file
@@ -1,5 +1,16 @@
 import re
-from typing import List, Set
+from bisect import bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from utils.email import EmailExtractor
+from utils.matches import with_context
+from utils.prefilter import Prefilter
+
+DOMAIN_CHARS = b'0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ.-'
+RUN_MARKS = bytes(0 if byte in DOMAIN_CHARS else byte or 1 for byte in range(256))
+# Non-ASCII characters that [a-zA-Z] also matches under re.IGNORECASE.
+FOLDED_LETTERS = '\u0130\u0131\u017f\u212a'
+LONG_RUN = 64
+RUN_END = re.compile(rb'[^\x00]')
 
 class TLDValidator:
     
@@ -21,23 +32,150 @@ class TLDValidator:
 class DomainExtractor:
     
 
-    def __init__(self):
+    def __init__(self, flags: int = 0):
         
         self.pattern = re.compile(
             r'\b(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)*'  
             r'[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.'  
             r'[a-zA-Z]{2,}\b',  
-            re.IGNORECASE
+            re.IGNORECASE | flags
         )
+        self.label_pattern = re.compile(r'[a-zA-Z0-9-]+', flags)
+        self.run_pattern = re.compile(r'(?<![a-zA-Z0-9.-])[a-zA-Z0-9.-]{%d,}' % LONG_RUN, re.IGNORECASE | flags)
+        self.start_pattern = re.compile(r'\b[a-zA-Z0-9]', re.IGNORECASE | flags)
+        self.full_label_pattern = re.compile(r'[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?', re.IGNORECASE | flags)
+        self.tld_pattern = re.compile(r'[a-zA-Z]{2,}\b', re.IGNORECASE | flags)
+        self.prefilter = Prefilter(literals=('.',))
+        self.email_extractor = EmailExtractor(flags)
+
+    def extract_domains(self, text: str, emails: Optional[List[re.Match]] = None) -> List[str]:
+        
+        return [domain for _, _, domain in self.iter_spans(text, emails)]
+
+    def iter_spans(self, text: str, emails: Optional[Iterable[re.Match]] = None) -> Iterator[Tuple[int, int, str]]:
+
+        if emails is None:
+            emails = self.email_extractor.find_emails(text)
+        verdicts: Dict[str, bool] = {}
+        runs = self._long_runs(text)
+        position = 0
+
+        # Email addresses already carry their domain, so the pattern only runs
+        # over the text between them.
+        for email in emails:
+            yield from self._iter_between(text, position, email.start(), verdicts, runs)
+            address = email.group()
+            domain = address[address.index('@') + 1:]
+            if self._is_valid(domain, verdicts):
+                yield email.end() - len(domain), email.end(), domain.lower()
+            else:
+                yield from self._iter_between(text, email.end() - len(domain), email.end(), verdicts, runs)
+            position = email.end()
+        yield from self._iter_between(text, position, len(text), verdicts, runs)
+
+    def _long_runs(self, text: str) -> List[Tuple[int, int]]:
+
+        # From every label of a run of domain characters that holds no domain,
+        # the pattern rescans the rest of the run, which is quadratic in the
+        # run, so long runs get a linear scan of their own. They are found in
+        # a byte translation where the run characters become NUL.
+        if not text.isascii() and any(letter in text for letter in FOLDED_LETTERS):
+            return [match.span() for match in self.run_pattern.finditer(text)]
+        encoded = text.encode('utf-8', 'surrogatepass')
+        marked = encoded.translate(RUN_MARKS)
+        needle = bytes(LONG_RUN)
+        runs = []
+        start = marked.find(needle)
+        while start >= 0:
+            end = RUN_END.search(marked, start + LONG_RUN)
+            end = end.start() if end else len(marked)
+            runs.append((start, end))
+            start = marked.find(needle, end)
+        if runs and not text.isascii():
+            # Byte offsets to character offsets; runs are ASCII.
+            spans = []
+            position = offset = 0
+            for start, end in runs:
+                offset += len(encoded[position:start].decode('utf-8', 'surrogatepass'))
+                spans.append((offset, offset + end - start))
+                offset += end - start
+                position = end
+            runs = spans
+        return runs
+
+    def _iter_between(self, text: str, start: int, end: int, verdicts: Dict[str, bool], runs: List[Tuple[int, int]]) -> Iterator[Tuple[int, int, str]]:
+
+        if start >= end:
+            return
+        position = start
+        for run_start, run_end in runs[max(bisect_right(runs, (start, end)) - 1, 0):]:
+            if run_start >= end:
+                break
+            if run_end <= position:
+                continue
+            yield from self._iter_pattern(text, position, run_start, verdicts)
+            position = min(run_end, end)
+            for match_start, match_end in self._iter_run(text, max(run_start, start), position, end):
+                candidate = text[match_start:match_end]
+                if self._is_valid(candidate, verdicts):
+                    yield match_start, match_end, candidate.lower()
+        yield from self._iter_pattern(text, position, end, verdicts)
+
+    def _iter_pattern(self, text: str, start: int, end: int, verdicts: Dict[str, bool]) -> Iterator[Tuple[int, int, str]]:
+
+        if start >= end:
+            return
+        for match in self.pattern.finditer(text, start, end):
+            if self._is_valid(match.group(), verdicts):
+                yield match.start(), match.end(), match.group().lower()
+
+    def _iter_run(self, text: str, start: int, end: int, limit: int) -> Iterator[Tuple[int, int]]:
+
+        # The spans self.pattern.finditer(text, start, limit) finds in the run
+        # text[start:end], in linear time. A match is one or more labels and
+        # a TLD; the labels after its first are whole labels, so where the
+        # match ends depends only on the label it starts in.
+        bounds = []
+        position = start
+        while True:
+            dot = text.find('.', position, end)
+            if dot < 0:
+                bounds.append((position, end))
+                break
+            bounds.append((position, dot))
+            position = dot + 1
+        count = len(bounds)
+
+        # targets[k]: the label holding the TLD of a match whose labels start
+        # at label k, preferring the furthest one like the greedy pattern.
+        targets: List[Optional[int]] = [None] * (count + 1)
+        tld_ends: Dict[int, int] = {}
+        for k in range(count - 1, 0, -1):
+            if k < count - 1 and targets[k + 1] is not None and self.full_label_pattern.fullmatch(text, *bounds[k]):
+                targets[k] = targets[k + 1]
+                continue
+            tld = self.tld_pattern.match(text, bounds[k][0], limit)
+            if tld:
+                targets[k] = k
+                tld_ends[k] = tld.end()
+
+        position = start
+        for k in range(count - 1):
+            label_start, dot = bounds[k]
+            target = targets[k + 1]
+            if target is None or dot <= position:
+                continue
+            first = self.start_pattern.search(text, max(label_start, position, dot - 63), dot)
+            if first and self.full_label_pattern.fullmatch(text, first.start(), dot):
+                position = tld_ends[target]
+                yield first.start(), position
 
-    def extract_domains(self, text: str) -> List[str]:
+    def _is_valid(self, candidate: str, verdicts: Dict[str, bool]) -> bool:
         
-        matches = self.pattern.findall(text)
-        validated = []
-        for match in matches:
-            if self._validate_domain(match):
-                validated.append(match.lower())
-        return validated
+        verdict = verdicts.get(candidate)
+        if verdict is None:
+            verdict = verdicts[candidate] = self._validate_domain(candidate)
+        return verdict
 
     def _validate_domain(self, candidate: str) -> bool:
         
@@ -58,7 +196,7 @@ class DomainExtractor:
                 return False
             if label.startswith('-') or label.endswith('-'):
                 return False
-            if not re.match(r'^[a-zA-Z0-9-]+$', label):
+            if not self.label_pattern.fullmatch(label):
                 return False
 
         
@@ -70,14 +208,4 @@ class DomainExtractor:
 
     def extract_domains_with_context(self, text: str) -> List[dict]:
         
-        results = []
-        for match in self.pattern.finditer(text):
-            start = max(0, match.start() - 30)
-            end = min(len(text), match.end() + 30)
-            context = text[start:end]
-            if self._validate_domain(match.group()):
-                results.append({
-                    'domain': match.group().lower(),
-                    'context': context
-                })
-        return results
\ No newline at end of file
+        return with_context(text, self.iter_spans(text), 'domain', 30)
@@ -1,40 +1,63 @@
 import re
-from typing import List, Set
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+from utils.matches import with_context
+from utils.prefilter import Prefilter
+
+LOCAL_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789._%+-')
 
 class EmailExtractor:
     
 
-    def __init__(self):
+    def __init__(self, flags: int = 0):
         
         
         self.email_pattern = re.compile(
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            re.IGNORECASE
+            r'\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)+\b',
+            flags
         )
+        self.prefilter = Prefilter(literals=('@',))
 
+    def find_emails(self, text: str) -> List[re.Match]:
         
-        self.backup_patterns = [
-            re.compile(r'\b[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+\b'),
-            re.compile(r'\b[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z]{2,}\b'),
-        ]
-
-    def extract_emails(self, text: str) -> List[str]:
-        
-        emails = set()
+        return list(self.iter_matches(text))
 
-        
-        primary_matches = self.email_pattern.findall(text)
-        emails.update(primary_matches)
+    def iter_matches(self, text: str) -> Iterator[re.Match]:
 
+        position = 0
+        for match in self.email_pattern.finditer(text):
+            start = match.start()
+            late = start > position and text[start - 1] in LOCAL_CHARS and self._starts_late(text, position, start)
+            position = match.end()
+            if not late and self._validate_email(match.group()):
+                yield match
+
+    @staticmethod
+    def _starts_late(text: str, position: int, start: int) -> bool:
+
+        # The local part is capped at 64 characters so that a long run without
+        # a usable '@' is not rescanned from every word boundary in it. A match
+        # that begins after an earlier boundary of its run would, uncapped,
+        # have begun there, with a local part too long to be valid.
+        i = start - 1
+        while i >= position and text[i] in LOCAL_CHARS:
+            before = text[i - 1] if i else ''
+            if (before.isalnum() or before == '_') != (text[i].isalnum() or text[i] == '_'):
+                return True
+            i -= 1
+        return False
+
+    def extract_emails(self, text: str, matches: Optional[List[re.Match]] = None) -> List[str]:
         
-        for pattern in self.backup_patterns:
-            backup_matches = pattern.findall(text)
-            emails.update(backup_matches)
+        if matches is None:
+            matches = self.find_emails(text)
+        return list({match.group() for match in matches})
 
-        
-        validated_emails = [email for email in emails if self._validate_email(email)]
+    def iter_spans(self, text: str, matches: Optional[Iterable[re.Match]] = None) -> Iterator[Tuple[int, int, str]]:
 
-        return list(validated_emails)
+        if matches is None:
+            matches = self.find_emails(text)
+        for match in matches:
+            yield match.start(), match.end(), match.group()
 
     def _validate_email(self, email: str) -> bool:
         
@@ -65,13 +88,4 @@ class EmailExtractor:
 
     def extract_emails_with_context(self, text: str) -> List[dict]:
         
-        results = []
-        for match in self.email_pattern.finditer(text):
-            start = max(0, match.start() - 20)
-            end = min(len(text), match.end() + 20)
-            context = text[start:end]
-            results.append({
-                'email': match.group(),
-                'context': context
-            })
-        return results
\ No newline at end of file
+        return with_context(text, self.iter_spans(text), 'email', 20)
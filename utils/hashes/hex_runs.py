@@ -0,0 +1,174 @@
+import math
+import re
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from utils.matches import with_context
+from utils.prefilter import Prefilter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+NIBBLES = bytes.maketrans(b'0123456789abcdef', bytes(range(16)))
+# Below this many same-length candidates the NumPy setup costs more than the
+# Python loop it replaces.
+BATCH_MIN = 4
+
+# Hex digest type -> (length, minimum entropy). A run with no minimum is
+# reported whenever it is not one repeated digit.
+HEX_HASHES: Dict[str, Tuple[int, Optional[float]]] = {
+    'MD5': (32, 3.0),
+    'SHA1': (40, 3.5),
+    'SHA224': (56, None),
+    'SHA256': (64, 3.8),
+    'SHA384': (96, 3.9),
+    'SHA512': (128, 3.0),
+    'BLAKE2b': (64, None),
+    'BLAKE2s': (32, None),
+    'BLAKE3': (64, None),
+}
+
+def hex_entropy(s: str) -> float:
+
+    if not s:
+        return 0.0
+
+    length = len(s)
+    entropy = 0.0
+    for count in Counter(s).values():
+        probability = count / length
+        entropy -= probability * math.log2(probability)
+    return entropy
+
+def hex_entropies(values: List[str]) -> List[float]:
+
+    # Shannon entropy of many lowercase hex strings of one length: each row of
+    # a uint8 nibble matrix gets a 16-bin histogram from a single bincount.
+    if numpy is None or len(values) < BATCH_MIN:
+        return [hex_entropy(value) for value in values]
+
+    rows, length = len(values), len(values[0])
+    nibbles = numpy.frombuffer(''.join(values).encode('ascii').translate(NIBBLES), dtype=numpy.uint8)
+    bins = nibbles.reshape(rows, length) + numpy.arange(0, rows * 16, 16)[:, None]
+    counts = numpy.bincount(bins.ravel(), minlength=rows * 16).reshape(rows, 16)
+    probabilities = counts / length
+    logs = numpy.log2(numpy.where(counts > 0, probabilities, 1.0))
+    return (-(probabilities * logs).sum(axis=1)).tolist()
+
+class HexRunDispatcher:
+
+
+    def __init__(self, extractors: Dict[str, object], flags: int = 0):
+        self.by_length: Dict[int, List[tuple]] = {}
+        self.prefilters = {}
+        for name, extractor in extractors.items():
+            self.by_length.setdefault(extractor.expected_length, []).append((name, extractor.min_entropy))
+            self.prefilters[name] = extractor.prefilter
+        self.type_names = list(extractors)
+        self.pattern = re.compile(
+            rf'\b[a-fA-F0-9]{{{min(self.by_length)},{max(self.by_length)}}}\b',
+            flags
+        )
+
+    def classify(self, run: str) -> List[str]:
+
+        labels = self.by_length.get(len(run))
+        if not labels:
+            return []
+
+        value = run.lower()
+        if value.count(value[0]) == len(value):
+            return []
+
+        entropy: Optional[float] = None
+        if any(min_entropy is not None for _, min_entropy in labels):
+            entropy = hex_entropy(value)
+        return self._select(labels, entropy)
+
+    def classify_all(self, values: Iterable[str]) -> Dict[str, List[str]]:
+
+        # Distinct lowercase runs grouped by length, so every entropy
+        # threshold of a length is checked against one batch computation.
+        groups: Dict[int, List[str]] = {}
+        for value in values:
+            if len(value) in self.by_length and value.count(value[0]) != len(value):
+                groups.setdefault(len(value), []).append(value)
+
+        classified: Dict[str, List[str]] = {}
+        for length, group in groups.items():
+            labels = self.by_length[length]
+            if any(min_entropy is not None for _, min_entropy in labels):
+                entropies: List[Optional[float]] = hex_entropies(group)
+            else:
+                entropies = [None] * len(group)
+            for value, entropy in zip(group, entropies):
+                classified[value] = self._select(labels, entropy)
+        return classified
+
+    def _select(self, labels: List[tuple], entropy: Optional[float]) -> List[str]:
+
+        return [name for name, min_entropy in labels if min_entropy is None or entropy >= min_entropy]
+
+    def iter_runs(self, text: str):
+
+        runs = [run.lower() for run in self.pattern.findall(text)]
+        classified = self.classify_all(dict.fromkeys(runs))
+        for value in runs:
+            candidates = classified.get(value)
+            if candidates:
+                yield value, candidates
+
+    def iter_spans(self, text: str) -> Iterator[Tuple[int, int, str, List[str]]]:
+
+        cache: Dict[str, List[str]] = {}
+        for match in self.pattern.finditer(text):
+            value = match.group().lower()
+            candidates = cache.get(value)
+            if candidates is None:
+                candidates = cache[value] = self.classify(value)
+            if candidates:
+                yield match.start(), match.end(), value, candidates
+
+    def extract_runs(self, text: str) -> Dict[str, List[dict]]:
+
+        results: Dict[str, List[dict]] = {}
+        for value, candidates in self.iter_runs(text):
+            results.setdefault(f"hex{len(value)}", []).append({
+                'hash': value,
+                'candidates': candidates
+            })
+        return results
+
+    def extract_hashes(self, text: str) -> Dict[str, List[str]]:
+
+        by_type: Dict[str, List[str]] = {name: [] for name in self.type_names}
+        for value, candidates in self.iter_runs(text):
+            for name in candidates:
+                by_type[name].append(value)
+        return {name: values for name, values in by_type.items() if values}
+
+class HexHashExtractor:
+
+
+    hash_type = ''
+
+    def __init__(self, flags: int = 0):
+
+        self.expected_length, self.min_entropy = HEX_HASHES[self.hash_type]
+        self.prefilter = Prefilter(min_hex_run=self.expected_length)
+        self.dispatcher = HexRunDispatcher({self.hash_type: self}, flags)
+        self.pattern = self.dispatcher.pattern
+
+    def extract_hashes(self, text: str) -> List[str]:
+
+        return [value for value, _ in self.dispatcher.iter_runs(text)]
+
+    def iter_spans(self, text: str) -> Iterator[Tuple[int, int, str]]:
+
+        for start, end, value, _ in self.dispatcher.iter_spans(text):
+            yield start, end, value
+
+    def extract_hashes_with_context(self, text: str) -> List[dict]:
+
+        return with_context(text, self.iter_spans(text), 'hash', 20)
@@ -1,178 +1,284 @@
 import re
-import ipaddress
-from typing import List, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from utils.matches import with_context
+from utils.numeric import DigitChain, NumericShape, NumericTokenizer
+from utils.prefilter import Prefilter
+
+HEX_DIGITS = '0123456789abcdefABCDEF'
 
 class IPv4Extractor:
     
 
-    def __init__(self):
-        
-        self.pattern = re.compile(
-            r'\b(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.'  
-            r'(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.'  
-            r'(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.'  
-            r'(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\b'   
-        )
+    def __init__(self, flags: int = 0):
         
-        self.cidr_pattern = re.compile(
-            r'\b(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.'  
-            r'(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.'  
-            r'(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.'  
-            r'(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)/'   
-            r'(?:[1-9]|[1-2][0-9]|3[0-2])\b'  
-        )
+        self.tokenizer = NumericTokenizer(flags)
+        self.address_shapes = NumericShape(((1, 3),) * 4, '...').shapes
+        self.cidr_shapes = NumericShape(((1, 3),) * 4 + ((1, 2),), '.../').shapes
+        self.prefilter = Prefilter(literals=('.',), min_digits=4)
 
-    def extract_ips(self, text: str) -> List[str]:
+    @staticmethod
+    def parse_address(candidate: str) -> Optional[int]:
+
+        octets = candidate.split('.')
+        if len(octets) != 4:
+            return None
+        value = 0
+        for octet in octets:
+            if not (0 < len(octet) <= 3 and octet.isascii() and octet.isdigit()):
+                return None
+            if octet[0] == '0' and len(octet) > 1:
+                return None
+            number = int(octet)
+            if number > 255:
+                return None
+            value = (value << 8) | number
+        return value
+
+    @staticmethod
+    def parse_prefix(prefix: str) -> Optional[int]:
+
+        if not (0 < len(prefix) <= 2 and prefix.isascii() and prefix.isdigit()):
+            return None
+        number = int(prefix)
+        return number if number <= 32 else None
+
+    @staticmethod
+    def _octet(group: str) -> int:
+        if len(group) > 3 or not group.isascii():
+            return -1
+        number = int(group)
+        return number if number <= 255 else -1
+
+    def scan(self, text: str, chains: Optional[Iterable[DigitChain]] = None) -> Tuple[List[dict], List[dict]]:
+
+        if chains is None:
+            chains = self.tokenizer.tokenize(text)
+        addresses: List[dict] = []
+        networks: List[dict] = []
+        for chain in chains:
+            shape = chain.shape
+            if shape in self.address_shapes:
+                if chain.bounded_left and chain.bounded_right:
+                    value = self.parse_address(chain.text)
+                    if value is not None:
+                        addresses.append({'ip': chain.text, 'value': value, 'start': chain.start, 'end': chain.start + len(chain.text)})
+                continue
+            if '.' in shape:
+                self._scan_chain(chain, addresses, networks)
+        return addresses, networks
+
+    def iter_scan(self, text: str, chains: Optional[Iterable[DigitChain]] = None) -> Iterator[Tuple[str, dict]]:
+
+        # Chain by chain, so a caller that stops at the first record never
+        # tokenizes the rest of the text.
+        if chains is None:
+            chains = self.tokenizer.iter_chains(text)
+        for chain in chains:
+            addresses, networks = self.scan(text, (chain,))
+            for record in addresses:
+                yield 'ipv4', record
+            for record in networks:
+                yield 'cidr4', record
+
+    def _scan_chain(self, chain: DigitChain, addresses: List[dict], networks: List[dict]) -> None:
+
+        groups = chain.groups
+        count = len(groups)
+        if count < 4:
+            return
+        separators = chain.separators
+        octets = [self._octet(group) for group in groups]
+        offsets = [chain.start]
+        for group in groups:
+            offsets.append(offsets[-1] + len(group) + 1)
+
+        # Address and CIDR candidates are each taken leftmost and
+        # non-overlapping, like a \b-anchored findall of either shape.
+        next_address = next_network = 0
+        for i in range(count - 3):
+            end = i + 4
+            if (min(octets[i:end]) < 0
+                    or separators[i:i + 3] != ['.', '.', '.']
+                    or (i == 0 and not chain.bounded_left)):
+                continue
+            value = self._pack(groups[i:end], octets[i:end])
+            if i >= next_address and (end < count or chain.bounded_right):
+                if value is not None:
+                    addresses.append({
+                        'ip': '.'.join(groups[i:end]),
+                        'value': value,
+                        'start': offsets[i],
+                        'end': offsets[end] - 1,
+                    })
+                next_address = end
+            if i >= next_network and end < count and separators[i + 3] == '/':
+                prefix = groups[end]
+                if (len(prefix) <= 2 and prefix.isascii() and prefix[0] != '0' and int(prefix) <= 32
+                        and (end + 1 < count or chain.bounded_right)):
+                    if value is not None:
+                        networks.append({
+                            'cidr': '.'.join(groups[i:end]) + '/' + prefix,
+                            'value': value,
+                            'prefix': int(prefix),
+                            'start': offsets[i],
+                            'end': offsets[end + 1] - 1,
+                        })
+                    next_network = end + 1
+
+    @staticmethod
+    def _pack(groups: List[str], octets: List[int]) -> Optional[int]:
+        value = 0
+        for group, octet in zip(groups, octets):
+            if group[0] == '0' and len(group) > 1:
+                return None
+            value = (value << 8) | octet
+        return value
+
+    def extract_ips(self, text: str, chains: Optional[List[DigitChain]] = None) -> List[str]:
         
-        matches = self.pattern.findall(text)
-        validated = []
-        for match in matches:
-            if self._validate_ipv4(match):
-                validated.append(match)
-        return validated
+        return [record['ip'] for record in self.scan(text, chains)[0]]
 
-    def extract_cidrs(self, text: str) -> List[str]:
+    def extract_cidrs(self, text: str, chains: Optional[List[DigitChain]] = None) -> List[str]:
         
-        matches = self.cidr_pattern.findall(text)
-        validated = []
-        for match in matches:
-            if self._validate_ipv4_cidr(match):
-                validated.append(match)
-        return validated
+        return [record['cidr'] for record in self.scan(text, chains)[1]]
 
     def _validate_ipv4(self, candidate: str) -> bool:
         
-        try:
-            
-            ipaddress.IPv4Address(candidate)
-            return True
-        except ipaddress.AddressValueError:
-            return False
+        return self.parse_address(candidate) is not None
 
     def _validate_ipv4_cidr(self, candidate: str) -> bool:
         
-        try:
-            ipaddress.IPv4Network(candidate, strict=False)
-            return True
-        except (ipaddress.AddressValueError, ValueError):
-            return False
+        address, _, prefix = candidate.partition('/')
+        return self.parse_address(address) is not None and self.parse_prefix(prefix) is not None
 
     def extract_ips_with_context(self, text: str) -> List[dict]:
         
-        results = []
-        for match in self.pattern.finditer(text):
-            start = max(0, match.start() - 30)
-            end = min(len(text), match.end() + 30)
-            context = text[start:end]
-            if self._validate_ipv4(match.group()):
-                results.append({
-                    'ip': match.group(),
-                    'context': context
-                })
-        return results
+        return with_context(text, ((record['start'], record['end'], record['ip']) for record in self.scan(text)[0]), 'ip', 30)
 
 class IPv6Extractor:
     
 
-    def __init__(self):
+    def __init__(self, flags: int = 0):
         
-        self.pattern = re.compile(
-            r'\b(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}\b|'  
-            r'\b(?:[0-9a-fA-F]{1,4}:){1,7}:\b|'                
-            r'\b(?:[0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}\b|' 
-            r'\b::(?:[0-9a-fA-F]{1,4}:){0,6}[0-9a-fA-F]{1,4}\b|'
-            r'\b[0-9a-fA-F]{1,4}::(?:[0-9a-fA-F]{1,4}:){0,5}[0-9a-fA-F]{1,4}\b|'
-            r'\b[0-9a-fA-F]{1,4}:[0-9a-fA-F]{1,4}::(?:[0-9a-fA-F]{1,4}:){0,4}[0-9a-fA-F]{1,4}\b|'
-            r'\b(?:[0-9a-fA-F]{1,4}:){0,2}[0-9a-fA-F]{1,4}::(?:[0-9a-fA-F]{1,4}:){0,3}[0-9a-fA-F]{1,4}\b|'
-            r'\b(?:[0-9a-fA-F]{1,4}:){0,3}[0-9a-fA-F]{1,4}::(?:[0-9a-fA-F]{1,4}:){0,2}[0-9a-fA-F]{1,4}\b|'
-            r'\b(?:[0-9a-fA-F]{1,4}:){0,4}[0-9a-fA-F]{1,4}::(?:[0-9a-fA-F]{1,4}:)?[0-9a-fA-F]{1,4}\b|'
-            r'\b(?:[0-9a-fA-F]{1,4}:){0,5}[0-9a-fA-F]{1,4}::[0-9a-fA-F]{1,4}\b|'
-            r'\b(?:[0-9a-fA-F]{1,4}:){0,6}[0-9a-fA-F]{1,4}::\b'
-        )
-        
-        self.cidr_pattern = re.compile(
-            r'\b(?:(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}|'  
-            r'(?:[0-9a-fA-F]{1,4}:){1,7}:|'                
-            r'(?:[0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}|'
-            r'::(?:[0-9a-fA-F]{1,4}:){0,6}[0-9a-fA-F]{1,4}|'
-            r'[0-9a-fA-F]{1,4}::(?:[0-9a-fA-F]{1,4}:){0,5}[0-9a-fA-F]{1,4}|'
-            r'[0-9a-fA-F]{1,4}:[0-9a-fA-F]{1,4}::(?:[0-9a-fA-F]{1,4}:){0,4}[0-9a-fA-F]{1,4}|'
-            r'(?:[0-9a-fA-F]{1,4}:){0,2}[0-9a-fA-F]{1,4}::(?:[0-9a-fA-F]{1,4}:){0,3}[0-9a-fA-F]{1,4}|'
-            r'(?:[0-9a-fA-F]{1,4}:){0,3}[0-9a-fA-F]{1,4}::(?:[0-9a-fA-F]{1,4}:){0,2}[0-9a-fA-F]{1,4}|'
-            r'(?:[0-9a-fA-F]{1,4}:){0,4}[0-9a-fA-F]{1,4}::(?:[0-9a-fA-F]{1,4}:)?[0-9a-fA-F]{1,4}|'
-            r'(?:[0-9a-fA-F]{1,4}:){0,5}[0-9a-fA-F]{1,4}::[0-9a-fA-F]{1,4}|'
-            r'(?:[0-9a-fA-F]{1,4}:){0,6}[0-9a-fA-F]{1,4}::)/'
-            r'(?:[1-9]|[1-9][0-9]|1[0-1][0-9]|12[0-8])\b'  
+        # One scan for both forms: a run of hex groups and colons with at
+        # least one '::' or seven ':', then an optional /prefix. A run
+        # followed by three more dotted octets is the head of an IPv4-mapped
+        # address such as ::ffff:192.168.1.1 and is not reported.
+        self.candidate_pattern = re.compile(
+            r'(?<![\w:])(?=:*[0-9a-fA-F])'
+            r'((?:[0-9a-fA-F]{1,4})?(?::[0-9a-fA-F]{0,4}){2,8})'
+            r'(?:/([0-9]{1,3}))?'
+            r'(?![\w:]|(?:\.[0-9]{1,3}){3}(?![0-9]))',
+            flags
         )
+        self.prefilter = Prefilter(literals=(':',), min_hex_run=1)
+
+    @staticmethod
+    def parse_address(candidate: str) -> Optional[int]:
+
+        head, compressed, tail = candidate.partition('::')
+        if compressed:
+            if '::' in tail:
+                return None
+            groups = head.split(':') if head else []
+            right = tail.split(':') if tail else []
+            missing = 8 - len(groups) - len(right)
+            if missing < 1:
+                return None
+            groups += ['0'] * missing + right
+        else:
+            groups = candidate.split(':')
+            if len(groups) != 8:
+                return None
+
+        value = 0
+        for group in groups:
+            if not 0 < len(group) <= 4 or group.strip(HEX_DIGITS):
+                return None
+            value = (value << 16) | int(group, 16)
+        return value
+
+    @staticmethod
+    def parse_prefix(prefix: str) -> Optional[int]:
+
+        if not (0 < len(prefix) <= 3 and prefix.isascii() and prefix.isdigit()):
+            return None
+        number = int(prefix)
+        return number if number <= 128 else None
+
+    def scan(self, text: str) -> Tuple[List[dict], List[dict]]:
+
+        addresses: List[dict] = []
+        networks: List[dict] = []
+        for key, record in self.iter_scan(text):
+            (addresses if key == 'ipv6' else networks).append(record)
+        return addresses, networks
+
+    def iter_scan(self, text: str) -> Iterator[Tuple[str, dict]]:
+
+        for match in self.candidate_pattern.finditer(text):
+            candidate, prefix = match.groups()
+            value = self.parse_address(candidate)
+            if value is None:
+                continue
+            address = candidate.lower()
+            start = match.start()
+            yield 'ipv6', {'ip': address, 'value': value, 'start': start, 'end': start + len(candidate)}
+            if prefix and prefix[0] != '0' and int(prefix) <= 128:
+                yield 'cidr6', {'cidr': f"{address}/{prefix}", 'value': value, 'prefix': int(prefix), 'start': start, 'end': match.end()}
 
     def extract_ips(self, text: str) -> List[str]:
         
-        matches = self.pattern.findall(text)
-        validated = []
-        for match in matches:
-            if self._validate_ipv6(match):
-                validated.append(match.lower())
-        return validated
+        return [record['ip'] for record in self.scan(text)[0]]
 
     def extract_cidrs(self, text: str) -> List[str]:
         
-        matches = self.cidr_pattern.findall(text)
-        validated = []
-        for match in matches:
-            if self._validate_ipv6_cidr(match):
-                validated.append(match.lower())
-        return validated
+        return [record['cidr'] for record in self.scan(text)[1]]
 
     def _validate_ipv6(self, candidate: str) -> bool:
         
-        try:
-            ipaddress.IPv6Address(candidate)
-            return True
-        except ipaddress.AddressValueError:
-            return False
+        return self.parse_address(candidate) is not None
 
     def _validate_ipv6_cidr(self, candidate: str) -> bool:
         
-        try:
-            ipaddress.IPv6Network(candidate, strict=False)
-            return True
-        except (ipaddress.AddressValueError, ValueError):
-            return False
+        address, _, prefix = candidate.partition('/')
+        return self.parse_address(address) is not None and self.parse_prefix(prefix) is not None
 
     def extract_ips_with_context(self, text: str) -> List[dict]:
         
-        results = []
-        for match in self.pattern.finditer(text):
-            start = max(0, match.start() - 30)
-            end = min(len(text), match.end() + 30)
-            context = text[start:end]
-            if self._validate_ipv6(match.group()):
-                results.append({
-                    'ip': match.group().lower(),
-                    'context': context
-                })
-        return results
+        return with_context(text, ((record['start'], record['end'], record['ip']) for record in self.scan(text)[0]), 'ip', 30)
 
 class IPExtractor:
     
 
-    def __init__(self):
-        self.ipv4_extractor = IPv4Extractor()
-        self.ipv6_extractor = IPv6Extractor()
+    def __init__(self, flags: int = 0):
+        self.ipv4_extractor = IPv4Extractor(flags)
+        self.ipv6_extractor = IPv6Extractor(flags)
+
+    def scan(self, text: str, chains: Optional[List[DigitChain]] = None, ipv4: bool = True, ipv6: bool = True) -> Dict[str, List[dict]]:
+
+        addresses4, networks4 = self.ipv4_extractor.scan(text, chains) if ipv4 else ([], [])
+        addresses6, networks6 = self.ipv6_extractor.scan(text) if ipv6 else ([], [])
+        return {'ipv4': addresses4, 'ipv6': addresses6, 'cidr4': networks4, 'cidr6': networks6}
+
+    def iter_scan(self, text: str, chains: Optional[Iterable[DigitChain]] = None, ipv4: bool = True, ipv6: bool = True) -> Iterator[Tuple[str, dict]]:
+
+        if ipv4:
+            yield from self.ipv4_extractor.iter_scan(text, chains)
+        if ipv6:
+            yield from self.ipv6_extractor.iter_scan(text)
 
-    def extract_ips(self, text: str) -> dict:
+    def extract_ips(self, text: str, chains: Optional[List[DigitChain]] = None, ipv4: bool = True, ipv6: bool = True) -> dict:
         
+        records = self.scan(text, chains, ipv4, ipv6)
         return {
-            'ipv4': self.ipv4_extractor.extract_ips(text),
-            'ipv6': self.ipv6_extractor.extract_ips(text),
-            'cidr4': self.ipv4_extractor.extract_cidrs(text),
-            'cidr6': self.ipv6_extractor.extract_cidrs(text)
+            'ipv4': [record['ip'] for record in records['ipv4']],
+            'ipv6': [record['ip'] for record in records['ipv6']],
+            'cidr4': [record['cidr'] for record in records['cidr4']],
+            'cidr6': [record['cidr'] for record in records['cidr6']]
         }
 
     def extract_all_ips(self, text: str) -> List[str]:
         
-        ipv4 = self.ipv4_extractor.extract_ips(text)
-        ipv6 = self.ipv6_extractor.extract_ips(text)
-        cidr4 = self.ipv4_extractor.extract_cidrs(text)
-        cidr6 = self.ipv6_extractor.extract_cidrs(text)
-        return ipv4 + ipv6 + cidr4 + cidr6
\ No newline at end of file
+        ips = self.extract_ips(text)
+        return ips['ipv4'] + ips['ipv6'] + ips['cidr4'] + ips['cidr6']
\ No newline at end of file
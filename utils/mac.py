@@ -1,5 +1,8 @@
 import re
-from typing import List
+from typing import Iterator, List, Tuple
+from utils.alphabets import HEX
+from utils.matches import with_context
+from utils.prefilter import Prefilter
 
 class MACValidator:
     
@@ -7,7 +10,7 @@ class MACValidator:
     @staticmethod
     def is_valid_hex(s: str) -> bool:
         
-        return all(c in '0123456789abcdefABCDEF' for c in s)
+        return HEX.matches(s)
 
     @staticmethod
     def normalize_mac(mac: str) -> str:
@@ -22,10 +25,11 @@ class MACValidator:
 class MACExtractor:
     
 
-    def __init__(self):
+    def __init__(self, flags: int = 0):
         
-        self.colon_pattern = re.compile(r'\b(?:[0-9a-fA-F]{2}:){5}[0-9a-fA-F]{2}\b')  
-        self.dash_pattern = re.compile(r'\b(?:[0-9a-fA-F]{2}-){5}[0-9a-fA-F]{2}\b')   
+        self.colon_pattern = re.compile(r'\b(?:[0-9a-fA-F]{2}:){5}[0-9a-fA-F]{2}\b', flags)  
+        self.dash_pattern = re.compile(r'\b(?:[0-9a-fA-F]{2}-){5}[0-9a-fA-F]{2}\b', flags)   
+        self.prefilter = Prefilter(literals=(':', '-'), min_hex_run=2)
 
     def extract_macs(self, text: str) -> List[str]:
         
@@ -37,6 +41,13 @@ class MACExtractor:
 
         return list(macs)
 
+    def iter_spans(self, text: str) -> Iterator[Tuple[int, int, str]]:
+
+        for pattern in (self.colon_pattern, self.dash_pattern):
+            for match in pattern.finditer(text):
+                if self._validate_mac(match.group()):
+                    yield match.start(), match.end(), MACValidator.normalize_mac(match.group())
+
     def _extract_from_pattern(self, text: str, pattern: re.Pattern) -> List[str]:
         
         matches = pattern.findall(text)
@@ -76,27 +87,4 @@ class MACExtractor:
 
     def extract_macs_with_context(self, text: str) -> List[dict]:
         
-        results = []
-        all_patterns = [self.colon_pattern, self.dash_pattern, self.dot_pattern, self.no_sep_pattern]
-
-        for pattern in all_patterns:
-            for match in pattern.finditer(text):
-                mac = match.group()
-                if self._validate_mac(mac):
-                    start = max(0, match.start() - 40)
-                    end = min(len(text), match.end() + 40)
-                    context = text[start:end]
-                    results.append({
-                        'mac': MACValidator.normalize_mac(mac),
-                        'context': context
-                    })
-
-        
-        seen = set()
-        unique_results = []
-        for result in results:
-            if result['mac'] not in seen:
-                seen.add(result['mac'])
-                unique_results.append(result)
-
-        return unique_results
\ No newline at end of file
+        return with_context(text, self.iter_spans(text), 'mac', 40, unique=True)
@@ -0,0 +1,48 @@
+from typing import Iterable, List, Tuple
+
+class ExtractionResult(dict):
+
+
+    __slots__ = ('truncated', 'skipped')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Set when a deadline stopped the scan: the types in skipped were
+        # not scanned to the end, and their lists may be partial or missing.
+        self.truncated = False
+        self.skipped: List[str] = []
+
+class MatchRecord:
+
+
+    __slots__ = ('type', 'start', 'end', 'value', 'source')
+
+    def __init__(self, type: str, start: int, end: int, value: str, source: str):
+        self.type = type
+        self.start = start
+        self.end = end
+        self.value = value
+        self.source = source
+
+    @property
+    def text(self) -> str:
+        return self.source[self.start:self.end]
+
+    def context(self, width: int = 30) -> str:
+        # Sliced on demand from the scanned text, so records stay small.
+        return self.source[max(0, self.start - width):self.end + width]
+
+    def __repr__(self) -> str:
+        return f"MatchRecord({self.type!r}, {self.start}, {self.end}, {self.value!r})"
+
+def with_context(text: str, spans: Iterable[Tuple[int, int, str]], key: str, width: int, unique: bool = False) -> List[dict]:
+
+    results = []
+    seen = set()
+    for start, end, value in spans:
+        if unique:
+            if value in seen:
+                continue
+            seen.add(value)
+        results.append({key: value, 'context': text[max(0, start - width):end + width]})
+    return results
@@ -0,0 +1,169 @@
+import itertools
+import re
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+from utils.prefilter import Prefilter
+
+_SHAPE_TABLE = str.maketrans('0123456789', 'dddddddddd')
+
+_SPLIT = re.compile(r'[-./ ]')
+
+class DigitChain:
+
+
+    __slots__ = ('text', 'shape', 'start', 'bounded_left', 'bounded_right', '_groups')
+
+    def __init__(self, text: str, shape: str, start: int, bounded_left: bool, bounded_right: bool):
+        self.text = text
+        self.shape = shape
+        self.start = start
+        self.bounded_left = bounded_left
+        self.bounded_right = bounded_right
+        self._groups = None
+
+    @property
+    def groups(self) -> List[str]:
+        if self._groups is None:
+            self._groups = _SPLIT.split(self.text)
+        return self._groups
+
+    @property
+    def separators(self) -> List[str]:
+        return _SPLIT.findall(self.text)
+
+class LazyChains:
+
+
+    __slots__ = ('_source', '_seen')
+
+    def __init__(self, source: Iterator[DigitChain]):
+        self._source = source
+        self._seen: List[DigitChain] = []
+
+    def __iter__(self) -> Iterator[DigitChain]:
+        # Every pass replays the chains read so far and then reads on from
+        # the shared source, so several lazy consumers tokenize the text once.
+        seen = self._seen
+        i = 0
+        while True:
+            if i == len(seen):
+                chain = next(self._source, None)
+                if chain is None:
+                    return
+                seen.append(chain)
+            yield seen[i]
+            i += 1
+
+class NumericShape:
+
+
+    __slots__ = ('widths', 'separators', 'check', 'shapes', 'needed', 'min_length')
+
+    def __init__(self, widths: Sequence[Tuple[int, int]], separators: str, check: Optional[Callable[[List[str]], bool]] = None):
+        self.widths = tuple(widths)
+        self.separators = separators
+        self.check = check
+        self.needed = [(sep, separators.count(sep)) for sep in set(separators)]
+        self.min_length = sum(low for low, _ in self.widths) + len(separators)
+
+        self.shapes = set()
+        for lengths in itertools.product(*(range(low, high + 1) for low, high in self.widths)):
+            shape = 'd' * lengths[0]
+            for sep, length in zip(separators, lengths[1:]):
+                shape += sep + 'd' * length
+            self.shapes.add(shape)
+
+    def accepts(self, groups: List[str]) -> bool:
+
+        for group, (low, high) in zip(groups, self.widths):
+            if not low <= len(group) <= high:
+                return False
+        return self.check is None or self.check(groups)
+
+class NumericTokenizer:
+
+
+    def __init__(self, flags: int = 0):
+        # Chains of digit groups joined by single separators. Chains that have
+        # fewer than two separators and no 13+ digit group cannot hold a card,
+        # SSN or IPv4 candidate, so the scan skips them without leaving C.
+        # The pattern opens with a plain \d, rather than the lookbehind, so
+        # that the engine can jump between digits instead of trying every
+        # position of the text.
+        self.pattern = re.compile(r'\d(?<!\d\d)(?:\d*(?:[-./ ]\d+){2,}|\d{12,})', flags)
+        self.prefilter = Prefilter(min_digits=3)
+
+    def tokenize(self, text: str) -> List[DigitChain]:
+
+        spans = [match.span() for match in self.pattern.finditer(text)]
+        if not spans:
+            return []
+        texts = [text[start:end] for start, end in spans]
+        shapes = '\n'.join(texts).translate(_SHAPE_TABLE).split('\n')
+        return [self._chain(text, chain, shape, start, end) for chain, shape, (start, end) in zip(texts, shapes, spans)]
+
+    def iter_chains(self, text: str) -> Iterator[DigitChain]:
+
+        # Lazy form of tokenize() for callers that may stop at the first hit.
+        for match in self.pattern.finditer(text):
+            chain = match.group()
+            yield self._chain(text, chain, chain.translate(_SHAPE_TABLE), match.start(), match.end())
+
+    @staticmethod
+    def _chain(text: str, chain: str, shape: str, start: int, end: int) -> DigitChain:
+
+        before = text[start - 1] if start else ' '
+        after = text[end] if end < len(text) else ' '
+        return DigitChain(
+            chain,
+            shape,
+            start,
+            not (before.isalnum() or before == '_'),
+            not (after.isalnum() or after == '_'),
+        )
+
+    @staticmethod
+    def iter_sequences(chains: List[DigitChain], shape: NumericShape) -> Iterator[Tuple[int, int, List[str]]]:
+
+        width = len(shape.widths)
+        min_length = shape.min_length
+        for chain in chains:
+            text = chain.text
+            if len(text) < min_length:
+                continue
+            # Usual case: the whole chain is exactly one candidate.
+            if chain.shape in shape.shapes:
+                if chain.bounded_left and chain.bounded_right and (shape.check is None or shape.check(chain.groups)):
+                    yield chain.start, chain.start + len(text), chain.groups
+                continue
+            if any(text.count(sep) < needed for sep, needed in shape.needed):
+                continue
+            groups = chain.groups
+            count = len(groups)
+            if count < width or (count == width and text.isascii()):
+                continue
+            low, high = shape.widths[0]
+            if not any(low <= len(group) <= high for group in groups):
+                continue
+
+            # Leftmost, non-overlapping windows of whole groups, which is what
+            # a \b-anchored findall over the same shape would return.
+            seps = chain.separators
+            separators = list(shape.separators)
+            last = count - width
+            i = 0
+            # Separators are single characters, so the offset of group i is
+            # the length of the groups before it plus i.
+            start = chain.start
+            while i <= last:
+                if ((i > 0 or chain.bounded_left)
+                        and (i < last or chain.bounded_right)
+                        and seps[i:i + width - 1] == separators
+                        and shape.accepts(groups[i:i + width])):
+                    window = groups[i:i + width]
+                    end = start + sum(map(len, window)) + width - 1
+                    yield start, end, window
+                    start = end + 1
+                    i += width
+                else:
+                    start += len(groups[i]) + 1
+                    i += 1
@@ -1,6 +1,8 @@
-import re
-import base64
-from typing import List
+from typing import Iterator, List, Optional, Tuple
+from utils.alphabets import BASE64
+from utils.matches import with_context
+from utils.passwords.mcf import MCFTokenizer, base64_length, is_number
+from utils.prefilter import Prefilter
 
 class Argon2Validator:
     
@@ -8,145 +10,81 @@ class Argon2Validator:
     @staticmethod
     def is_valid_base64(s: str) -> bool:
 
-        try:
-            base64.b64decode(s, validate=True)
-            return True
-        except Exception:
-            # Try adding padding
-            for pad in ['', '=', '==']:
-                try:
-                    base64.b64decode(s + pad, validate=True)
-                    return True
-                except Exception:
-                    pass
-            return False
+        return base64_length(s) == len(s)
 
     @staticmethod
-    def is_valid_version(version: str) -> bool:
+    def is_valid_version(version: Optional[str]) -> bool:
         
         return version == '19'  
 
     @staticmethod
-    def is_valid_memory(memory: str) -> bool:
+    def is_valid_memory(memory: Optional[str]) -> bool:
 
-        try:
-            mem = int(memory)
-            return 1 <= mem <= 2**32
-        except ValueError:
-            return False
+        return is_number(memory, 1, 2**32)
 
     @staticmethod
-    def is_valid_iterations(iterations: str) -> bool:
+    def is_valid_iterations(iterations: Optional[str]) -> bool:
         
-        try:
-            it = int(iterations)
-            return 1 <= it <= 2**32
-        except ValueError:
-            return False
+        return is_number(iterations, 1, 2**32)
 
     @staticmethod
-    def is_valid_parallelism(parallelism: str) -> bool:
+    def is_valid_parallelism(parallelism: Optional[str]) -> bool:
         
-        try:
-            par = int(parallelism)
-            return 1 <= par <= 2**24
-        except ValueError:
-            return False
+        return is_number(parallelism, 1, 2**24)
 
 class Argon2Extractor:
     
 
-    def __init__(self):
+    schemes = ('argon2i', 'argon2d', 'argon2id')
+
+    def __init__(self, flags: int = 0):
         
-        self.pattern = re.compile(r'\$argon2(?:id|d|i)?\$.*')
+        self.tokenizer = MCFTokenizer(self.schemes, flags)
+        self.prefilter = Prefilter(literals=('$argon2',))
 
     def extract_hashes(self, text: str) -> List[str]:
         
-        matches = self.pattern.findall(text)
-        validated = []
-        for match in matches:
-            if self._validate_argon2(match):
-                validated.append(match)
-        return validated
+        return [value for _, _, value in self.iter_spans(text)]
 
-    def _validate_argon2(self, candidate: str) -> bool:
+    def iter_spans(self, text: str) -> Iterator[Tuple[int, int, str]]:
 
-        if not candidate.startswith(('$argon2i$', '$argon2d$', '$argon2id$')):
-            return False
+        for start, end, _ in self.tokenizer.iter_spans(text, self.measure):
+            yield start, end, text[start:end]
 
-        parts = candidate.split('$')
-        if len(parts) < 6:
-            return False
+    def measure(self, scheme: str, fields: List[str]) -> Optional[Tuple[int, int]]:
 
-        variant = parts[1]
+        # $argon2id$v=19$m=65536,t=3,p=4$<salt>$<hash>
+        if len(fields) < 4:
+            return None
 
-        
         params = {}
-        i = 2
-        while i < len(parts) and '=' in parts[i]:
-            for sub in parts[i].split(','):
+        i = 0
+        while i < len(fields) and '=' in fields[i]:
+            for sub in fields[i].split(','):
                 if '=' in sub:
                     key, value = sub.split('=', 1)
                     params[key] = value
             i += 1
-
-        
-        if i >= len(parts):
-            return False
-        salt_b64 = parts[i]
-        i += 1
-
-        
-        if i >= len(parts):
-            return False
-        hash_b64 = parts[i]
-
-        version = params.get('v')
-        memory = params.get('m')
-        iterations = params.get('t')
-        parallelism = params.get('p')
-
-        if not Argon2Validator.is_valid_version(version):
-            return False
-
-        if not Argon2Validator.is_valid_memory(memory):
-            return False
-
-        if not Argon2Validator.is_valid_iterations(iterations):
-            return False
-
-        if not Argon2Validator.is_valid_parallelism(parallelism):
-            return False
-
-
-        if not Argon2Validator.is_valid_base64(salt_b64):
-            return False
-
-        if not Argon2Validator.is_valid_base64(hash_b64):
-            return False
-
-
-
-        if len(salt_b64) != 22:
-            return False
-
-
-        if len(hash_b64) < 40:
-            return False
-
-        return True
+        if i + 2 > len(fields):
+            return None
+
+        if not Argon2Validator.is_valid_version(params.get('v')):
+            return None
+        if not Argon2Validator.is_valid_memory(params.get('m')):
+            return None
+        if not Argon2Validator.is_valid_iterations(params.get('t')):
+            return None
+        if not Argon2Validator.is_valid_parallelism(params.get('p')):
+            return None
+
+        salt = fields[i]
+        if len(salt) != 22 or not BASE64.matches(salt):
+            return None
+        length = base64_length(fields[i + 1])
+        if length < 40:
+            return None
+        return i + 2, length
 
     def extract_hashes_with_context(self, text: str) -> List[dict]:
         
-        results = []
-        for match in self.pattern.finditer(text):
-            hash_str = match.group()
-            if self._validate_argon2(hash_str):
-                start = max(0, match.start() - 20)
-                end = min(len(text), match.end() + 20)
-                context = text[start:end]
-                results.append({
-                    'hash': hash_str,
-                    'context': context
-                })
-        return results
\ No newline at end of file
+        return with_context(text, self.iter_spans(text), 'hash', 20)
@@ -1,5 +1,8 @@
-import re
-from typing import List
+from typing import Iterator, List, Optional, Tuple
+from utils.alphabets import CRYPT64
+from utils.matches import with_context
+from utils.passwords.mcf import MCFTokenizer, is_number
+from utils.prefilter import Prefilter
 
 class BcryptValidator:
     
@@ -9,81 +12,41 @@ class BcryptValidator:
     @staticmethod
     def is_valid_base64_bcrypt(s: str) -> bool:
         
-        return all(c in BcryptValidator.BASE64_CHARS for c in s)
+        return CRYPT64.matches(s)
 
     @staticmethod
     def is_valid_cost(cost: str) -> bool:
         
-        try:
-            cost_int = int(cost)
-            return 4 <= cost_int <= 31  
-        except ValueError:
-            return False
+        return len(cost) == 2 and is_number(cost, 4, 31)
 
 class BcryptExtractor:
     
 
-    def __init__(self):
-        
-        
-        self.pattern = re.compile(r'\$2[aby]\$\d{2}\$[./A-Za-z0-9]{53}')
+    schemes = ('2a', '2b', '2y')
 
-    def extract_hashes(self, text: str) -> List[str]:
+    def __init__(self, flags: int = 0):
         
-        matches = self.pattern.findall(text)
-        validated = []
-        for match in matches:
-            if self._validate_bcrypt(match):
-                validated.append(match)
-        return validated
+        self.tokenizer = MCFTokenizer(self.schemes, flags)
+        self.prefilter = Prefilter(literals=('$2',))
 
-    def _validate_bcrypt(self, candidate: str) -> bool:
+    def extract_hashes(self, text: str) -> List[str]:
         
-        if not candidate.startswith(('$2a$', '$2b$', '$2y$')):
-            return False
-
-        parts = candidate.split('$')
-        if len(parts) != 4:
-            return False
-
-        version, cost, salt_and_hash = parts[1], parts[2], parts[3]
+        return [value for _, _, value in self.iter_spans(text)]
 
-        if not BcryptValidator.is_valid_cost(cost):
-            return False
+    def iter_spans(self, text: str) -> Iterator[Tuple[int, int, str]]:
 
-        if len(salt_and_hash) != 53:
-            return False
+        for start, end, _ in self.tokenizer.iter_spans(text, self.measure):
+            yield start, end, text[start:end]
 
-        salt = salt_and_hash[:22]
-        hash_part = salt_and_hash[22:]
-
-        if len(salt) != 22 or len(hash_part) != 31:
-            return False
-
-        if not BcryptValidator.is_valid_base64_bcrypt(salt):
-            return False
-
-        if not BcryptValidator.is_valid_base64_bcrypt(hash_part):
-            return False
-
-        
-        
-        if candidate in ['$2a$10$abcdefghijklmnopqrsABCDEFGHIJ', '$2b$10$abcdefghijklmnopqrsABCDEFGHIJ']:
-            return False
+    def measure(self, scheme: str, fields: List[str]) -> Optional[Tuple[int, int]]:
 
-        return True
+        # $2b$<cost>$<22-character salt><31-character hash>
+        if len(fields) < 2 or not BcryptValidator.is_valid_cost(fields[0]):
+            return None
+        if len(fields[1]) < 53 or not BcryptValidator.is_valid_base64_bcrypt(fields[1][:53]):
+            return None
+        return 2, 53
 
     def extract_hashes_with_context(self, text: str) -> List[dict]:
         
-        results = []
-        for match in self.pattern.finditer(text):
-            hash_str = match.group()
-            if self._validate_bcrypt(hash_str):
-                start = max(0, match.start() - 20)
-                end = min(len(text), match.end() + 20)
-                context = text[start:end]
-                results.append({
-                    'hash': hash_str,
-                    'context': context
-                })
-        return results
\ No newline at end of file
+        return with_context(text, self.iter_spans(text), 'hash', 20)
@@ -0,0 +1,95 @@
+import re
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from utils.alphabets import DIGITS
+
+FIELD_CHARS = r'A-Za-z0-9./+=,'
+MAX_FIELD = 256
+MAX_FIELDS = 4
+MIN_LAST = 22
+
+BASE64_RUN = re.compile(r'[A-Za-z0-9+/]*')
+
+# (fields used, characters of the last used field that belong to the hash),
+# or None when the fields are not a valid hash of the scheme.
+Measure = Callable[[str, List[str]], Optional[Tuple[int, int]]]
+
+def is_number(value: Optional[str], low: int, high: int) -> bool:
+
+    return bool(value) and len(value) <= 10 and DIGITS.matches(value) and low <= int(value) <= high
+
+def base64_length(field: str) -> int:
+
+    # The base64 prefix of a field, with its '=' padding when the padding is
+    # valid; 0 when the prefix cannot be base64 at all.
+    body = BASE64_RUN.match(field).end()
+    if body % 4 == 1:
+        return 0
+    padding = len(field) - body - len(field[body:].lstrip('='))
+    if padding and body % 4 == 2:
+        return body + min(padding, 2)
+    if padding and body % 4 == 3:
+        return body + 1
+    return body
+
+class MCFTokenizer:
+
+
+    def __init__(self, schemes: Iterable[str], flags: int = 0):
+
+        # '$scheme' and at most MAX_FIELDS '$'-separated fields of at most
+        # MAX_FIELD characters each, so no candidate runs to the end of its
+        # line and every scan is linear in the text. Every format ends in a
+        # salt or checksum of at least MIN_LAST characters. The lookahead and
+        # backreference make each field atomic: a field is never retried
+        # shorter, since only its full length can be followed by a '$'.
+        alternatives = '|'.join(re.escape(scheme) for scheme in sorted(schemes, key=len, reverse=True))
+        self.pattern = re.compile(
+            rf'\$({alternatives})((?:\$(?=([{FIELD_CHARS}]{{0,{MAX_FIELD}}}))\3){{0,{MAX_FIELDS - 1}}}'
+            rf'\$[{FIELD_CHARS}]{{{MIN_LAST},{MAX_FIELD}}})',
+            flags
+        )
+
+    def iter_spans(self, text: str, measure: Measure) -> Iterator[Tuple[int, int, str]]:
+
+        search = self.pattern.search
+        match = search(text)
+        while match:
+            scheme = match.group(1)
+            fields = match.group(2)[1:].split('$')
+            used = measure(scheme, fields)
+            if used is None:
+                # A hash can still start at the '$' after the scheme.
+                match = search(text, match.end(1))
+                continue
+            count, last = used
+            start = match.start()
+            end = match.end(1) + sum(map(len, fields[:count - 1])) + count + last
+            yield start, end, scheme
+            match = search(text, end)
+
+class MCFDispatcher:
+
+
+    def __init__(self, extractors: Dict[str, object], flags: int = 0):
+
+        self.by_scheme: Dict[str, Tuple[str, object]] = {}
+        for name, extractor in extractors.items():
+            for scheme in extractor.schemes:
+                self.by_scheme[scheme] = (name, extractor)
+        self.tokenizer = MCFTokenizer(self.by_scheme, flags)
+
+    def measure(self, scheme: str, fields: List[str]) -> Optional[Tuple[int, int]]:
+
+        return self.by_scheme[scheme][1].measure(scheme, fields)
+
+    def iter_spans(self, text: str) -> Iterator[Tuple[int, int, str, str]]:
+
+        for start, end, scheme in self.tokenizer.iter_spans(text, self.measure):
+            yield start, end, text[start:end], self.by_scheme[scheme][0]
+
+    def extract_hashes(self, text: str) -> Dict[str, List[str]]:
+
+        results: Dict[str, List[str]] = {}
+        for _, _, value, name in self.iter_spans(text):
+            results.setdefault(name, []).append(value)
+        return results
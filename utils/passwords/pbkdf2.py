@@ -0,0 +1,43 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+from utils.alphabets import CRYPT64
+from utils.matches import with_context
+from utils.passwords.mcf import MCFTokenizer, is_number
+from utils.prefilter import Prefilter
+
+class PBKDF2Extractor:
+
+
+    # passlib's $pbkdf2-<digest>$<rounds>$<salt>$<checksum>, in adapted
+    # base64; the checksum is as long as the digest.
+    HASH_LENGTHS: Dict[str, int] = {'pbkdf2': 27, 'pbkdf2-sha256': 43, 'pbkdf2-sha512': 86}
+    schemes = tuple(HASH_LENGTHS)
+
+    def __init__(self, flags: int = 0):
+
+        self.tokenizer = MCFTokenizer(self.schemes, flags)
+        self.prefilter = Prefilter(literals=('$pbkdf2',))
+
+    def extract_hashes(self, text: str) -> List[str]:
+
+        return [value for _, _, value in self.iter_spans(text)]
+
+    def iter_spans(self, text: str) -> Iterator[Tuple[int, int, str]]:
+
+        for start, end, _ in self.tokenizer.iter_spans(text, self.measure):
+            yield start, end, text[start:end]
+
+    def measure(self, scheme: str, fields: List[str]) -> Optional[Tuple[int, int]]:
+
+        if len(fields) < 3 or not is_number(fields[0], 1, 2**32):
+            return None
+        salt, data = fields[1], fields[2]
+        if not salt or not CRYPT64.matches(salt):
+            return None
+        length = self.HASH_LENGTHS[scheme]
+        if len(data) < length or not CRYPT64.matches(data[:length]):
+            return None
+        return 3, length
+
+    def extract_hashes_with_context(self, text: str) -> List[dict]:
+
+        return with_context(text, self.iter_spans(text), 'hash', 20)
@@ -0,0 +1,57 @@
+from typing import Iterator, List, Optional, Tuple
+from utils.alphabets import BASE64, CRYPT64
+from utils.matches import with_context
+from utils.passwords.mcf import MCFTokenizer, base64_length, is_number
+from utils.prefilter import Prefilter
+
+class ScryptExtractor:
+
+
+    schemes = ('scrypt', '7')
+
+    def __init__(self, flags: int = 0):
+
+        self.tokenizer = MCFTokenizer(self.schemes, flags)
+        self.prefilter = Prefilter(literals=('$scrypt$', '$7$'))
+
+    def extract_hashes(self, text: str) -> List[str]:
+
+        return [value for _, _, value in self.iter_spans(text)]
+
+    def iter_spans(self, text: str) -> Iterator[Tuple[int, int, str]]:
+
+        for start, end, _ in self.tokenizer.iter_spans(text, self.measure):
+            yield start, end, text[start:end]
+
+    def measure(self, scheme: str, fields: List[str]) -> Optional[Tuple[int, int]]:
+
+        if len(fields) < 2:
+            return None
+        if scheme == '7':
+            # $7$<N><r><p><salt>$<hash>: one character of log2(N), then five
+            # each of r and p, all in the crypt alphabet.
+            setting, data = fields[0], fields[1]
+            if len(setting) < 12 or not CRYPT64.matches(setting):
+                return None
+            if len(data) < 43 or not CRYPT64.matches(data[:43]):
+                return None
+            return 2, 43
+
+        # $scrypt$ln=16,r=8,p=1$<salt>$<hash>
+        if len(fields) < 3:
+            return None
+        params = dict(sub.split('=', 1) for sub in fields[0].split(',') if '=' in sub)
+        if not (is_number(params.get('ln'), 1, 63) and is_number(params.get('r'), 1, 2**30)
+                and is_number(params.get('p'), 1, 2**30)):
+            return None
+        salt = fields[1]
+        if not salt or not BASE64.matches(salt):
+            return None
+        length = base64_length(fields[2])
+        if length < 43:
+            return None
+        return 3, length
+
+    def extract_hashes_with_context(self, text: str) -> List[dict]:
+
+        return with_context(text, self.iter_spans(text), 'hash', 20)
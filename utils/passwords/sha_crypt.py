@@ -0,0 +1,59 @@
+from typing import Iterator, List, Optional, Tuple
+from utils.alphabets import CRYPT64
+from utils.matches import with_context
+from utils.passwords.mcf import MCFTokenizer, is_number
+from utils.prefilter import Prefilter
+
+class SHACryptExtractor:
+
+
+    schemes: Tuple[str, ...] = ()
+    hash_length = 0
+
+    def __init__(self, flags: int = 0):
+
+        self.tokenizer = MCFTokenizer(self.schemes, flags)
+        self.prefilter = Prefilter(literals=tuple(f'${scheme}$' for scheme in self.schemes))
+
+    def extract_hashes(self, text: str) -> List[str]:
+
+        return [value for _, _, value in self.iter_spans(text)]
+
+    def iter_spans(self, text: str) -> Iterator[Tuple[int, int, str]]:
+
+        for start, end, _ in self.tokenizer.iter_spans(text, self.measure):
+            yield start, end, text[start:end]
+
+    def measure(self, scheme: str, fields: List[str]) -> Optional[Tuple[int, int]]:
+
+        # $5$rounds=5000$<salt>$<hash>, where the rounds field is optional
+        # and the salt is at most 16 characters.
+        i = 0
+        if fields[0].startswith('rounds='):
+            if not is_number(fields[0][7:], 1000, 999999999):
+                return None
+            i = 1
+        if i + 2 > len(fields):
+            return None
+        salt, data = fields[i], fields[i + 1]
+        if not 0 < len(salt) <= 16 or not CRYPT64.matches(salt):
+            return None
+        if len(data) < self.hash_length or not CRYPT64.matches(data[:self.hash_length]):
+            return None
+        return i + 2, self.hash_length
+
+    def extract_hashes_with_context(self, text: str) -> List[dict]:
+
+        return with_context(text, self.iter_spans(text), 'hash', 20)
+
+class SHA256CryptExtractor(SHACryptExtractor):
+
+
+    schemes = ('5',)
+    hash_length = 43
+
+class SHA512CryptExtractor(SHACryptExtractor):
+
+
+    schemes = ('6',)
+    hash_length = 86
@@ -1,5 +1,6 @@
 import re
-from typing import List, Dict, Set
+from typing import Iterator, List, Dict, Optional, Set, Tuple
+from utils.prefilter import Prefilter
 
 class CountryCodeValidator:
     
@@ -16,69 +17,88 @@ class CountryCodeValidator:
         '590', '591', '592', '593', '594', '595', '596', '597', '598', '599', '670', '672', '673', '674', '675', '676', '677', '678', '679', '680',
         '681', '682', '683', '684', '685', '686', '687', '688', '689', '690', '691', '692', '850', '852', '853', '855', '856', '880', '886', '960', '961', '962', '963', '964', '965', '966', '967', '968', '970', '971', '972', '973', '974', '975', '976', '977', '992', '993', '994', '995', '996', '998',
         
-        '1', '1242', '1246', '1264', '1268', '1284', '1340', '1345', '1441', '1473', '1649', '1664', '1670', '1671', '1684', '1721', '1758', '1767', '1784', '1787', '1809', '1829', '1849', '1868', '1869', '1876', '1939', '441481', '441534', '441624', '441639', '473', '649', '671', '684', '689', '767', '809', '829', '849', '868', '869', '876', '939', '970', '971', '972', '973', '974', '975', '976', '977', '992', '993', '994', '995', '996', '998'
+        '1242', '1246', '1264', '1268', '1284', '1340', '1345', '1441', '1473', '1649', '1664', '1670', '1671', '1684', '1721', '1758', '1767', '1784', '1787', '1809', '1829', '1849', '1868', '1869', '1876', '1939', '441481', '441534', '441624', '441639', '473', '649', '671', '767', '809', '829', '849', '868', '869', '876', '939'
     }
 
     @staticmethod
     def is_valid_country_code(code: str) -> bool:
         return code in CountryCodeValidator.VALID_COUNTRY_CODES
 
-class PhoneExtractor:
+    @staticmethod
+    def longest_prefix(digits: str) -> Optional[str]:
+        return COUNTRY_CODE_TRIE.longest_prefix(digits)
+
+class CountryCodeTrie:
     
 
-    def __init__(self):
-        
-        
-        self.pattern = re.compile(
-            r'\+\s*(\d{1,4})\s*[\(\)\-\.\s/]*'  
-            r'(\d[\(\)\-\.\s/\d]*\d)'  
-            r'(?:\s*[\(\)\-\.\s/]*\d[\(\)\-\.\s/\d]*)*',  
-            re.VERBOSE
-        )
+    def __init__(self, codes: Set[str]):
+        self.root: Dict[str, dict] = {}
+        for code in codes:
+            node = self.root
+            for digit in code:
+                node = node.setdefault(digit, {})
+            node[''] = code
 
-    def extract_phones(self, text: str) -> List[str]:
-        
-        matches = self.pattern.findall(text)
-        validated = []
-        for match in matches:
-            country_code, number_part = match
-            full_number = f"+{country_code}{number_part}"
-            if self._validate_phone(full_number):
-                standardized = self._standardize_phone(full_number)
-                validated.append(standardized)
-        return validated
+    def longest_prefix(self, digits: str) -> Optional[str]:
 
-    def _validate_phone(self, candidate: str) -> bool:
-        
-        
-        cleaned = re.sub(r'[^\d+]', '', candidate)
-        if not cleaned.startswith('+'):
-            return False
+        node = self.root
+        found = None
+        for digit in digits:
+            node = node.get(digit)
+            if node is None:
+                break
+            found = node.get('', found)
+        return found
 
-        digits_only = cleaned[1:]  
+COUNTRY_CODE_TRIE = CountryCodeTrie(CountryCodeValidator.VALID_COUNTRY_CODES)
 
+class PhoneExtractor:
+    
+
+    def __init__(self, flags: int = 0):
         
-        country_code = digits_only[:4] if len(digits_only) >= 4 else digits_only
-        for i in range(1, len(country_code) + 1):
-            if CountryCodeValidator.is_valid_country_code(digits_only[:i]):
-                country_code = digits_only[:i]
-                break
-        else:
-            return False  
+        # After a '+' and optional whitespace, a number is one run of digits
+        # and ( ) - . / whitespace, from its first digit to its last, so
+        # padding after the number is not part of it. The run is read at most
+        # once per '+' and stops after 16 digits, one more than a number can
+        # have, so the scan is linear in the text. A number whose digits and
+        # inner separators span more than max_run characters is not reported.
+        self.max_run = 64
+        self.run_pattern = re.compile(r'\s*(\d(?:[()\-./\s]*\d){0,15})', flags)
+        self.non_digit_pattern = re.compile(r'\D', flags)
+        self.repeat_pattern = re.compile(r'(\d)\1{5}', flags)
+        self.prefilter = Prefilter(literals=('+',), min_digits=7)
 
-        if not CountryCodeValidator.is_valid_country_code(country_code):
-            return False
+    def iter_phones(self, text: str) -> Iterator[Tuple[int, int, str]]:
+
+        find = text.find
+        match_run = self.run_pattern.match
+        start = find('+')
+        while start != -1:
+            match = match_run(text, start + 1)
+            if match and len(match.group(1)) <= self.max_run:
+                digits = self.non_digit_pattern.sub('', match.group(1))
+                if self._validate_digits(digits):
+                    yield start, match.end(), '+' + digits
+            start = find('+', start + 1)
 
+    def extract_phones(self, text: str) -> List[str]:
         
-        total_digits = len(digits_only)
-        if total_digits < 7 or total_digits > 15:  
+        return [phone for _, _, phone in self.iter_phones(text)]
+
+    def _validate_digits(self, digits: str) -> bool:
+
+        if not 7 <= len(digits) <= 15:
             return False
+        if CountryCodeValidator.longest_prefix(digits) is None:
+            return False
+        return self.repeat_pattern.search(digits) is None
 
+    def _validate_phone(self, candidate: str) -> bool:
         
-        if re.search(r'(\d)\1{5,}', cleaned):  
+        if not candidate.startswith('+'):
             return False
-
-        return True
+        return self._validate_digits(self.non_digit_pattern.sub('', candidate))
 
     def _standardize_phone(self, phone: str) -> str:
         
@@ -88,15 +108,9 @@ class PhoneExtractor:
     def extract_phones_with_context(self, text: str) -> List[dict]:
         
         results = []
-        for match in self.pattern.finditer(text):
-            country_code, number_part = match.groups()
-            full_number = f"+{country_code}{number_part}"
-            if self._validate_phone(full_number):
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 50)
-                context = text[start:end]
-                results.append({
-                    'phone': self._standardize_phone(full_number),
-                    'context': context
-                })
+        for start, end, phone in self.iter_phones(text):
+            results.append({
+                'phone': phone,
+                'context': text[max(0, start - 50):min(len(text), end + 50)]
+            })
         return results
\ No newline at end of file
@@ -0,0 +1,84 @@
+import re
+from typing import Dict, Sequence
+
+HEX_MARKS = str.maketrans(dict.fromkeys('0123456789abcdefABCDEF', '\x00'))
+ALNUM_MARKS = str.maketrans(dict.fromkeys('0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ', '\x00'))
+DIGITS = str.maketrans(dict.fromkeys('0123456789'))
+UNICODE_ONLY_SPACES = '\x1c\x1d\x1e\x1f'
+
+class TextProfile:
+
+
+    def __init__(self, text: str):
+        self.text = text
+        self._literals: Dict[str, bool] = {}
+        self._digits = None
+        self._flags = None
+        self._marked: Dict[str, str] = {}
+
+    def has(self, literal: str) -> bool:
+        found = self._literals.get(literal)
+        if found is None:
+            found = self._literals[literal] = literal in self.text
+        return found
+
+    @property
+    def digits(self) -> int:
+        if self._digits is None:
+            text = self.text
+            # \d also matches non-ASCII digits, which are not counted here.
+            self._digits = len(text) - len(text.translate(DIGITS)) if text.isascii() else len(text)
+        return self._digits
+
+    @property
+    def pattern_flags(self) -> int:
+        if self._flags is None:
+            text = self.text
+            # On ASCII text, re.ASCII patterns match exactly what the Unicode
+            # ones do, except that Unicode \s also matches \x1c-\x1f.
+            ascii_only = text.isascii() and not any(space in text for space in UNICODE_ONLY_SPACES)
+            self._flags = re.ASCII if ascii_only else 0
+        return self._flags
+
+    def has_run(self, kind: str, length: int) -> bool:
+
+        # Characters of the run's class become NUL, so a run of the class is
+        # a run of NULs. NULs already in the text can only widen the guard.
+        marked = self._marked.get(kind)
+        if marked is None:
+            marked = self._marked[kind] = self.text.translate(HEX_MARKS if kind == 'hex' else ALNUM_MARKS)
+        return '\x00' * length in marked
+
+class Prefilter:
+
+
+    __slots__ = ('literals', 'min_digits', 'min_hex_run', 'min_alnum_run')
+
+    def __init__(self, literals: Sequence[str] = (), min_digits: int = 0, min_hex_run: int = 0, min_alnum_run: int = 0):
+        self.literals = tuple(literals)
+        self.min_digits = min_digits
+        self.min_hex_run = min_hex_run
+        self.min_alnum_run = min_alnum_run
+
+    def admits(self, profile: TextProfile) -> bool:
+
+        if self.literals and not any(profile.has(literal) for literal in self.literals):
+            return False
+        if self.min_digits and profile.digits < self.min_digits:
+            return False
+        if self.min_hex_run and not profile.has_run('hex', self.min_hex_run):
+            return False
+        if self.min_alnum_run and not profile.has_run('alnum', self.min_alnum_run):
+            return False
+        return True
+
+class AnyPrefilter:
+
+
+    __slots__ = ('prefilters',)
+
+    def __init__(self, *prefilters: Prefilter):
+        self.prefilters = prefilters
+
+    def admits(self, profile: TextProfile) -> bool:
+        return any(prefilter.admits(profile) for prefilter in self.prefilters)
@@ -0,0 +1,90 @@
+import importlib
+import threading
+from typing import Dict, Tuple
+
+# Type name -> (module, class). Nothing here is imported until a type is
+# first requested, so callers only pay for the extractors they use.
+EXTRACTORS: Dict[str, Tuple[str, str]] = {
+    'Email': ('utils.email', 'EmailExtractor'),
+    'Domain': ('utils.domain', 'DomainExtractor'),
+    'IP': ('utils.ip', 'IPExtractor'),
+    'Phone': ('utils.phone', 'PhoneExtractor'),
+    'SSN': ('utils.ssn', 'SSNExtractor'),
+    'MAC': ('utils.mac', 'MACExtractor'),
+    'Card': ('utils.card', 'CardExtractor'),
+    'Bitcoin': ('utils.cryptos.bitcoin_forks', 'BitcoinExtractor'),
+    'BitcoinCash': ('utils.cryptos.bitcoin_forks', 'BitcoinCashExtractor'),
+    'BitcoinSV': ('utils.cryptos.bitcoin_forks', 'BitcoinSVExtractor'),
+    'BitcoinGold': ('utils.cryptos.bitcoin_forks', 'BitcoinGoldExtractor'),
+    'Namecoin': ('utils.cryptos.bitcoin_forks', 'NamecoinExtractor'),
+    'EthereumEcosystem': ('utils.cryptos.ethereum_ecosystem', 'EthereumEcosystemExtractor'),
+    'Monero': ('utils.cryptos.privacy_coins', 'MoneroExtractor'),
+    'Zcash': ('utils.cryptos.privacy_coins', 'ZcashExtractor'),
+    'Dash': ('utils.cryptos.privacy_coins', 'DashExtractor'),
+    'Verge': ('utils.cryptos.privacy_coins', 'VergeExtractor'),
+    'Litecoin': ('utils.cryptos.litecoin_derivatives', 'LitecoinExtractor'),
+    'Dogecoin': ('utils.cryptos.litecoin_derivatives', 'DogecoinExtractor'),
+    'DigiByte': ('utils.cryptos.litecoin_derivatives', 'DigiByteExtractor'),
+    'Feathercoin': ('utils.cryptos.litecoin_derivatives', 'FeathercoinExtractor'),
+    'Ripple': ('utils.cryptos.ripple_stellar', 'RippleExtractor'),
+    'Stellar': ('utils.cryptos.ripple_stellar', 'StellarExtractor'),
+    'Cardano': ('utils.cryptos.cardano_tezos', 'CardanoExtractor'),
+    'Tezos': ('utils.cryptos.cardano_tezos', 'TezosExtractor'),
+    'Monacoin': ('utils.cryptos.other_cryptos', 'MonacoinExtractor'),
+    'Vertcoin': ('utils.cryptos.other_cryptos', 'VertcoinExtractor'),
+    'Syscoin': ('utils.cryptos.other_cryptos', 'SyscoinExtractor'),
+    'Peercoin': ('utils.cryptos.other_cryptos', 'PeercoinExtractor'),
+    'Primecoin': ('utils.cryptos.other_cryptos', 'PrimecoinExtractor'),
+    'Nexus': ('utils.cryptos.other_cryptos', 'NexusExtractor'),
+    'MD5': ('utils.hashes.md5', 'MD5Extractor'),
+    'SHA1': ('utils.hashes.sha1', 'SHA1Extractor'),
+    'SHA224': ('utils.hashes.sha224', 'SHA224Extractor'),
+    'SHA256': ('utils.hashes.sha256', 'SHA256Extractor'),
+    'SHA384': ('utils.hashes.sha384', 'SHA384Extractor'),
+    'SHA512': ('utils.hashes.sha512', 'SHA512Extractor'),
+    'BLAKE2b': ('utils.hashes.blake2b', 'BLAKE2bExtractor'),
+    'BLAKE2s': ('utils.hashes.blake2s', 'BLAKE2sExtractor'),
+    'BLAKE3': ('utils.hashes.blake3', 'BLAKE3Extractor'),
+    'Bcrypt': ('utils.passwords.bcrypt', 'BcryptExtractor'),
+    'Argon2': ('utils.passwords.argon2', 'Argon2Extractor'),
+    'SHA256Crypt': ('utils.passwords.sha_crypt', 'SHA256CryptExtractor'),
+    'SHA512Crypt': ('utils.passwords.sha_crypt', 'SHA512CryptExtractor'),
+    'Scrypt': ('utils.passwords.scrypt', 'ScryptExtractor'),
+    'PBKDF2': ('utils.passwords.pbkdf2', 'PBKDF2Extractor'),
+}
+
+CRYPTO_TYPES = ('Bitcoin', 'BitcoinCash', 'BitcoinSV', 'BitcoinGold', 'Namecoin', 'EthereumEcosystem',
+                'Monero', 'Zcash', 'Dash', 'Verge', 'Litecoin', 'Dogecoin', 'DigiByte', 'Feathercoin',
+                'Ripple', 'Stellar', 'Cardano', 'Tezos', 'Monacoin', 'Vertcoin', 'Syscoin', 'Peercoin',
+                'Primecoin', 'Nexus')
+HEX_HASH_TYPES = ('MD5', 'SHA1', 'SHA224', 'SHA256', 'SHA384', 'SHA512', 'BLAKE2b', 'BLAKE2s', 'BLAKE3')
+PASSWORD_HASH_TYPES = ('Bcrypt', 'Argon2', 'SHA256Crypt', 'SHA512Crypt', 'Scrypt', 'PBKDF2')
+
+class ExtractorRegistry:
+    
+
+    def __init__(self, extractors: Dict[str, Tuple[str, str]] = EXTRACTORS):
+        self.extractors = dict(extractors)
+        self._classes: Dict[str, type] = {}
+        self._lock = threading.Lock()
+
+    def load(self, name: str) -> type:
+        
+        cls = self._classes.get(name)
+        if cls is None:
+            try:
+                module, attribute = self.extractors[name]
+            except KeyError:
+                raise ValueError(f"Unknown extractor type: {name}") from None
+            cls = getattr(importlib.import_module(module), attribute)
+            with self._lock:
+                self._classes[name] = cls
+        return cls
+
+    def create(self, name: str, flags: int = 0, **options):
+        return self.load(name)(flags, **options)
+
+    def reinit_lock(self) -> None:
+        self._lock = threading.Lock()
+
+registry = ExtractorRegistry()
@@ -0,0 +1,70 @@
+from typing import List, Tuple
+
+DIGITS = b'0123456789'
+HEX_DIGITS = DIGITS + b'abcdefABCDEF'
+WORD = DIGITS + b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_'
+SEPARATORS = b'-./ '
+# The buffer is classified this many bytes at a time, which bounds the
+# copies made of a multi-GB mmap.
+CHUNK = 1 << 24
+
+def byte_marks(members: bytes) -> bytes:
+
+    return bytes(1 if byte in members else 0 for byte in range(256))
+
+class RunFinder:
+
+
+    def __init__(self, members: bytes, min_length: int, max_length: int = 0,
+                 counted: bytes = b'', min_counted: int = 0):
+
+        # Maximal runs of member bytes, of min_length to max_length (if set)
+        # bytes and with at least min_counted bytes from counted.
+        self.marks = byte_marks(members)
+        self.counted_marks = byte_marks(counted)
+        self.min_length = max(min_length, 1)
+        self.max_length = max_length
+        self.min_counted = min_counted
+
+    def find(self, data) -> List[Tuple[int, int]]:
+
+        # Each chunk is translated to 1 for members and 0 for the rest, and
+        # bytes.find jumps from one run of at least min_length ones to the
+        # next, so short runs cost no Python work at all. A run still open at
+        # the end of a chunk is carried into the next one.
+        needle = b'\x01' * self.min_length
+        runs: List[Tuple[int, int]] = []
+        open_start = -1
+        open_counted = 0
+        for offset in range(0, len(data), CHUNK):
+            chunk = bytes(data[offset:offset + CHUNK])
+            marks = chunk.translate(self.marks)
+            counts = chunk.translate(self.counted_marks) if self.min_counted else b''
+            position = 0
+            if open_start >= 0:
+                position = marks.find(0)
+                if position < 0:
+                    open_counted += counts.count(1)
+                    continue
+                self._keep(open_start, offset + position, open_counted + counts.count(1, 0, position), runs)
+                open_start = -1
+            tail = marks.rfind(0) + 1
+            start = marks.find(needle, position, tail)
+            while start >= 0:
+                end = marks.find(0, start)
+                self._keep(offset + start, offset + end, counts.count(1, start, end), runs)
+                start = marks.find(needle, end, tail)
+            if tail < len(marks):
+                open_start = offset + tail
+                open_counted = counts.count(1, tail)
+        if open_start >= 0:
+            self._keep(open_start, len(data), open_counted, runs)
+        return runs
+
+    def _keep(self, start: int, end: int, counted: int, runs: List[Tuple[int, int]]) -> None:
+
+        if end - start < self.min_length or (self.max_length and end - start > self.max_length):
+            return
+        if counted < self.min_counted:
+            return
+        runs.append((start, end))
@@ -0,0 +1,57 @@
+import re
+from typing import Dict, List
+
+TOKEN_CHARS = r'\w.%+\-@|:/$'
+TOKEN_SPECIALS = r'.%+\-@|:/$'
+
+FUSED_FAMILIES = ('email', 'crypto', 'hashes', 'ip', 'domain', 'mac')
+
+class FusedScanner:
+
+
+    def __init__(self, flags: int = 0):
+        # Every non-whitespace pattern in utils/ is built from word characters and
+        # these specials, so each of its matches lies inside one maximal token.
+        # Plain words shorter than the shortest crypto/hash candidate can
+        # never match and are skipped by the scan itself. Digit-only shapes
+        # (cards, SSNs, IPv4) come from the numeric tokenizer instead.
+        self.token_pattern = re.compile(
+            rf'(?<![{TOKEN_CHARS}])'
+            rf'(?:[{TOKEN_CHARS}]*[{TOKEN_SPECIALS}][{TOKEN_CHARS}]*|\w{{23,}})'
+            rf'(?![{TOKEN_CHARS}])',
+            flags
+        )
+        self.separator = '\n'
+
+    def route(self, text: str) -> Dict[str, List[str]]:
+
+        routed = {family: [] for family in FUSED_FAMILIES}
+        email, crypto, hashes = routed['email'], routed['crypto'], routed['hashes']
+        ip, domain, mac = routed['ip'], routed['domain'], routed['mac']
+
+        for token in self.token_pattern.findall(text):
+            length = len(token)
+            has_dot = '.' in token
+            has_colon = ':' in token
+            has_dash = '-' in token
+
+            # Domains inside '@' tokens are found by the email family, which
+            # hands its matches on to the domain stage.
+            if '@' in token:
+                email.append(token)
+            elif has_dot and length >= 4:
+                domain.append(token)
+            if has_colon:
+                ip.append(token)
+            if length >= 17 and (has_colon or has_dash):
+                mac.append(token)
+            if length >= 23 or has_dash:
+                crypto.append(token)
+            if length >= 32:
+                hashes.append(token)
+
+        return routed
+
+    def join(self, tokens: List[str]) -> str:
+
+        return self.separator.join(tokens)
@@ -1,5 +1,7 @@
-import re
-from typing import List
+from typing import Iterator, List, Optional, Tuple
+from utils.matches import with_context
+from utils.numeric import DigitChain, NumericShape, NumericTokenizer
+from utils.prefilter import Prefilter
 
 class SSNValidator:
     
@@ -25,21 +27,23 @@ class SSNValidator:
 class SSNExtractor:
     
 
-    def __init__(self):
+    def __init__(self, flags: int = 0):
         
-        self.pattern = re.compile(
-            r'\b(\d{3})-(\d{2})-(\d{4})\b'
-        )
+        self.tokenizer = NumericTokenizer(flags)
+        self.shape = NumericShape(((3, 3), (2, 2), (4, 4)), '--')
+        self.prefilter = Prefilter(literals=('-',), min_digits=9)
 
-    def extract_ssns(self, text: str) -> List[str]:
+    def extract_ssns(self, text: str, chains: Optional[List[DigitChain]] = None) -> List[str]:
         
-        matches = self.pattern.findall(text)
-        validated = []
-        for match in matches:
-            area, group, serial = match
+        return [ssn for _, _, ssn in self.iter_spans(text, chains)]
+
+    def iter_spans(self, text: str, chains: Optional[List[DigitChain]] = None) -> Iterator[Tuple[int, int, str]]:
+
+        if chains is None:
+            chains = self.tokenizer.tokenize(text)
+        for start, end, (area, group, serial) in self.tokenizer.iter_sequences(chains, self.shape):
             if self._validate_ssn(area, group, serial):
-                validated.append(f"{area}-{group}-{serial}")
-        return validated
+                yield start, end, f"{area}-{group}-{serial}"
 
     def _validate_ssn(self, area: str, group: str, serial: str) -> bool:
         
@@ -67,15 +71,4 @@ class SSNExtractor:
 
     def extract_ssns_with_context(self, text: str) -> List[dict]:
         
-        results = []
-        for match in self.pattern.finditer(text):
-            area, group, serial = match.groups()
-            if self._validate_ssn(area, group, serial):
-                start = max(0, match.start() - 30)
-                end = min(len(text), match.end() + 30)
-                context = text[start:end]
-                results.append({
-                    'ssn': f"{area}-{group}-{serial}",
-                    'context': context
-                })
-        return results
\ No newline at end of file
+        return with_context(text, self.iter_spans(text), 'ssn', 30)
@@ -0,0 +1,13 @@
+# How much of an address is checked: only its pattern and length (shape),
+# also its alphabet (charset), or also its embedded checksum and version
+# bytes (checksum). Each level includes the ones before it.
+SHAPE = 'shape'
+CHARSET = 'charset'
+CHECKSUM = 'checksum'
+VALIDATION_LEVELS = (SHAPE, CHARSET, CHECKSUM)
+
+def check_validation_level(level: str) -> str:
+
+    if level not in VALIDATION_LEVELS:
+        raise ValueError(f"Unknown validation level: {level} (expected any of {', '.join(VALIDATION_LEVELS)})")
+    return level